@@ -1,7 +1,15 @@
 """csvnorm - Validate and normalize CSV files."""
 
-from csvnorm.core import process_csv
+from csvnorm.core import process_csv, read_arrow
 from csvnorm.encoding import detect_encoding
-from csvnorm.validation import normalize_csv
+from csvnorm.session import CsvnormSession
+from csvnorm.validation import normalize_csv, normalize_to_arrow
 
-__all__ = ["normalize_csv", "detect_encoding", "process_csv"]
+__all__ = [
+    "normalize_csv",
+    "normalize_to_arrow",
+    "detect_encoding",
+    "process_csv",
+    "read_arrow",
+    "CsvnormSession",
+]
@@ -0,0 +1,208 @@
+"""Persistent cache of per-file detection results."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, TypedDict, Union
+
+from csvnorm.session import ConfigDict, Dialect
+
+logger = logging.getLogger("csvnorm")
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = "CSVNORM_CACHE_DIR"
+
+# Bytes hashed from the head of a file as part of its fingerprint
+CACHE_HEAD_BYTES = 64 * 1024
+
+# Entries kept; the least recently used are evicted beyond this
+CACHE_MAX_ENTRIES = 10000
+
+CACHE_FILE_NAME = "cache.sqlite3"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        head_hash TEXT NOT NULL,
+        encoding TEXT NOT NULL,
+        mojibake INTEGER,
+        fallback_config TEXT,
+        dialect TEXT,
+        columns TEXT NOT NULL,
+        last_used REAL NOT NULL
+    )
+"""
+
+
+class CacheEntry(TypedDict):
+    """Detection results stored for one input file.
+
+    ``mojibake`` is None when the run that stored the entry did not check
+    for mojibake. ``dialect`` is None when DuckDB sniffed the whole file.
+    """
+
+    encoding: str
+    mojibake: Optional[bool]
+    fallback_config: Optional[ConfigDict]
+    dialect: Optional[Dialect]
+    columns: list[str]
+
+
+def default_cache_dir() -> Path:
+    """Return CSVNORM_CACHE_DIR, else $XDG_CACHE_HOME/csvnorm or ~/.cache/csvnorm."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "csvnorm"
+
+
+def file_fingerprint(file_path: Path) -> tuple[str, int, int, str]:
+    """Return (resolved path, size, mtime_ns, head hash) for a local file.
+
+    Only the first CACHE_HEAD_BYTES are hashed, so a change further down
+    that keeps size and mtime is not noticed.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    resolved = file_path.resolve()
+    st = resolved.stat()
+    with open(resolved, "rb") as f:
+        head_hash = hashlib.blake2b(f.read(CACHE_HEAD_BYTES), digest_size=16)
+    return str(resolved), st.st_size, st.st_mtime_ns, head_hash.hexdigest()
+
+
+class DetectionCache:
+    """SQLite cache of encoding, mojibake and dialect results per file.
+
+    Entries are keyed by resolved path and are only returned while size,
+    mtime and the hash of the head bytes still match. Every hit refreshes
+    the entry's last-use time; ``put`` evicts the least recently used
+    entries beyond ``max_entries``. Cache errors are logged and treated as
+    misses, so a broken or locked cache never fails a run.
+
+    Args:
+        cache_dir: Directory holding the cache database (default:
+            default_cache_dir()).
+        max_entries: Entries kept before LRU eviction.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open (and create) the database on first use, None on failure."""
+        if self._conn is None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.cache_dir / CACHE_FILE_NAME, timeout=5)
+                conn.execute(_SCHEMA)
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"Detection cache unavailable: {e}")
+                return None
+            self._conn = conn
+        return self._conn
+
+    def get(self, file_path: Path) -> Optional[CacheEntry]:
+        """Return the cached entry for file_path if the file is unchanged."""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            path, size, mtime_ns, head_hash = file_fingerprint(file_path)
+            row = conn.execute(
+                "SELECT size, mtime_ns, head_hash, encoding, mojibake, "
+                "fallback_config, dialect, columns FROM entries WHERE path = ?",
+                (path,),
+            ).fetchone()
+            if row is None or tuple(row[:3]) != (size, mtime_ns, head_hash):
+                logger.debug(f"Detection cache miss: {path}")
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE entries SET last_used = ? WHERE path = ?",
+                    (time.time(), path),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Detection cache lookup failed: {e}")
+            return None
+
+        encoding, mojibake, config_json, dialect_json, columns_json = row[3:]
+        # Older entries stored the dialect as a tuple (a JSON list)
+        dialect: Optional[Dialect] = None
+        if dialect_json and dialect_json.startswith("{"):
+            dialect = json.loads(dialect_json)
+        logger.debug(f"Detection cache hit: {path}")
+        return CacheEntry(
+            encoding=encoding,
+            mojibake=None if mojibake is None else bool(mojibake),
+            fallback_config=json.loads(config_json) if config_json else None,
+            dialect=dialect,
+            columns=json.loads(columns_json),
+        )
+
+    def put(self, file_path: Path, entry: CacheEntry) -> None:
+        """Store entry for file_path and evict least recently used entries."""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            path, size, mtime_ns, head_hash = file_fingerprint(file_path)
+            mojibake = entry["mojibake"]
+            config = entry["fallback_config"]
+            dialect = entry["dialect"]
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        path,
+                        size,
+                        mtime_ns,
+                        head_hash,
+                        entry["encoding"],
+                        None if mojibake is None else int(mojibake),
+                        None if config is None else json.dumps(config),
+                        None if dialect is None else json.dumps(dialect),
+                        json.dumps(entry["columns"]),
+                        time.time(),
+                    ),
+                )
+                conn.execute(
+                    "DELETE FROM entries WHERE path NOT IN ("
+                    "SELECT path FROM entries ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Detection cache store failed: {e}")
+
+    def close(self) -> None:
+        """Close the cache database, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "DetectionCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -12,6 +12,7 @@ from importlib.metadata import version
 from csvnorm.core import process_csv
 from csvnorm.mojibake import DEFAULT_MOJIBAKE_SAMPLE
 from csvnorm.utils import setup_logger
+from csvnorm.validation import DEFAULT_PARQUET_CODEC, OUTPUT_FORMATS, PARQUET_CODECS
 
 console = Console()
 
@@ -131,6 +132,54 @@ def create_parser() -> argparse.ArgumentParser:
         help="Write to file instead of stdout (default: stdout)",
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Stream normalized CSV to stdout while DuckDB scans the input "
+            "(no temp output file, first bytes arrive immediately). "
+            "Skips the summary table; cannot be used with -o, --check or --strict."
+        ),
+    )
+
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help=(
+            "Output file format (default: csv). parquet is written by the same "
+            "DuckDB scan that normalizes the input; arrow (IPC stream) and "
+            "feather (IPC file) from its Arrow batches and need pyarrow "
+            "(pip install 'csvnorm[arrow]'). Formats other than csv need -o."
+        ),
+    )
+
+    parser.add_argument(
+        "--parquet-compression",
+        choices=PARQUET_CODECS,
+        default=DEFAULT_PARQUET_CODEC,
+        metavar="CODEC",
+        help=(
+            f"Parquet compression codec: {', '.join(PARQUET_CODECS)} "
+            f"(default: {DEFAULT_PARQUET_CODEC})"
+        ),
+    )
+
+    parser.add_argument(
+        "--parquet-compression-level",
+        type=int,
+        metavar="N",
+        help="Parquet compression level (zstd only, e.g. 1-22)",
+    )
+
+    parser.add_argument(
+        "--parquet-row-group-size",
+        type=int,
+        metavar="N",
+        help="Rows per Parquet row group (default: DuckDB's 122880)",
+    )
+
     parser.add_argument(
         "--fix-mojibake",
         nargs="?",
@@ -138,11 +187,131 @@ def create_parser() -> argparse.ArgumentParser:
         type=int,
         help=(
             "Fix mojibake using ftfy. Optionally pass sample size "
-            "(chars to sample, default 5000). Use 0 to force repair "
+            "(bytes per window, 8 windows spread across the file, default 5000). "
+            "Use 0 to force repair "
             "without detection. Example: --fix-mojibake 4000 or --fix-mojibake 0."
         ),
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Worker processes for --fix-mojibake repair (default: 1; "
+            "0 uses all CPUs). Output is identical to the serial repair."
+        ),
+    )
+
+    parser.add_argument(
+        "--encoding",
+        help=(
+            "Input encoding to use instead of auto-detection "
+            "(e.g., latin-1, cp1252). Skips encoding detection entirely."
+        ),
+    )
+
+    parser.add_argument(
+        "--encoding-sample-bytes",
+        type=int,
+        metavar="N",
+        help=(
+            "Detect encoding from an N-byte sample (head, middle and tail of the "
+            "file) instead of the whole file. Faster on large files. "
+            "Example: --encoding-sample-bytes 1048576"
+        ),
+    )
+
+    parser.add_argument(
+        "--threads",
+        type=int,
+        metavar="N",
+        help=(
+            "DuckDB worker threads (default: all cores). "
+            "Env: CSVNORM_THREADS"
+        ),
+    )
+
+    parser.add_argument(
+        "--memory-limit",
+        metavar="SIZE",
+        help=(
+            "DuckDB memory limit, e.g. 2GB or 512MB (default: 80%% of RAM). "
+            "Env: CSVNORM_MEMORY_LIMIT"
+        ),
+    )
+
+    parser.add_argument(
+        "--temp-directory",
+        type=Path,
+        metavar="DIR",
+        help=(
+            "Directory where DuckDB spills data that does not fit in memory "
+            "(default: .tmp in the current directory). Env: CSVNORM_TEMP_DIRECTORY"
+        ),
+    )
+
+    parser.add_argument(
+        "--preserve-insertion-order",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Keep input row order in the output (default: on). "
+            "Turning it off lets DuckDB use less memory. "
+            "Env: CSVNORM_PRESERVE_INSERTION_ORDER"
+        ),
+    )
+
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help=(
+            "Do not keep input row order in the output "
+            "(same as --no-preserve-insertion-order). Lets DuckDB parallelize "
+            "writing; use when row order does not matter."
+        ),
+    )
+
+    parser.add_argument(
+        "--per-thread-output",
+        action="store_true",
+        help=(
+            "Write -o as a directory of part files (data_0.csv, data_1.csv, ...), "
+            "one per DuckDB thread. Implies --unordered."
+        ),
+    )
+
+    parser.add_argument(
+        "--pipe",
+        action="store_true",
+        help=(
+            "Stream transcoding or mojibake repair into DuckDB through a named "
+            "pipe instead of a temp file (falls back to the temp file when the "
+            "input must be read more than once)"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Do not read or write the detection cache (encoding, mojibake and "
+            "dialect of unchanged local files are reused from it by default)"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help=(
+            "Directory of the detection cache (default: ~/.cache/csvnorm). "
+            "Env: CSVNORM_CACHE_DIR"
+        ),
+    )
+
     parser.add_argument(
         "--download-remote",
         action="store_true",
@@ -258,6 +427,23 @@ def main(argv: Optional[list[str]] = None) -> int:
         download_remote=args.download_remote,
         strict=args.strict,
         check_only=args.check,
+        encoding=args.encoding,
+        encoding_sample_bytes=args.encoding_sample_bytes,
+        jobs=args.jobs,
+        stream=args.stream,
+        threads=args.threads,
+        memory_limit=args.memory_limit,
+        temp_directory=args.temp_directory,
+        preserve_insertion_order=args.preserve_insertion_order,
+        unordered=args.unordered,
+        per_thread_output=args.per_thread_output,
+        no_cache=args.no_cache,
+        cache_dir=args.cache_dir,
+        pipe=args.pipe,
+        output_format=args.output_format,
+        parquet_codec=args.parquet_compression,
+        parquet_compression_level=args.parquet_compression_level,
+        parquet_row_group_size=args.parquet_row_group_size,
     )
 
 
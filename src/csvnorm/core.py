@@ -1,7 +1,10 @@
 """Core processing logic for csvnorm."""
 
+import codecs
 import logging
+import os
 import shutil
+import stat
 import sys
 import tempfile
 import urllib.error
@@ -14,8 +17,17 @@ import duckdb
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TaskID
 
-from csvnorm.encoding import convert_to_utf8, detect_encoding, needs_conversion
-from csvnorm.mojibake import repair_file
+from csvnorm.cache import CacheEntry, DetectionCache
+from csvnorm.encoding import (
+    convert_to_utf8,
+    detect_encoding,
+    duckdb_encoding,
+    needs_conversion,
+    normalize_encoding_name,
+)
+from csvnorm.mojibake import needs_repair, repair_file, repair_stream
+from csvnorm.pipeline import FifoStage, fifo_supported
+from csvnorm.session import ConfigDict, CsvnormSession, Dialect
 from csvnorm.ui import (
     show_error_panel,
     show_success_table,
@@ -24,8 +36,6 @@ from csvnorm.ui import (
 )
 from csvnorm.utils import (
     download_url_to_file,
-    get_column_count,
-    get_row_count,
     is_gzip_path,
     is_url,
     is_zip_file,
@@ -34,11 +44,38 @@ from csvnorm.utils import (
     validate_delimiter,
     validate_url,
 )
-from csvnorm.validation import normalize_csv, validate_csv
+from csvnorm.validation import (
+    ARROW_FORMATS,
+    DEFAULT_PARQUET_CODEC,
+    OUTPUT_FORMATS,
+    PARQUET_CODECS,
+    OutputStats,
+    ParquetOptions,
+    RejectStats,
+    _import_pyarrow,
+    normalize_to_arrow,
+    validate_and_normalize_csv,
+    validate_csv,
+)
 
 logger = logging.getLogger("csvnorm")
 console = Console()
 
+# Buffer size for streaming the normalized output to stdout
+STDOUT_COPY_BUFFER = 1024 * 1024
+
+# Chunk size for spooling stdin to a temp file (keeps RSS constant)
+STDIN_SPOOL_CHUNK = 1024 * 1024
+
+# Path DuckDB writes to when streaming output directly (--stream)
+STDOUT_STREAM_PATH = Path("/dev/stdout")
+
+# Error panel titles for pre-processing stages streamed into DuckDB (--pipe)
+STAGE_ERROR_TITLES = {
+    "transcode": "Encoding conversion failed",
+    "mojibake": "Mojibake repair failed",
+}
+
 
 def _resolve_input_path(
     input_file: str, output_file: Optional[Path]
@@ -78,6 +115,16 @@ def _resolve_input_path(
     return file_path, False
 
 
+def _spool_stdin(target: Path) -> None:
+    """Copy binary stdin to target in bounded chunks.
+
+    Encoding detection, mojibake sampling and DuckDB sniffing all need
+    random access, so stdin is spooled to disk, but never held in memory.
+    """
+    with open(target, "wb") as f:
+        shutil.copyfileobj(sys.stdin.buffer, f, STDIN_SPOOL_CHUNK)
+
+
 def _setup_output_paths(
     output_file: Optional[Path],
     force: bool,
@@ -164,17 +211,74 @@ def _handle_local_encoding(
     progress: Progress,
     task: TaskID,
     temp_files: list[Path],
-) -> tuple[Union[str, Path], str]:
-    """Detect encoding and convert to UTF-8 if needed."""
-    progress.update(task, description="[cyan]Detecting encoding...")
-    encoding = detect_encoding(file_input_path)
-    logger.debug(f"Detected encoding: {encoding}")
-    progress.update(
-        task, description=f"[green]✓[/green] Detected encoding: {encoding}"
-    )
+    encoding_override: Optional[str] = None,
+    encoding_sample_bytes: Optional[int] = None,
+    cached_encoding: Optional[str] = None,
+    allow_native: bool = True,
+    stages: Optional[list[FifoStage]] = None,
+) -> tuple[Union[str, Path], str, Optional[str]]:
+    """Detect encoding (unless overridden or cached) and convert to UTF-8 if needed.
+
+    Encodings DuckDB decodes itself (latin-1, UTF-16 LE) are not converted
+    when ``allow_native``; the read_csv encoding is returned instead, else
+    None. Other codecs go through the Python transcoder; with ``stages``
+    the conversion is not run but appended as a FifoStage producing the
+    returned working file.
+    """
+    if encoding_override:
+        encoding = normalize_encoding_name(encoding_override)
+        try:
+            codecs.lookup(encoding)
+        except LookupError as e:
+            raise LookupError(f"Unknown encoding: {encoding_override}") from e
+        logger.debug(f"Using encoding override: {encoding}")
+        progress.update(
+            task, description=f"[green]✓[/green] Encoding: {encoding} (user override)"
+        )
+    elif cached_encoding:
+        encoding = cached_encoding
+        logger.debug(f"Using cached encoding: {encoding}")
+        progress.update(
+            task, description=f"[green]✓[/green] Encoding: {encoding} (cached)"
+        )
+    else:
+        progress.update(task, description="[cyan]Detecting encoding...")
+        encoding = detect_encoding(file_input_path, encoding_sample_bytes)
+        logger.debug(f"Detected encoding: {encoding}")
+        progress.update(
+            task, description=f"[green]✓[/green] Detected encoding: {encoding}"
+        )
 
     working_file: Union[str, Path] = file_input_path
-    if needs_conversion(encoding):
+    read_encoding = (
+        duckdb_encoding(file_input_path, encoding)
+        if allow_native and needs_conversion(encoding)
+        else None
+    )
+    if read_encoding:
+        logger.debug(f"DuckDB decodes {encoding} natively (encoding='{read_encoding}')")
+        progress.update(
+            task,
+            description=f"[green]✓[/green] Encoding: {encoding} (decoded by DuckDB)",
+        )
+    elif needs_conversion(encoding) and stages is not None:
+        source_encoding = encoding
+        stages.append(
+            FifoStage(
+                "transcode",
+                lambda path: convert_to_utf8(file_input_path, path, source_encoding),
+                temp_utf8_file,
+                source=file_input_path,
+                source_encoding=source_encoding,
+            )
+        )
+        working_file = temp_utf8_file
+        temp_files.append(temp_utf8_file)
+        progress.update(
+            task,
+            description=f"[green]✓[/green] Encoding: {encoding} (piped to DuckDB)",
+        )
+    elif needs_conversion(encoding):
         progress.update(
             task,
             description=f"[cyan]Converting from {encoding} to UTF-8...",
@@ -194,7 +298,7 @@ def _handle_local_encoding(
             description=f"[green]✓[/green] Encoding: {encoding} ({note})",
         )
 
-    return working_file, encoding
+    return working_file, encoding, read_encoding
 
 
 def _handle_mojibake_if_needed(
@@ -204,8 +308,14 @@ def _handle_mojibake_if_needed(
     progress: Progress,
     task: TaskID,
     temp_files: list[Path],
+    jobs: int = 1,
+    stages: Optional[list[FifoStage]] = None,
 ) -> tuple[bool, Union[str, Path]]:
-    """Optionally repair mojibake in local files."""
+    """Optionally repair mojibake in local files.
+
+    With ``stages`` only detection runs here; a needed repair is appended
+    as a FifoStage producing the returned working file.
+    """
     if fix_mojibake_sample is None:
         return False, working_file
 
@@ -216,8 +326,27 @@ def _handle_mojibake_if_needed(
     progress.update(task, description="[cyan]Checking mojibake...")
     sample_size = fix_mojibake_sample
     repaired_path = temp_dir / "mojibake_fixed.csv"
+    if stages is not None:
+        if not needs_repair(working_file, sample_size):
+            progress.update(task, description="[green]✓[/green] Mojibake check: clean")
+            return False, working_file
+        source = working_file
+        stages.append(
+            FifoStage(
+                "mojibake",
+                lambda path: repair_stream(source, path, jobs=jobs),
+                repaired_path,
+                source=source,
+            )
+        )
+        temp_files.append(repaired_path)
+        progress.update(
+            task, description="[green]✓[/green] Mojibake repair (ftfy) piped to DuckDB"
+        )
+        return True, repaired_path
+
     mojibake_repaired, working_file = repair_file(
-        working_file, repaired_path, sample_size
+        working_file, repaired_path, sample_size, jobs=jobs
     )
     if mojibake_repaired:
         temp_files.append(repaired_path)
@@ -238,19 +367,70 @@ def _validate_csv_with_http_handling(
     input_file: str,
     progress: Progress,
     task: TaskID,
-) -> tuple[int, list[str], Optional[dict[str, Union[str, int]]]]:
-    """Run validation with HTTP error handling."""
-    progress.update(task, description="[cyan]Validating CSV...")
-    logger.debug("Validating CSV with DuckDB...")
-
+    output_file: Optional[Path] = None,
+    delimiter: str = ",",
+    keep_names: bool = False,
+    session: Optional[CsvnormSession] = None,
+    per_thread_output: bool = False,
+    known_dialect: Optional[tuple[Optional[ConfigDict], Dialect]] = None,
+    read_encoding: Optional[str] = None,
+    stage: Optional[FifoStage] = None,
+    output_format: str = "csv",
+    parquet: Optional[ParquetOptions] = None,
+) -> tuple[RejectStats, Optional[ConfigDict], Optional[OutputStats]]:
+    """Run validation with HTTP error handling.
+
+    When output_file is given, validation and normalization run as a single
+    fused scan that also writes the normalized output and reports its row
+    and column counts. Output stats are None when only validating.
+    known_dialect (e.g. from the detection cache) is tried before sniffing.
+    read_encoding is passed to read_csv for inputs DuckDB decodes itself.
+    output_format and parquet select the normalized output format. A pending pre-processing stage that fails shows its error panel and
+    re-raises (OSError or ValueError).
+    """
     try:
-        return validate_csv(
-            working_file, reject_file, is_remote=is_remote, skip_rows=skip_rows
+        if output_file is None:
+            progress.update(task, description="[cyan]Validating CSV...")
+            logger.debug("Validating CSV with DuckDB...")
+            reject_stats, fallback_config = validate_csv(
+                working_file, reject_file, is_remote=is_remote, skip_rows=skip_rows,
+                session=session, known_dialect=known_dialect, encoding=read_encoding,
+                stage=stage,
+            )
+            return reject_stats, fallback_config, None
+
+        progress.update(task, description="[cyan]Validating and normalizing CSV...")
+        logger.debug("Validating and normalizing CSV with DuckDB (single pass)...")
+        return validate_and_normalize_csv(
+            working_file,
+            output_file,
+            reject_file,
+            delimiter=delimiter,
+            normalize_names=not keep_names,
+            is_remote=is_remote,
+            skip_rows=skip_rows,
+            session=session,
+            per_thread_output=per_thread_output,
+            known_dialect=known_dialect,
+            encoding=read_encoding,
+            stage=stage,
+            output_format=output_format,
+            parquet=parquet,
         )
+    except (OSError, ValueError) as e:
+        if stage is None:
+            raise
+        progress.stop()
+        show_error_panel(f"{STAGE_ERROR_TITLES[stage.name]}\n{e}")
+        raise
     except duckdb.Error as e:
         progress.stop()
         error_msg = str(e)
 
+        if "broken pipe" in error_msg.lower():
+            # Streaming reader went away (e.g. | head): not a CSV problem
+            raise
+
         if "zipfs" in error_msg.lower():
             show_error_panel(
                 "Failed to load DuckDB zipfs extension for zip input\n\n"
@@ -304,40 +484,75 @@ def _validate_csv_with_http_handling(
         raise
 
 
-def _normalize_and_refresh_errors(
-    working_file: Union[str, Path],
-    actual_output_file: Path,
-    delimiter: str,
-    keep_names: bool,
-    is_remote: bool,
-    skip_rows: int,
-    fallback_config: Optional[dict[str, Union[str, int]]],
-    reject_file: Path,
-    reject_count: int,
-    error_types: list[str],
-) -> tuple[Optional[dict[str, Union[str, int]]], int, list[str], bool]:
-    """Normalize CSV and update reject counts if fallback differs."""
-    used_fallback = normalize_csv(
-        input_path=working_file,
-        output_path=actual_output_file,
-        delimiter=delimiter,
-        normalize_names=not keep_names,
-        is_remote=is_remote,
-        skip_rows=skip_rows,
-        fallback_config=fallback_config,
-        reject_file=reject_file,
-    )
+def _stream_file_to_stdout(file_path: Path) -> None:
+    """Copy a file to stdout without loading it into memory.
 
-    has_validation_errors = reject_count > 1
-    if used_fallback and used_fallback != fallback_config:
-        reject_count = sum(1 for _ in open(reject_file)) if reject_file.exists() else 0
-        has_validation_errors = reject_count > 1
-        if has_validation_errors:
-            from csvnorm.validation import _get_error_types
+    Uses os.sendfile when stdout is a real file descriptor, otherwise
+    shutil.copyfileobj with a large buffer.
+
+    Raises:
+        BrokenPipeError: If the reader closes the pipe early.
+    """
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Text-only stream (e.g. replaced sys.stdout): copy as text
+        with open(file_path, "r") as f:
+            shutil.copyfileobj(f, sys.stdout, STDOUT_COPY_BUFFER)
+        return
+
+    out.flush()
+    try:
+        out_fd: Optional[int] = out.fileno()
+    except (OSError, ValueError):
+        out_fd = None
+
+    with open(file_path, "rb") as f:
+        if out_fd is not None and hasattr(os, "sendfile"):
+            size = os.fstat(f.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except BrokenPipeError:
+                raise
+            except OSError as e:
+                if offset:
+                    raise
+                # sendfile unsupported for this pair of descriptors
+                logger.debug(f"sendfile unavailable ({e}); using buffered copy")
+        shutil.copyfileobj(f, out, STDOUT_COPY_BUFFER)
+        out.flush()
+
+
+def _can_stream_to_stdout() -> bool:
+    """Return True if DuckDB can write straight to stdout.
 
-            error_types = _get_error_types(reject_file)
+    Only pipes and terminals qualify: reopening /dev/stdout on a redirected
+    regular file would truncate it (breaking ``>>``), so those keep the temp
+    file path.
+    """
+    if not STDOUT_STREAM_PATH.exists():
+        return False
+    try:
+        mode = os.fstat(sys.stdout.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISCHR(mode)
 
-    return used_fallback, reject_count, error_types, has_validation_errors
+
+def _silence_stdout_after_broken_pipe() -> None:
+    """Point stdout at devnull so interpreter shutdown does not re-raise EPIPE."""
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    except (OSError, ValueError):
+        pass
 
 
 def _emit_stdout_output(
@@ -349,9 +564,9 @@ def _emit_stdout_output(
 ) -> int:
     """Write output to stdout and emit validation warnings if needed."""
     try:
-        with open(actual_output_file, "r") as f:
-            sys.stdout.write(f.read())
+        _stream_file_to_stdout(actual_output_file)
     except BrokenPipeError:
+        _silence_stdout_after_broken_pipe()
         return 0
 
     if summary:
@@ -370,6 +585,7 @@ def _emit_stdout_output(
             keep_names=summary["keep_names"],
             output_display=summary["output_display"],
             out_console=stderr_console,
+            decoded_by_duckdb=summary["decoded_by_duckdb"],
         )
 
     # Return exit code 1 if validation errors occurred (warning already shown before output)
@@ -379,13 +595,11 @@ def _emit_stdout_output(
 def _cleanup_temp_artifacts(
     use_stdout: bool, reject_file: Path, temp_files: list[Path]
 ) -> None:
-    """Cleanup temp files and prune empty reject files."""
-    if use_stdout and reject_file.exists():
-        with open(reject_file, "r") as f:
-            line_count = sum(1 for _ in f)
-        if line_count <= 1:
-            reject_file.unlink()
+    """Cleanup temp files, keeping the reject file if it lives among them.
 
+    Reject files are only written when rows were rejected, so there is no
+    header-only file left to prune here.
+    """
     for temp_path in temp_files:
         if temp_path.exists():
             logger.debug(f"Removing temp path: {temp_path}")
@@ -402,13 +616,6 @@ def _cleanup_temp_artifacts(
             else:
                 temp_path.unlink()
 
-    if not use_stdout and reject_file.exists():
-        with open(reject_file, "r") as f:
-            line_count = sum(1 for _ in f)
-        if line_count <= 1:
-            logger.debug(f"Removing empty reject file: {reject_file}")
-            reject_file.unlink()
-
 
 def _prepare_working_file(
     input_path: Union[str, Path],
@@ -422,19 +629,35 @@ def _prepare_working_file(
     progress: Progress,
     task: TaskID,
     temp_files: list[Path],
-) -> Optional[tuple[Union[str, Path], str, bool]]:
+    encoding_override: Optional[str] = None,
+    encoding_sample_bytes: Optional[int] = None,
+    jobs: int = 1,
+    cached: Optional[CacheEntry] = None,
+    stages: Optional[list[FifoStage]] = None,
+) -> Optional[tuple[Union[str, Path], str, bool, Optional[str]]]:
     """Resolve encoding and apply mojibake repair.
 
+    A cache entry replaces encoding detection and the mojibake check: a
+    file known to be clean is not checked, one known to need repair is
+    repaired without sampling. A latin-1 or UTF-16 file is left for DuckDB
+    to decode unless mojibake repair, which needs UTF-8 text, will run.
+
+    With ``stages`` the last conversion or repair is not run but appended
+    as a FifoStage that produces working_file; a conversion followed by a
+    repair still writes its temp file, since repair needs random access.
+
     Returns:
-        Tuple of (working_file, encoding, mojibake_repaired) on success,
-        None on error (error panel already shown).
+        Tuple of (working_file, encoding, mojibake_repaired, read_encoding)
+        on success, where read_encoding is the read_csv encoding for a file
+        DuckDB decodes itself (else None); None on error (error panel
+        already shown).
     """
     if is_remote:
         progress.update(
             task,
             description="[green]✓[/green] Remote URL (encoding handled by DuckDB)",
         )
-        return input_path, "remote", False
+        return input_path, "remote", False, None
 
     if compressed_type:
         progress.update(
@@ -444,14 +667,24 @@ def _prepare_working_file(
                 "(encoding handled by DuckDB)"
             ),
         )
-        return compressed_input_path, compressed_type, False
+        return compressed_input_path, compressed_type, False, None
 
     file_input_path = input_path
     assert isinstance(file_input_path, Path)
 
+    if cached and cached["mojibake"] is not None and fix_mojibake_sample is not None:
+        logger.debug(f"Using cached mojibake result: {cached['mojibake']}")
+        fix_mojibake_sample = 0 if cached["mojibake"] else None
+    repairs_mojibake = fix_mojibake_sample is not None and not check_only
+
     try:
-        working_file, encoding = _handle_local_encoding(
+        working_file, encoding, read_encoding = _handle_local_encoding(
             file_input_path, temp_utf8_file, progress, task, temp_files,
+            encoding_override=encoding_override,
+            encoding_sample_bytes=encoding_sample_bytes,
+            cached_encoding=cached["encoding"] if cached else None,
+            allow_native=not repairs_mojibake,
+            stages=None if repairs_mojibake else stages,
         )
     except ValueError as e:
         progress.stop()
@@ -463,18 +696,18 @@ def _prepare_working_file(
         return None
 
     mojibake_repaired = False
-    if not check_only:
+    if repairs_mojibake:
         try:
             mojibake_repaired, working_file = _handle_mojibake_if_needed(
                 working_file, temp_dir, fix_mojibake_sample,
-                progress, task, temp_files,
+                progress, task, temp_files, jobs=jobs, stages=stages,
             )
         except (OSError, UnicodeDecodeError, ValueError) as e:
             progress.stop()
             show_error_panel(f"Mojibake repair failed\n{e}")
             return None
 
-    return working_file, encoding, mojibake_repaired
+    return working_file, encoding, mojibake_repaired, read_encoding
 
 
 def _handle_post_validation(
@@ -507,7 +740,7 @@ def _handle_post_validation(
         stderr_console = Console(stderr=True)
         if has_validation_errors:
             stderr_console.print(
-                f"[red]✗ Invalid CSV:[/red] {reject_count - 1} rows rejected",
+                f"[red]✗ Invalid CSV:[/red] {reject_count} rows rejected",
                 style="red",
             )
             if error_types:
@@ -531,6 +764,13 @@ def _handle_post_validation(
     return None
 
 
+def _output_size(path: Path) -> int:
+    """Return the size of an output file, or the total of a part-file directory."""
+    if path.is_dir():
+        return sum(part.stat().st_size for part in path.iterdir() if part.is_file())
+    return path.stat().st_size
+
+
 def _compute_and_show_output(
     input_file: str,
     local_input_path: Optional[Path],
@@ -546,9 +786,15 @@ def _compute_and_show_output(
     reject_count: int,
     error_types: list[str],
     reject_file: Path,
+    output_stats: Optional[OutputStats],
+    decoded_by_duckdb: bool = False,
+    output_format: str = "csv",
 ) -> int:
     """Compute statistics and display output for stdout or file mode.
 
+    Row and column counts come from the normalizing COPY (output_stats), so
+    the output is not scanned again just to fill the summary table.
+
     Returns:
         Exit code: 0 for success, 1 for validation errors.
     """
@@ -558,9 +804,9 @@ def _compute_and_show_output(
         input_size = (
             working_file.stat().st_size if isinstance(working_file, Path) else 0
         )
-    output_size = actual_output_file.stat().st_size
-    row_count = get_row_count(actual_output_file)
-    column_count = get_column_count(actual_output_file, delimiter)
+    output_size = _output_size(actual_output_file)
+    row_count = output_stats["row_count"] if output_stats else 0
+    column_count = output_stats["column_count"] if output_stats else 0
 
     if use_stdout:
         summary = {
@@ -576,6 +822,7 @@ def _compute_and_show_output(
             "delimiter": delimiter,
             "keep_names": keep_names,
             "output_display": "stdout",
+            "decoded_by_duckdb": decoded_by_duckdb,
         }
         return _emit_stdout_output(
             actual_output_file,
@@ -597,6 +844,8 @@ def _compute_and_show_output(
         output_size=output_size,
         delimiter=delimiter,
         keep_names=keep_names,
+        decoded_by_duckdb=decoded_by_duckdb,
+        output_format=output_format,
     )
 
     if has_validation_errors:
@@ -618,6 +867,24 @@ def process_csv(
     download_remote: bool = False,
     strict: bool = False,
     check_only: bool = False,
+    encoding: Optional[str] = None,
+    encoding_sample_bytes: Optional[int] = None,
+    jobs: int = 1,
+    stream: bool = False,
+    session: Optional[CsvnormSession] = None,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+    temp_directory: Optional[Path] = None,
+    preserve_insertion_order: Optional[bool] = None,
+    unordered: bool = False,
+    per_thread_output: bool = False,
+    no_cache: bool = False,
+    cache_dir: Optional[Path] = None,
+    pipe: bool = False,
+    output_format: str = "csv",
+    parquet_codec: str = DEFAULT_PARQUET_CODEC,
+    parquet_compression_level: Optional[int] = None,
+    parquet_row_group_size: Optional[int] = None,
 ) -> int:
     """Main CSV processing pipeline.
 
@@ -632,6 +899,44 @@ def process_csv(
         fix_mojibake_sample: Sample size for mojibake detection, None to disable.
         strict: If True, exit with error code 1 if validation errors occur.
         check_only: If True, only validate CSV without processing or normalizing.
+        encoding: Input encoding to use instead of auto-detection.
+        encoding_sample_bytes: Byte budget for sampled encoding detection,
+            None to analyze the whole file.
+        jobs: Worker processes for mojibake repair (0 = all CPUs).
+        stream: If True, DuckDB writes stdout output directly as it scans
+            (no temp output file, no summary table). Falls back to buffered
+            output when stdout is not a pipe or terminal.
+        session: DuckDB session to run on, e.g. to reuse one configured
+            connection across calls. A session is created (and closed) for
+            this call when None.
+        threads: DuckDB worker threads (None: CSVNORM_THREADS or all cores).
+        memory_limit: DuckDB memory limit, e.g. "2GB" (None: CSVNORM_MEMORY_LIMIT
+            or DuckDB's default).
+        temp_directory: Directory for DuckDB spill files (None:
+            CSVNORM_TEMP_DIRECTORY or DuckDB's default).
+        preserve_insertion_order: Keep input row order (None:
+            CSVNORM_PRESERVE_INSERTION_ORDER or true).
+            The four DuckDB settings are ignored when session is given.
+        unordered: If True, row order is not preserved
+            (preserve_insertion_order=false) so DuckDB can write in parallel.
+        per_thread_output: If True, output_file becomes a directory of part
+            files, one per DuckDB thread. Implies unordered; needs output_file.
+        no_cache: If True, do not read or write the detection cache.
+        cache_dir: Detection cache directory (None: CSVNORM_CACHE_DIR or
+            ~/.cache/csvnorm). The cache is used for local files without
+            skip_rows or an encoding override.
+        pipe: If True, the last Python pre-processing stage (transcoding or
+            mojibake repair) streams into DuckDB through a named pipe instead
+            of a temp file, when the dialect is known up front; otherwise it
+            falls back to the temp file.
+        output_format: One of OUTPUT_FORMATS. Parquet is written by the same
+            COPY that normalizes the input; ``arrow`` (IPC stream) and
+            ``feather`` (IPC file) from the same scan's Arrow batches, and
+            need pyarrow. Formats other than ``csv`` need output_file and
+            keep the comma delimiter.
+        parquet_codec: Parquet compression codec (see PARQUET_CODECS).
+        parquet_compression_level: Codec level (zstd only; None: default).
+        parquet_row_group_size: Rows per Parquet row group (None: default).
 
     Returns:
         Exit code: 0 for success, 1 for error.
@@ -643,15 +948,94 @@ def process_csv(
         show_error_panel("--fix-mojibake must be non-negative (use 0 to force repair)")
         return 1
 
+    if jobs < 0:
+        show_error_panel("--jobs must be non-negative (use 0 for all CPUs)")
+        return 1
+
+    if stream and (output_file is not None or check_only or strict):
+        show_error_panel(
+            "--stream only applies to stdout output and cannot be combined "
+            "with -o, --check or --strict"
+        )
+        return 1
+
+    if output_format not in OUTPUT_FORMATS:
+        show_error_panel(f"Unknown output format: {output_format}")
+        return 1
+
+    parquet: Optional[ParquetOptions] = None
+    if output_format == "parquet":
+        if output_file is None or check_only:
+            show_error_panel("--format parquet needs -o and cannot be used with --check")
+            return 1
+        if delimiter != ",":
+            show_error_panel("--delimiter only applies to CSV output")
+            return 1
+        if parquet_codec not in PARQUET_CODECS:
+            show_error_panel(
+                f"Unknown Parquet compression: {parquet_codec}\n\n"
+                f"Choose one of: {', '.join(PARQUET_CODECS)}"
+            )
+            return 1
+        if parquet_compression_level is not None and parquet_codec != "zstd":
+            show_error_panel("--parquet-compression-level only applies to zstd")
+            return 1
+        if parquet_row_group_size is not None and parquet_row_group_size <= 0:
+            show_error_panel("--parquet-row-group-size must be positive")
+            return 1
+        parquet = {
+            "codec": parquet_codec,
+            "compression_level": parquet_compression_level,
+            "row_group_size": parquet_row_group_size,
+        }
+
+    if output_format in ARROW_FORMATS:
+        if output_file is None or check_only or per_thread_output:
+            show_error_panel(
+                f"--format {output_format} needs -o and cannot be used with "
+                "--check or --per-thread-output"
+            )
+            return 1
+        if delimiter != ",":
+            show_error_panel("--delimiter only applies to CSV output")
+            return 1
+        try:
+            _import_pyarrow()
+        except ImportError as e:
+            show_error_panel(str(e))
+            return 1
+
+    if per_thread_output and (output_file is None or check_only):
+        show_error_panel("--per-thread-output needs -o and cannot be used with --check")
+        return 1
+
+    if per_thread_output:
+        unordered = True
+
+    if unordered:
+        if preserve_insertion_order:
+            show_error_panel(
+                "--unordered cannot be combined with --preserve-insertion-order"
+            )
+            return 1
+        preserve_insertion_order = False
+
+    streaming = stream and _can_stream_to_stdout()
+    if stream and not streaming:
+        logger.debug("stdout is not a pipe or terminal; buffering output instead")
+
+    if encoding_sample_bytes is not None and encoding_sample_bytes <= 0:
+        show_error_panel("--encoding-sample-bytes must be positive")
+        return 1
+
     # Handle stdin input (csvnorm -)
     if input_file == "-":
         if sys.stdin.isatty():
             show_error_panel("No input data on stdin\n\nUsage: cat data.csv | csvnorm -")
             return 1
-        stdin_data = sys.stdin.buffer.read()
         stdin_temp_dir = Path(tempfile.mkdtemp(prefix="csvnorm_stdin_"))
         stdin_temp_file = stdin_temp_dir / "stdin_input.csv"
-        stdin_temp_file.write_bytes(stdin_data)
+        _spool_stdin(stdin_temp_file)
         input_path: Union[str, Path] = stdin_temp_file
         is_remote = False
     else:
@@ -676,6 +1060,9 @@ def process_csv(
     except FileExistsError:
         return 1
 
+    if streaming:
+        actual_output_file = STDOUT_STREAM_PATH
+
     temp_files: list[Path] = [temp_dir]
     if stdin_temp_file is not None:
         temp_files.append(stdin_temp_file.parent)
@@ -683,6 +1070,18 @@ def process_csv(
     compressed_type: Optional[str] = None
     compressed_input_path: Union[str, Path] = input_path
 
+    # Detection results are cached per local input file (not stdin or URLs),
+    # keyed by the path as given, before any zip extraction
+    cache_key_path: Optional[Path] = None
+    if (
+        not no_cache
+        and stdin_temp_file is None
+        and isinstance(input_path, Path)
+        and skip_rows == 0
+        and encoding is None
+    ):
+        cache_key_path = input_path
+
     if stdin_temp_file is not None:
         # Stdin input: skip remote download and compressed detection
         local_input_path: Optional[Path] = None
@@ -710,8 +1109,30 @@ def process_csv(
                 show_error_panel(str(e))
                 return 1
 
+    # Opened last, next to the try/finally that closes it, so the early
+    # returns above cannot leak it; bad settings still fail before any scan
+    owns_session = session is None
+    try:
+        active_session = session or CsvnormSession(
+            threads=threads,
+            memory_limit=memory_limit,
+            temp_directory=temp_directory,
+            preserve_insertion_order=preserve_insertion_order,
+        )
+        active_session.connection
+    except (ValueError, duckdb.Error) as e:
+        show_error_panel(f"Invalid DuckDB settings\n\n{e}")
+        _cleanup_temp_artifacts(use_stdout, reject_file, temp_files)
+        return 1
+
     progress_console = Console(stderr=True) if use_stdout else console
 
+    cache: Optional[DetectionCache] = None
+    cached: Optional[CacheEntry] = None
+    if cache_key_path is not None:
+        cache = DetectionCache(cache_dir)
+        cached = cache.get(cache_key_path)
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -722,27 +1143,85 @@ def process_csv(
             task = progress.add_task("[cyan]Processing...", total=None)
 
             # Step 1-2: Encoding detection + mojibake repair
+            if pipe and not fifo_supported():
+                logger.debug("Named pipes are not supported here; --pipe ignored")
+                pipe = False
+            pipe_stages: Optional[list[FifoStage]] = [] if pipe else None
             result = _prepare_working_file(
                 input_path, is_remote, compressed_type, compressed_input_path,
                 temp_utf8_file, temp_dir, fix_mojibake_sample, check_only,
                 progress, task, temp_files,
+                encoding_override=encoding,
+                encoding_sample_bytes=encoding_sample_bytes,
+                jobs=jobs,
+                cached=cached,
+                stages=pipe_stages,
             )
             if result is None:
                 return 1
-            working_file, encoding, mojibake_repaired = result
+            working_file, detected_encoding, mojibake_repaired, read_encoding = result
+            pipe_stage = pipe_stages[-1] if pipe_stages else None
 
-            # Step 3: Validate CSV
+            # Step 3: Validate CSV (and, unless --check, normalize in the same scan)
+            if streaming:
+                sys.stdout.flush()
             try:
-                reject_count, error_types, fallback_config = (
+                reject_stats, fallback_config, output_stats = (
                     _validate_csv_with_http_handling(
                         working_file, reject_file, is_remote, skip_rows,
                         input_file, progress, task,
+                        output_file=None if check_only else actual_output_file,
+                        delimiter=delimiter,
+                        keep_names=keep_names,
+                        session=active_session,
+                        per_thread_output=per_thread_output,
+                        known_dialect=(
+                            (cached["fallback_config"], cached["dialect"])
+                            if cached and cached["dialect"]
+                            else None
+                        ),
+                        read_encoding=read_encoding,
+                        stage=pipe_stage,
+                        output_format=output_format,
+                        parquet=parquet,
                     )
                 )
-            except duckdb.Error:
+            except duckdb.Error as e:
+                if streaming and "broken pipe" in str(e).lower():
+                    _silence_stdout_after_broken_pipe()
+                    return 0
+                return 1
+            except (OSError, ValueError):
+                if pipe_stage is None:
+                    raise
                 return 1
 
-            has_validation_errors = reject_count > 1
+            if pipe_stage is not None:
+                if pipe_stage.name == "mojibake":
+                    mojibake_repaired = bool(pipe_stage.result)
+                if not pipe_stage.path.is_file():
+                    # Streamed: nothing was written, size the stage input
+                    working_file = pipe_stage.source
+
+            if cache is not None and cache_key_path is not None:
+                checked_mojibake = fix_mojibake_sample is not None and not check_only
+                cache.put(cache_key_path, {
+                    "encoding": detected_encoding,
+                    "mojibake": (
+                        mojibake_repaired if checked_mojibake
+                        else cached["mojibake"] if cached else None
+                    ),
+                    "fallback_config": fallback_config,
+                    "dialect": active_session.read_dialect,
+                    "columns": (
+                        output_stats["columns"] if output_stats
+                        else cached["columns"] if cached else []
+                    ),
+                })
+
+            reject_count = reject_stats["reject_count"]
+            error_types = reject_stats["error_types"]
+            has_validation_errors = reject_count > 0
             exit_code = _handle_post_validation(
                 has_validation_errors, reject_count, error_types, fallback_config,
                 check_only, strict, use_stdout, reject_file, progress,
@@ -750,44 +1229,114 @@ def process_csv(
             if exit_code is not None:
                 return exit_code
 
-            progress.update(task, description="[green]✓[/green] CSV validated")
-
-            # Step 4: Normalize and write output
-            progress.update(task, description="[cyan]Normalizing and writing output...")
-            logger.debug("Normalizing CSV...")
-            try:
-                (
-                    _,
-                    reject_count,
-                    error_types,
-                    has_validation_errors,
-                ) = _normalize_and_refresh_errors(
-                    working_file, actual_output_file, delimiter, keep_names,
-                    is_remote, skip_rows, fallback_config, reject_file,
-                    reject_count, error_types,
-                )
-            except duckdb.Error as e:
-                progress.stop()
-                error_msg = str(e)
-                if "zipfs" in error_msg.lower():
-                    show_error_panel(
-                        "Failed to load DuckDB zipfs extension for zip input\n\n"
-                        f"{error_msg}\n\n"
-                        "Ensure DuckDB can download extensions or install zipfs manually."
-                    )
-                else:
-                    show_error_panel(f"Normalization failed\n{error_msg}")
-                return 1
-
             logger.debug(f"Output written to: {actual_output_file}")
             progress.update(task, description="[green]✓[/green] Complete")
 
+            if streaming:
+                # Output already streamed; validation panel (if any) was shown
+                return 1 if has_validation_errors else 0
+
         # Compute statistics and display results
         return _compute_and_show_output(
             input_file, local_input_path, working_file, actual_output_file,
-            encoding, is_remote, mojibake_repaired, delimiter, keep_names,
+            detected_encoding, is_remote, mojibake_repaired, delimiter, keep_names,
             use_stdout, has_validation_errors, reject_count, error_types, reject_file,
+            output_stats, decoded_by_duckdb=read_encoding is not None,
+            output_format=output_format,
         )
 
     finally:
+        if owns_session:
+            active_session.close()
+        if cache is not None:
+            cache.close()
         _cleanup_temp_artifacts(use_stdout, reject_file, temp_files)
+
+
+def read_arrow(
+    input_file: Union[str, Path],
+    keep_names: bool = False,
+    skip_rows: int = 0,
+    encoding: Optional[str] = None,
+    fix_mojibake_sample: Optional[int] = None,
+    reject_file: Optional[Path] = None,
+    session: Optional[CsvnormSession] = None,
+) -> tuple[Any, RejectStats]:
+    """Normalize a CSV file or URL into a pyarrow Table, without an output file.
+
+    The library counterpart of process_csv for in-process consumers
+    (pandas, polars, pyarrow): the same encoding handling, mojibake repair,
+    fallback dialects, name normalization and reject capture, but the
+    normalized rows are returned as DuckDB's Arrow batches instead of
+    being written and read back. Needs pyarrow. For a RecordBatchReader
+    over a file DuckDB can read directly, see
+    csvnorm.validation.normalize_to_arrow.
+
+    Args:
+        input_file: Path to input CSV file (plain or gzip) or HTTP/HTTPS URL.
+        keep_names: If True, keep original column names.
+        skip_rows: Number of rows to skip at the beginning of the file.
+        encoding: Input encoding to use instead of auto-detection.
+        fix_mojibake_sample: Sample size for mojibake detection, None to disable.
+        reject_file: Path to write rejected rows (None: only count them).
+        session: DuckDB session to run on; a default one is used when None.
+
+    Returns:
+        Tuple of (table, reject_stats).
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        FileNotFoundError: If a local input file does not exist.
+        ValueError: For an invalid URL or undecodable input.
+    """
+    _import_pyarrow()
+    is_remote = is_url(str(input_file))
+    if is_remote:
+        validate_url(str(input_file))
+    elif not Path(input_file).is_file():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+
+    owns_session = session is None
+    active_session = session or CsvnormSession()
+    temp_dir = Path(tempfile.mkdtemp(prefix="csvnorm_"))
+    try:
+        working_file: Union[str, Path] = (
+            str(input_file) if is_remote else Path(input_file)
+        )
+        read_encoding: Optional[str] = None
+        # Remote and gzip input is decoded by DuckDB, as in process_csv
+        if isinstance(working_file, Path) and not is_gzip_path(working_file):
+            detected = (
+                normalize_encoding_name(encoding) if encoding
+                else detect_encoding(working_file)
+            )
+            # Mojibake repair reads UTF-8 text, so DuckDB only decodes when
+            # there is no repair
+            if needs_conversion(detected) and fix_mojibake_sample is None:
+                read_encoding = duckdb_encoding(working_file, detected)
+            if needs_conversion(detected) and read_encoding is None:
+                utf8_file = temp_dir / "utf8_input.csv"
+                convert_to_utf8(working_file, utf8_file, detected)
+                working_file = utf8_file
+            if fix_mojibake_sample is not None:
+                _, working_file = repair_file(
+                    working_file, temp_dir / "mojibake_fixed.csv",
+                    fix_mojibake_sample,
+                )
+
+        table, reject_stats = normalize_to_arrow(
+            working_file,
+            reject_file=reject_file,
+            normalize_names=not keep_names,
+            is_remote=is_remote,
+            skip_rows=skip_rows,
+            session=active_session,
+            encoding=read_encoding,
+        )
+    finally:
+        if owns_session:
+            active_session.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    assert reject_stats is not None
+    return table, reject_stats
@@ -0,0 +1,247 @@
+"""Dialect detection on a bounded byte sample, without DuckDB."""
+
+import csv
+import gzip
+import logging
+from collections import Counter
+from itertools import repeat
+from pathlib import Path
+from typing import Optional, TypedDict
+
+logger = logging.getLogger("csvnorm")
+
+# Bytes read from the head of a file to detect its dialect
+DEFAULT_DIALECT_SAMPLE_BYTES = 64 * 1024
+
+# Confidence at or above which validation skips DuckDB's own sniffing
+DIALECT_CONFIDENCE_THRESHOLD = 0.9
+
+CANDIDATE_DELIMITERS: tuple[bytes, ...] = (b",", b";", b"|", b"\t")
+CANDIDATE_QUOTES: tuple[bytes, ...] = (b'"', b"'")
+
+# Data rows needed after the header before a guess can be fully trusted
+MIN_CONFIDENT_ROWS = 10
+
+# Leading rows (titles, notes) a dialect may skip before its header
+MAX_SKIP_ROWS = 10
+
+# DuckDB's spelling for "no quote/escape character"
+EMPTY = "(empty)"
+
+
+class DialectGuess(TypedDict):
+    """A candidate dialect scored on a sample.
+
+    ``quote`` and ``escape`` use DuckDB's ``(empty)`` when the sample never
+    needed them, as ``sniff_csv`` reports them.
+    """
+
+    delimiter: str
+    quote: str
+    escape: str
+    skip: int
+    header: bool
+    columns: int
+    consistency: float
+    confidence: float
+
+
+def read_sample(
+    file_path: Path,
+    sample_bytes: int = DEFAULT_DIALECT_SAMPLE_BYTES,
+    encoding: Optional[str] = None,
+) -> bytes:
+    """Read up to sample_bytes from the head of a (possibly gzipped) file.
+
+    With ``encoding`` the sample is transcoded to UTF-8 (undecodable bytes
+    dropped). A truncated sample is cut back to its last newline so no
+    partial row is scored.
+    """
+    opener = gzip.open if file_path.name.lower().endswith(".gz") else open
+    with opener(file_path, "rb") as f:
+        data = f.read(sample_bytes)
+    truncated = len(data) == sample_bytes
+    if encoding:
+        data = data.decode(encoding, errors="ignore").encode("utf-8")
+    if truncated:
+        end = data.rfind(b"\n")
+        if end > 0:
+            data = data[: end + 1]
+    return data
+
+
+def _records(sample: bytes, quote: bytes) -> list[bytes]:
+    """Split sample into records, without line terminators or blank lines.
+
+    A newline inside an open quote continues the record. A record still
+    open at the end of the sample was cut off and is dropped.
+    """
+    lines = sample.split(b"\n")
+    if quote not in sample:
+        return [line.rstrip(b"\r") for line in lines if line.strip()]
+
+    records: list[bytes] = []
+    pending: list[bytes] = []
+    open_quote = False
+    for line, quotes in zip(lines, map(bytes.count, lines, repeat(quote))):
+        pending.append(line)
+        if quotes % 2:
+            open_quote = not open_quote
+        if not open_quote:
+            record = b"\n".join(pending).rstrip(b"\r")
+            if record.strip():
+                records.append(record)
+            pending = []
+    return records
+
+
+def _field_counts(records: list[bytes], quote: bytes) -> dict[bytes, list[int]]:
+    """Count fields per record for every candidate delimiter.
+
+    Quoted sections are cut out of a record once, then each delimiter is
+    counted over all records with ``map(bytes.count, ...)`` so the per-line
+    work runs in C.
+    """
+    unquoted = [
+        b"".join(record.split(quote)[::2]) if quote in record else record
+        for record in records
+    ]
+    return {
+        delim: [n + 1 for n in map(bytes.count, unquoted, repeat(delim))]
+        for delim in CANDIDATE_DELIMITERS
+    }
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value.replace(",", "."))
+    except ValueError:
+        return False
+    return True
+
+
+def _has_header(record: bytes, delimiter: str, quote: str) -> bool:
+    """Return False only if every field of the first row is numeric."""
+    line = record.decode("utf-8", errors="ignore")
+    quotechar = quote if quote != EMPTY else '"'
+    fields = next(csv.reader([line], delimiter=delimiter, quotechar=quotechar), [])
+    values = [field.strip() for field in fields if field.strip()]
+    return not values or not all(_is_number(value) for value in values)
+
+
+def _score(counts: list[int]) -> Optional[tuple[int, int, float, float]]:
+    """Score one delimiter's field counts.
+
+    Returns (columns, skip, consistency, score) or None when the delimiter
+    yields a single column. ``columns`` is the most common field count,
+    ``skip`` the leading rows before the first row that has it,
+    ``consistency`` the share of rows from there on that have it, and
+    ``score`` that share weighted by how much of the sample is kept.
+    """
+    columns = Counter(counts).most_common(1)[0][0]
+    if columns < 2:
+        return None
+    skip = counts.index(columns)
+    if skip > MAX_SKIP_ROWS:
+        return None
+    kept = counts[skip:]
+    consistency = kept.count(columns) / len(kept)
+    return columns, skip, consistency, consistency * len(kept) / len(counts)
+
+
+def _field_start_quotes(sample: bytes, delimiter: bytes, quote: bytes) -> int:
+    """Count quote characters opening a field (after a delimiter or newline)."""
+    return (
+        sample.count(delimiter + quote)
+        + sample.count(b"\n" + quote)
+        + int(sample.startswith(quote))
+    )
+
+
+def rank_dialects(sample: bytes, quote: bytes = b'"') -> list[DialectGuess]:
+    """Rank candidate delimiters for a sample, best first.
+
+    Each delimiter is scored on column-count consistency: the most common
+    field count, the rows that must be skipped before it starts, and the
+    share of the remaining rows that agree. A single quote is used instead
+    of a double quote when it opens more fields in the sample.
+
+    Only the winner gets a confidence: its consistency, scaled down when
+    the sample has fewer than MIN_CONFIDENT_ROWS data rows and halved when
+    the runner-up scores about as well with the same header row. (Decimal
+    commas in a semicolon file stay confident: read with commas, the header
+    line has fewer fields and would have to be skipped.)
+    """
+    records = _records(sample, quote)
+    if len(records) < 2:
+        return []
+
+    scored = []
+    for delim, counts in _field_counts(records, quote).items():
+        result = _score(counts)
+        if result is not None:
+            scored.append((result, delim))
+    if not scored:
+        return []
+    scored.sort(key=lambda item: (item[0][3], item[0][0]), reverse=True)
+
+    best_delim = scored[0][1]
+    if quote == CANDIDATE_QUOTES[0]:
+        other = CANDIDATE_QUOTES[1]
+        if _field_start_quotes(sample, best_delim, other) > _field_start_quotes(
+            sample, best_delim, quote
+        ):
+            return rank_dialects(sample, quote=other)
+
+    quote_str = quote.decode() if sample.find(quote) != -1 else EMPTY
+    escape = quote_str if quote_str != EMPTY and quote * 2 in sample else EMPTY
+    runner_up = scored[1][0] if len(scored) > 1 else None
+
+    ranked: list[DialectGuess] = []
+    for rank, ((columns, skip, consistency, score), delim) in enumerate(scored):
+        delimiter = delim.decode()
+        confidence = 0.0
+        if rank == 0:
+            data_rows = len(records) - skip - 1
+            confidence = consistency * min(1.0, data_rows / MIN_CONFIDENT_ROWS)
+            if (
+                runner_up is not None
+                and runner_up[1] == skip
+                and runner_up[3] >= score - 0.05
+            ):
+                confidence *= 0.5
+        ranked.append({
+            "delimiter": delimiter,
+            "quote": quote_str,
+            "escape": escape,
+            "skip": skip,
+            "header": _has_header(records[skip], delimiter, quote_str),
+            "columns": columns,
+            "consistency": consistency,
+            "confidence": confidence,
+        })
+    return ranked
+
+
+def detect_dialect(
+    file_path: Path,
+    sample_bytes: int = DEFAULT_DIALECT_SAMPLE_BYTES,
+    encoding: Optional[str] = None,
+) -> Optional[DialectGuess]:
+    """Return the best dialect for a local CSV file, or None.
+
+    Only the first sample_bytes of the file are read, decoded from
+    ``encoding`` when the file is not UTF-8. None means no delimiter gave
+    two or more consistent columns (or the file could not be read); the
+    caller should then let DuckDB sniff.
+    """
+    try:
+        sample = read_sample(file_path, sample_bytes, encoding)
+    except (OSError, EOFError, LookupError) as e:
+        logger.debug(f"Could not read dialect sample: {e}")
+        return None
+    ranked = rank_dialects(sample)
+    if not ranked:
+        return None
+    logger.debug(f"Dialect guess: {ranked[0]}")
+    return ranked[0]
@@ -2,9 +2,12 @@
 
 import codecs
 import logging
+import mmap
+import time
 from pathlib import Path
+from typing import Optional
 
-from charset_normalizer import from_path
+from charset_normalizer import from_bytes, from_path
 
 logger = logging.getLogger("csvnorm")
 
@@ -20,6 +23,30 @@ ENCODING_ALIASES: dict[str, str] = {
 # Encodings that don't need conversion
 UTF8_ENCODINGS = frozenset({"utf-8", "ascii", "utf-8-sig"})
 
+# Byte-order marks checked before sampling (UTF-32 first: its LE BOM
+# starts with the UTF-16 LE BOM)
+BOM_ENCODINGS: tuple[tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Encodings DuckDB's read_csv decodes itself (no extension needed), keyed
+# by Python codec name. UTF-16 only qualifies with a little-endian BOM:
+# DuckDB reads big-endian input as empty.
+DUCKDB_NATIVE_ENCODINGS: dict[str, str] = {
+    "iso8859-1": "latin-1",
+    "utf-16": "utf-16",
+}
+
+# Bytes decoded per step by the fast UTF-8 verifier
+UTF8_VERIFY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Characters decoded per block when transcoding to UTF-8 (keeps memory flat)
+DEFAULT_CONVERT_CHUNK_SIZE = 1024 * 1024
+
 
 def normalize_encoding_name(encoding: str) -> str:
     """Normalize encoding name to Python codec name.
@@ -40,21 +67,157 @@ def normalize_encoding_name(encoding: str) -> str:
     return encoding_lower.replace("_", "-")
 
 
-def detect_encoding(file_path: Path) -> str:
+def _verify_utf8(
+    file_path: Path, chunk_size: int = UTF8_VERIFY_CHUNK_SIZE
+) -> Optional[str]:
+    """Check whether a whole file is valid UTF-8 without charset detection.
+
+    Walks the file through mmap and memoryview slices, decoding each chunk
+    with the C-level UTF-8 codec. An incremental decoder carries sequences
+    split across chunk boundaries.
+
+    Args:
+        file_path: Path to the file to verify.
+        chunk_size: Bytes decoded per step.
+
+    Returns:
+        "ascii" or "utf-8" if the file verifies, None otherwise (invalid
+        UTF-8, or NUL bytes suggesting UTF-16/32 without BOM).
+    """
+    if file_path.stat().st_size == 0:
+        return "utf-8"
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+    is_ascii = True
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, len(view), chunk_size):
+                    text = decoder.decode(view[start : start + chunk_size])
+                    if "\x00" in text:
+                        return None
+                    if is_ascii and not text.isascii():
+                        is_ascii = False
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                return None
+            finally:
+                view.release()
+
+    return "ascii" if is_ascii else "utf-8"
+
+
+def _detect_bom(file_path: Path) -> Optional[str]:
+    """Return the encoding signalled by a byte-order mark, if any."""
+    with open(file_path, "rb") as f:
+        head = f.read(4)
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def _trim_partial_utf8(data: bytes) -> bytes:
+    """Drop a multi-byte UTF-8 sequence cut off at the end of data."""
+    for back in range(1, min(len(data), 4) + 1):
+        byte = data[-back]
+        if byte < 0x80:
+            return data
+        if byte >= 0xC0:
+            needed = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return data[:-back] if back < needed else data
+    return data
+
+
+def _read_sample(file_path: Path, sample_bytes: int) -> bytes:
+    """Read a bounded byte sample from the head, middle and tail of a file.
+
+    Middle and tail windows are aligned to line boundaries so they never
+    start or end inside a multi-byte sequence; a head window with no line
+    break has a trailing partial UTF-8 sequence trimmed. Files no larger
+    than the budget are read whole.
+
+    Args:
+        file_path: Path to the file to sample.
+        sample_bytes: Total byte budget, split evenly across the three windows.
+
+    Returns:
+        Sampled bytes, windows joined with newlines.
+    """
+    size = file_path.stat().st_size
+    with open(file_path, "rb") as f:
+        if size <= sample_bytes:
+            return f.read()
+
+        window = max(sample_bytes // 3, 1)
+        head = f.read(window)
+        last_newline = head.rfind(b"\n")
+        parts = [
+            head[: last_newline + 1] if last_newline >= 0 else _trim_partial_utf8(head)
+        ]
+
+        for offset in (size // 2 - window // 2, size - window):
+            f.seek(offset)
+            chunk = f.read(window)
+            first_newline = chunk.find(b"\n")
+            if first_newline < 0:
+                continue
+            chunk = chunk[first_newline + 1 :]
+            if offset + window < size:
+                chunk = chunk[: chunk.rfind(b"\n") + 1]
+            parts.append(chunk)
+
+    return b"\n".join(part for part in parts if part)
+
+
+def detect_encoding(file_path: Path, sample_bytes: Optional[int] = None) -> str:
     """Detect the encoding of a file using charset_normalizer.
 
+    Files that verify as UTF-8 end to end are reported without running
+    charset_normalizer. With ``sample_bytes`` set, detection is bounded: a BOM is checked first,
+    then a strict UTF-8 decode of a head/middle/tail sample, and only if that
+    fails is charset_normalizer run on the sampled bytes.
+
     Args:
         file_path: Path to the file to analyze.
+        sample_bytes: Byte budget for sampled detection, None to analyze the
+                      whole file.
 
     Returns:
         Detected encoding name (normalized for Python codecs).
 
     Raises:
-        ValueError: If encoding cannot be detected.
+        ValueError: If encoding cannot be detected or sample_bytes is not positive.
     """
     logger.debug(f"Detecting encoding for: {file_path}")
 
-    result = from_path(file_path)
+    if sample_bytes is None:
+        verified = _verify_utf8(file_path)
+        if verified:
+            logger.debug(f"Fast UTF-8 verification passed: {verified}")
+            return verified
+        result = from_path(file_path)
+    else:
+        if sample_bytes <= 0:
+            raise ValueError("Encoding sample size must be positive")
+
+        bom_encoding = _detect_bom(file_path)
+        if bom_encoding:
+            logger.debug(f"Detected encoding from BOM: {bom_encoding}")
+            return bom_encoding
+
+        sample = _read_sample(file_path, sample_bytes)
+        logger.debug(f"Sampled {len(sample)} bytes for encoding detection")
+        try:
+            sample.decode("utf-8")
+        except UnicodeDecodeError:
+            result = from_bytes(sample)
+        else:
+            encoding = "ascii" if sample.isascii() and sample else "utf-8"
+            logger.debug(f"Sample decodes as {encoding}")
+            return encoding
+
     best = result.best()
 
     if best is None:
@@ -85,13 +248,46 @@ def needs_conversion(encoding: str) -> bool:
     return encoding_lower not in UTF8_ENCODINGS
 
 
-def convert_to_utf8(input_path: Path, output_path: Path, source_encoding: str) -> Path:
+def duckdb_encoding(file_path: Path, encoding: str) -> Optional[str]:
+    """Return the read_csv encoding that lets DuckDB decode a file natively.
+
+    Args:
+        file_path: Path to the file to be read.
+        encoding: Detected (or user-given) encoding name.
+
+    Returns:
+        The ``encoding=`` value for read_csv, or None if the file must be
+        converted to UTF-8 in Python first.
+    """
+    try:
+        codec_name = codecs.lookup(encoding).name
+    except LookupError:
+        return None
+    native = DUCKDB_NATIVE_ENCODINGS.get(codec_name)
+    if native == "utf-16":
+        with open(file_path, "rb") as f:
+            if f.read(2) != codecs.BOM_UTF16_LE:
+                return None
+    return native
+
+
+def convert_to_utf8(
+    input_path: Path,
+    output_path: Path,
+    source_encoding: str,
+    chunk_size: int = DEFAULT_CONVERT_CHUNK_SIZE,
+) -> Path:
     """Convert file from source encoding to UTF-8.
 
+    The file is streamed in fixed-size blocks through an incremental decoder,
+    so multi-byte sequences split across blocks are handled and memory use
+    does not depend on file size.
+
     Args:
         input_path: Path to input file.
         output_path: Path for UTF-8 output file.
         source_encoding: Source file encoding.
+        chunk_size: Number of characters decoded per block.
 
     Returns:
         Path to the converted file.
@@ -99,21 +295,35 @@ def convert_to_utf8(input_path: Path, output_path: Path, source_encoding: str) -
     Raises:
         UnicodeDecodeError: If file cannot be decoded with the specified encoding.
         LookupError: If the encoding is not supported.
+        ValueError: If chunk_size is not positive.
     """
     logger.debug(f"Converting from {source_encoding} to UTF-8")
 
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
     # Validate encoding exists
     try:
         codecs.lookup(source_encoding)
     except LookupError as e:
         raise LookupError(f"Unknown encoding: {source_encoding}") from e
 
-    # Read with source encoding, write as UTF-8
-    with open(input_path, "r", encoding=source_encoding, errors="strict") as f:
-        content = f.read()
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(content)
-
+    # Text-mode read uses an incremental decoder (and universal newlines)
+    # internally, so blocks can split multi-byte sequences and CRLF pairs.
+    started = time.perf_counter()
+    with open(input_path, "r", encoding=source_encoding, errors="strict") as src:
+        with open(output_path, "w", encoding="utf-8") as dst:
+            while True:
+                block = src.read(chunk_size)
+                if not block:
+                    break
+                dst.write(block)
+
+    elapsed = time.perf_counter() - started
+    input_size = input_path.stat().st_size
+    throughput = input_size / elapsed / (1024 * 1024) if elapsed > 0 else 0.0
+    logger.debug(
+        f"Converted {input_size} bytes in {elapsed:.2f}s ({throughput:.1f} MB/s)"
+    )
     logger.debug(f"Converted file written to: {output_path}")
     return output_path
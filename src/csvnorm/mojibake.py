@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import logging
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator, TextIO
 
 import ftfy
 import ftfy.badness
 from ftfy import TextFixerConfig
 
+logger = logging.getLogger("csvnorm")
+
 DEFAULT_MOJIBAKE_SAMPLE = 5000
 
+# Number of evenly spaced windows scored by sample_mojibake_regions
+DEFAULT_MOJIBAKE_REGIONS = 8
+
+# Approximate characters per line-aligned segment when streaming repair
+DEFAULT_REPAIR_CHUNK_SIZE = 1024 * 1024
+
 
 def detect_mojibake(text: str, sample_size: int) -> tuple[bool, float]:
     """Detect mojibake in a text sample using ftfy badness.
@@ -35,6 +49,60 @@ def detect_mojibake(text: str, sample_size: int) -> tuple[bool, float]:
     return is_bad, badness_score
 
 
+def sample_mojibake_regions(
+    file_path: Path, sample_size: int, regions: int = DEFAULT_MOJIBAKE_REGIONS
+) -> list[tuple[int, float, bool]]:
+    """Score mojibake in evenly spaced windows across a UTF-8 file.
+
+    Seeks (via mmap) to ``regions`` offsets spread from head to tail, aligns each
+    one to the next line start and scores ``sample_size`` bytes with ftfy
+    badness. Files small enough are tiled completely. Nothing beyond the
+    windows is read or decoded.
+
+    Args:
+        file_path: Path to UTF-8 text file.
+        sample_size: Bytes per window (must be positive).
+        regions: Number of windows to score.
+
+    Returns:
+        List of (byte_offset, badness_score, is_bad) per window.
+    """
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive")
+    if regions <= 0:
+        raise ValueError("regions must be positive")
+
+    size = file_path.stat().st_size
+    if size == 0:
+        return []
+
+    if size <= sample_size * regions:
+        offsets = list(range(0, size, sample_size))
+    elif regions == 1:
+        offsets = [0]
+    else:
+        # First window at the head, last one ending at EOF
+        span = size - sample_size
+        offsets = [i * span // (regions - 1) for i in range(regions)]
+
+    results: list[tuple[int, float, bool]] = []
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in offsets:
+                start = offset
+                if offset > 0:
+                    newline = mapped.find(b"\n", offset, offset + sample_size)
+                    if newline >= 0:
+                        start = newline + 1
+                window = mapped[start : start + sample_size]
+                text = window.decode("utf-8", errors="ignore")
+                results.append(
+                    (start, ftfy.badness.badness(text), ftfy.badness.is_bad(text))
+                )
+
+    return results
+
+
 def repair_text(text: str) -> tuple[bool, str]:
     """Repair mojibake in text using ftfy.
 
@@ -49,28 +117,195 @@ def repair_text(text: str) -> tuple[bool, str]:
     return fixed_text != text, fixed_text
 
 
+def _iter_line_chunks(f: TextIO, chunk_size: int) -> Iterator[str]:
+    """Yield line-aligned segments of roughly chunk_size characters."""
+    while True:
+        lines = f.readlines(chunk_size)
+        if not lines:
+            return
+        yield "".join(lines)
+
+
+def _line_aligned_ranges(file_path: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a file into byte ranges of about chunk_size that end after a newline."""
+    size = file_path.stat().st_size
+    if size == 0:
+        return []
+
+    ranges: list[tuple[int, int]] = []
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while start < size:
+                newline = mapped.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if newline < 0 else newline + 1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def _repair_byte_range(
+    file_path: str, start: int, end: int, unescape_html_off: bool
+) -> tuple[bool, str]:
+    """Repair one line-aligned byte range (runs in a worker process).
+
+    Newlines are translated like a text-mode read so the result matches the
+    serial path.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    segment = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    config = TextFixerConfig(uncurl_quotes=False)
+    if unescape_html_off:
+        config = config._replace(unescape_html=False)
+    fixed_segment = ftfy.fix_text(segment, config=config)
+    return fixed_segment != segment, fixed_segment
+
+
+def _repair_serial(input_path: Path, output_path: Path, chunk_size: int) -> bool:
+    """Repair segment by segment in this process; return True if anything changed."""
+    config = TextFixerConfig(uncurl_quotes=False)
+    repaired = False
+    with open(input_path, "r", encoding="utf-8") as src:
+        with open(output_path, "w", encoding="utf-8") as dst:
+            for segment in _iter_line_chunks(src, chunk_size):
+                fixed_segment = ftfy.fix_text(segment, config=config)
+                # fix_text turns off "auto" HTML unescaping for the rest of
+                # the text once it sees "<"; carry that across segments.
+                if config.unescape_html == "auto" and "<" in segment:
+                    config = config._replace(unescape_html=False)
+                if fixed_segment != segment:
+                    repaired = True
+                dst.write(fixed_segment)
+    return repaired
+
+
+def _repair_parallel(
+    input_path: Path, output_path: Path, chunk_size: int, jobs: int
+) -> bool:
+    """Repair line-aligned byte ranges in a process pool, writing in order."""
+    ranges = _line_aligned_ranges(input_path, chunk_size)
+    logger.debug(f"Repairing {len(ranges)} ranges with {jobs} worker processes")
+
+    # Ranges after the first "<" must start with HTML unescaping off, as in
+    # the serial path. Find it once in the raw bytes ("<" is ASCII in UTF-8).
+    first_lt = -1
+    if ranges:
+        with open(input_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                first_lt = mapped.find(b"<")
+
+    repaired = False
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        with open(output_path, "w", encoding="utf-8") as dst:
+            pending: deque[Future[tuple[bool, str]]] = deque()
+            for start, end in ranges:
+                html_off = 0 <= first_lt < start
+                pending.append(
+                    executor.submit(
+                        _repair_byte_range, str(input_path), start, end, html_off
+                    )
+                )
+                # Bound in-flight results so memory stays ~2 chunks per worker
+                if len(pending) >= jobs * 2:
+                    changed, fixed_segment = pending.popleft().result()
+                    repaired = repaired or changed
+                    dst.write(fixed_segment)
+            while pending:
+                changed, fixed_segment = pending.popleft().result()
+                repaired = repaired or changed
+                dst.write(fixed_segment)
+    return repaired
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Return worker count for a --jobs value (0 means all CPUs)."""
+    if jobs < 0:
+        raise ValueError("jobs must be non-negative")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def needs_repair(input_path: Path, sample_size: int) -> bool:
+    """Return True if any sampled window of a UTF-8 file has mojibake.
+
+    Args:
+        input_path: Path to UTF-8 text file.
+        sample_size: Bytes per detection window (see sample_mojibake_regions).
+                     Use 0 to force repair without detection.
+    """
+    if sample_size < 0:
+        raise ValueError("sample_size must be non-negative")
+
+    # Force mode (sample_size=0): skip detection, always repair
+    if sample_size == 0:
+        return True
+    regions = sample_mojibake_regions(input_path, sample_size)
+    for offset, score, bad in regions:
+        logger.debug(
+            f"Mojibake window at byte {offset}: badness={score:.0f}"
+            f"{' (bad)' if bad else ''}"
+        )
+    return any(bad for _, _, bad in regions)
+
+
+def repair_stream(
+    input_path: Path,
+    output_path: Path,
+    chunk_size: int = DEFAULT_REPAIR_CHUNK_SIZE,
+    jobs: int = 1,
+) -> bool:
+    """Write a repaired copy of a UTF-8 file without detection.
+
+    Output is written strictly front to back, so output_path may be a
+    named pipe.
+
+    Returns:
+        True if any segment changed.
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs > 1:
+        return _repair_parallel(input_path, output_path, chunk_size, jobs)
+    return _repair_serial(input_path, output_path, chunk_size)
+
+
 def repair_file(
-    input_path: Path, output_path: Path, sample_size: int
+    input_path: Path,
+    output_path: Path,
+    sample_size: int,
+    chunk_size: int = DEFAULT_REPAIR_CHUNK_SIZE,
+    jobs: int = 1,
 ) -> tuple[bool, Path]:
     """Repair mojibake in a UTF-8 file.
 
+    Detection scores ``sample_size``-byte windows spread across the file
+    (see sample_mojibake_regions), so broken rows near the end are not
+    missed; repair runs when any window is bad. Repair streams
+    the file in line-aligned segments and writes each one as it is fixed, so
+    peak memory is bounded by ``chunk_size`` rather than the file size.
+    With ``jobs`` > 1 the segments are repaired in a process pool and written
+    back in order; the output is identical to the serial path.
+
     Args:
         input_path: Path to UTF-8 text file.
         output_path: Path to write repaired content.
-        sample_size: Number of characters to sample for detection.
+        sample_size: Bytes per detection window.
                      Use 0 to force repair without detection.
+        chunk_size: Approximate characters (bytes when parallel) per segment.
+        jobs: Worker processes for repair (0 = all CPUs, 1 = serial).
 
     Returns:
         Tuple of (was_repaired, path_to_use).
     """
-    text = input_path.read_text(encoding="utf-8")
-    is_bad, _ = detect_mojibake(text, sample_size)
-    if not is_bad:
+    jobs = resolve_jobs(jobs)
+    if not needs_repair(input_path, sample_size):
         return False, input_path
 
-    repaired, fixed_text = repair_text(text)
-    if not repaired:
+    if not repair_stream(input_path, output_path, chunk_size, jobs):
+        output_path.unlink()
         return False, input_path
 
-    output_path.write_text(fixed_text, encoding="utf-8")
     return True, output_path
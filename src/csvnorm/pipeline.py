@@ -0,0 +1,151 @@
+"""Stream a Python pre-processing stage into DuckDB through a named pipe."""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("csvnorm")
+
+# Writes a stage's complete output to the given path (file or named pipe)
+Producer = Callable[[Path], Any]
+
+# Seconds a read end is held open while releasing a stranded producer
+PIPE_RELEASE_INTERVAL = 0.05
+
+# Bytes read per call when draining a pipe nobody else reads
+PIPE_DRAIN_BYTES = 64 * 1024
+
+# Seconds a producer may keep running once its reader is done
+PIPE_JOIN_TIMEOUT = 30.0
+
+
+def fifo_supported() -> bool:
+    """Return True if named pipes can be created on this platform."""
+    return hasattr(os, "mkfifo")
+
+
+class FifoStage:
+    """A pre-processing stage whose output DuckDB can read once, as it is made.
+
+    ``produce(path)`` is the call that would otherwise write a temp file
+    (transcoding, mojibake repair). Inside a ``with`` block ``path`` is a
+    named pipe and ``produce`` runs in a producer thread, so the stage
+    overlaps with DuckDB's parse and writes nothing to disk. A pipe can only
+    be read front to back once; a consumer that needs random access (DuckDB
+    sniffing, a re-scan) calls ``materialize()`` to write a regular file at
+    ``path`` instead, or ``head()`` for just the first bytes.
+
+    ``source`` and ``source_encoding`` describe the stage's input so its
+    dialect can be scored on a sample before the pipe is opened.
+
+    Args:
+        name: Stage name for logs ("transcode", "mojibake").
+        produce: Writer for the stage's output.
+        path: Where the pipe (or materialized file) is created.
+        source: Input file the stage reads.
+        source_encoding: Encoding of ``source`` if it is not UTF-8.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        produce: Producer,
+        path: Path,
+        source: Path,
+        source_encoding: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.produce = produce
+        self.path = path
+        self.source = source
+        self.source_encoding = source_encoding
+        self.result: Any = None
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def materialize(self) -> Path:
+        """Run the stage into a regular file at ``path`` and return it."""
+        logger.debug(f"Writing {self.name} stage to temp file: {self.path}")
+        self.result = self.produce(self.path)
+        return self.path
+
+    def head(self, size: int) -> bytes:
+        """Stream the stage through the pipe and return its first size bytes.
+
+        The producer is stopped once they are read, so only about ``size``
+        bytes of work is done; producer errors before that point are raised.
+        """
+        with self as path:
+            with open(path, "rb") as f:
+                return f.read(size)
+
+    def _run(self) -> None:
+        try:
+            self.result = self.produce(self.path)
+        except BrokenPipeError:
+            logger.debug(f"Reader closed the {self.name} pipe early")
+        except BaseException as e:  # re-raised in the consumer's thread
+            self._error = e
+            # The producer may have failed before opening the pipe: open and
+            # close a write end so a reader waiting in open() or read() sees
+            # EOF instead of blocking. _release supplies a reader if needed.
+            try:
+                os.close(os.open(self.path, os.O_WRONLY))
+            except OSError:
+                pass
+
+    def _release(self, thread: threading.Thread, deadline: float) -> None:
+        """Let a producer whose reader failed or never came run out.
+
+        A read end is opened (so a producer waiting in open() proceeds),
+        drained (so one blocked on a full pipe proceeds) and closed (so its
+        next write raises BrokenPipeError), until the thread exits or the
+        deadline (a time.monotonic() value) passes.
+        """
+        while thread.is_alive() and time.monotonic() < deadline:
+            fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                thread.join(PIPE_RELEASE_INTERVAL)
+                while os.read(fd, PIPE_DRAIN_BYTES):
+                    pass
+            except BlockingIOError:
+                pass
+            finally:
+                os.close(fd)
+            thread.join(PIPE_RELEASE_INTERVAL)
+
+    def __enter__(self) -> Path:
+        os.mkfifo(self.path)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"csvnorm-{self.name}", daemon=True
+        )
+        self._thread.start()
+        logger.debug(f"Streaming {self.name} stage through pipe: {self.path}")
+        return self.path
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        thread = self._thread
+        self._thread = None
+        try:
+            if thread is not None:
+                deadline = time.monotonic() + PIPE_JOIN_TIMEOUT
+                self._release(thread, deadline)
+                if thread.is_alive():
+                    raise TimeoutError(
+                        f"{self.name} stage did not finish within "
+                        f"{PIPE_JOIN_TIMEOUT:.0f}s of its reader"
+                    )
+        finally:
+            self.path.unlink(missing_ok=True)
+        if self._error is not None and exc_type is None:
+            raise self._error
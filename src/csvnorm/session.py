@@ -0,0 +1,212 @@
+"""Shared DuckDB connection for the csvnorm pipeline."""
+
+import logging
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, TypedDict, Union
+
+import duckdb
+
+logger = logging.getLogger("csvnorm")
+
+ConfigDict = dict[str, Union[str, int]]
+
+
+class Dialect(TypedDict):
+    """CSV dialect discovered once and passed explicitly to every scan.
+
+    ``quote`` and ``escape`` use sniff_csv's ``(empty)`` for "none seen".
+    ``columns`` holds the sniffed column names (empty when the dialect came
+    from csvnorm.dialect rather than sniff_csv).
+    """
+
+    delimiter: str
+    quote: str
+    escape: str
+    skip: int
+    header: bool
+    columns: list[str]
+
+
+# Milliseconds DuckDB waits on remote reads before giving up
+HTTP_TIMEOUT_MS = 30000
+
+# Environment variables read when a resource setting is not given explicitly
+THREADS_ENV = "CSVNORM_THREADS"
+MEMORY_LIMIT_ENV = "CSVNORM_MEMORY_LIMIT"
+TEMP_DIRECTORY_ENV = "CSVNORM_TEMP_DIRECTORY"
+PRESERVE_INSERTION_ORDER_ENV = "CSVNORM_PRESERVE_INSERTION_ORDER"
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def _env_threads() -> Optional[int]:
+    """Return CSVNORM_THREADS as an int, None if unset."""
+    value = os.environ.get(THREADS_ENV, "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{THREADS_ENV} must be an integer, got {value!r}") from None
+
+
+def _env_bool(name: str) -> Optional[bool]:
+    """Return a boolean environment variable, None if unset."""
+    value = os.environ.get(name, "").strip().lower()
+    if not value:
+        return None
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be true or false, got {value!r}")
+
+
+def _needs_zipfs(file_path: Union[Path, str]) -> bool:
+    """Return True if the input uses DuckDB zipfs paths."""
+    return isinstance(file_path, str) and file_path.startswith("zip://")
+
+
+def _ensure_zipfs_extension(
+    conn: duckdb.DuckDBPyConnection, file_path: Union[Path, str]
+) -> None:
+    """Install/load DuckDB zipfs extension when needed."""
+    if not _needs_zipfs(file_path):
+        return
+
+    try:
+        conn.execute("LOAD zipfs")
+    except duckdb.Error:
+        # Prefer community repo for zipfs if default repo doesn't have it.
+        try:
+            conn.execute("INSTALL zipfs FROM community")
+        except duckdb.Error:
+            conn.execute("INSTALL zipfs")
+        conn.execute("LOAD zipfs")
+
+
+def _drop_reject_tables(conn: duckdb.DuckDBPyConnection) -> None:
+    """Forget rejects from earlier scans; DuckDB appends to them otherwise."""
+    conn.execute("DROP TABLE IF EXISTS reject_errors")
+    conn.execute("DROP TABLE IF EXISTS reject_scans")
+
+
+class CsvnormSession:
+    """One configured DuckDB connection reused by every pipeline stage.
+
+    The connection is opened lazily with the given resource settings; a
+    setting left as None is read from its ``CSVNORM_*`` environment variable
+    and otherwise keeps DuckDB's default. Extensions and the HTTP timeout are
+    set up once, on first need, instead of per stage. The fallback config
+    settled on by validation is kept in ``dialect`` so later stages read the
+    file the same way, and the exact dialect read_csv was given in
+    ``read_dialect``.
+
+    Usable as a context manager; ``close()`` releases the connection and a
+    later ``prepare()`` opens a fresh one.
+
+    Args:
+        threads: DuckDB worker threads (CSVNORM_THREADS; default all cores).
+        memory_limit: DuckDB memory limit such as ``"2GB"``
+            (CSVNORM_MEMORY_LIMIT; default 80% of RAM).
+        temp_directory: Directory DuckDB spills to
+            (CSVNORM_TEMP_DIRECTORY; default ``.tmp`` in the working directory).
+        preserve_insertion_order: Keep input row order in the output
+            (CSVNORM_PRESERVE_INSERTION_ORDER; default true).
+
+    Raises:
+        ValueError: If a setting or its environment variable is invalid.
+    """
+
+    def __init__(
+        self,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None,
+        temp_directory: Optional[Union[str, Path]] = None,
+        preserve_insertion_order: Optional[bool] = None,
+    ) -> None:
+        if threads is None:
+            threads = _env_threads()
+        if threads is not None and threads < 1:
+            raise ValueError("threads must be at least 1")
+        if preserve_insertion_order is None:
+            preserve_insertion_order = _env_bool(PRESERVE_INSERTION_ORDER_ENV)
+
+        self.threads = threads
+        self.memory_limit = memory_limit or os.environ.get(MEMORY_LIMIT_ENV) or None
+        self.temp_directory = (
+            temp_directory or os.environ.get(TEMP_DIRECTORY_ENV) or None
+        )
+        self.preserve_insertion_order = preserve_insertion_order
+        self.dialect: Optional[ConfigDict] = None
+        self.read_dialect: Optional[Dialect] = None
+        self._conn: Optional[duckdb.DuckDBPyConnection] = None
+        self._http_configured = False
+        self._zipfs_loaded = False
+        self._scanned = False
+
+    def _config(self) -> dict[str, Union[str, bool, int, float, list[str]]]:
+        """Return duckdb.connect() config for the non-default settings."""
+        config: dict[str, Union[str, bool, int, float, list[str]]] = {}
+        if self.threads is not None:
+            config["threads"] = self.threads
+        if self.memory_limit is not None:
+            config["memory_limit"] = self.memory_limit
+        if self.temp_directory is not None:
+            config["temp_directory"] = str(self.temp_directory)
+        if self.preserve_insertion_order is not None:
+            config["preserve_insertion_order"] = self.preserve_insertion_order
+        return config
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        """The shared connection, opened on first access."""
+        if self._conn is None:
+            config = self._config()
+            logger.debug(f"Opening DuckDB connection (config: {config or 'default'})")
+            self._conn = duckdb.connect(config=config)
+            self._http_configured = False
+            self._zipfs_loaded = False
+            self._scanned = False
+        return self._conn
+
+    def prepare(
+        self, file_path: Union[Path, str], is_remote: bool = False
+    ) -> duckdb.DuckDBPyConnection:
+        """Return the connection ready for a new scan of ``file_path``.
+
+        Loads zipfs and sets the HTTP timeout if this input needs them and
+        they are not set up yet, and drops reject tables left by an earlier
+        scan so ``reject_errors`` only describes the next one.
+        """
+        conn = self.connection
+        if _needs_zipfs(file_path) and not self._zipfs_loaded:
+            _ensure_zipfs_extension(conn, file_path)
+            self._zipfs_loaded = True
+        if is_remote and not self._http_configured:
+            conn.execute(f"SET http_timeout={HTTP_TIMEOUT_MS}")
+            self._http_configured = True
+        if self._scanned:
+            _drop_reject_tables(conn)
+        self._scanned = True
+        return conn
+
+    def close(self) -> None:
+        """Close the shared connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "CsvnormSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
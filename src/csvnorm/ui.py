@@ -49,6 +49,8 @@ def show_success_table(
     keep_names: bool,
     output_display: Optional[str] = None,
     out_console: Optional[Console] = None,
+    decoded_by_duckdb: bool = False,
+    output_format: str = "csv",
 ) -> None:
     """Display success summary table with processing results.
 
@@ -64,6 +66,9 @@ def show_success_table(
         output_size: Output file size in bytes.
         delimiter: Output delimiter character.
         keep_names: Whether original column names were kept.
+        decoded_by_duckdb: Whether DuckDB decoded the input itself instead
+            of reading a converted UTF-8 copy.
+        output_format: Output file format (shown unless ``csv``).
     """
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_row("[green]✓[/green] Success", "")
@@ -73,7 +78,11 @@ def show_success_table(
 
     # Encoding info (only for local files)
     if not is_remote:
-        if needs_conversion(encoding):
+        if decoded_by_duckdb:
+            table.add_row(
+                "Encoding:", f"{encoding} → UTF-8 [dim](decoded by DuckDB)[/dim]"
+            )
+        elif needs_conversion(encoding):
             table.add_row("Encoding:", f"{encoding} → UTF-8 [dim](converted)[/dim]")
         else:
             if encoding == "ascii":
@@ -93,6 +102,8 @@ def show_success_table(
     table.add_row("Output size:", format_file_size(output_size))
 
     # Optional fields
+    if output_format != "csv":
+        table.add_row("Format:", output_format)
     if delimiter != ",":
         table.add_row("Delimiter:", repr(delimiter))
     if not keep_names:
@@ -109,7 +120,7 @@ def show_validation_error_panel(
     """Display validation error summary panel.
 
     Args:
-        reject_count: Number of rejected rows (including header).
+        reject_count: Number of rejected rows.
         error_types: List of error type descriptions.
         reject_file: Path to reject errors CSV file.
         console_out: Optional console to use (defaults to module console).
@@ -119,7 +130,7 @@ def show_validation_error_panel(
     error_lines = []
     error_lines.append("[bold red]Validation Errors:[/bold red]")
     error_lines.append("")
-    error_lines.append(f"Rejected rows: [yellow]{reject_count - 1}[/yellow]")
+    error_lines.append(f"Rejected rows: [yellow]{reject_count}[/yellow]")
 
     if error_types:
         error_lines.append("")
@@ -9,7 +9,7 @@ import urllib.error
 import urllib.request
 import zipfile
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 from urllib.parse import urlparse
 
 import duckdb
@@ -17,6 +17,8 @@ import requests
 
 from rich.logging import RichHandler
 
+from csvnorm.session import CsvnormSession
+
 
 def to_snake_case(name: str) -> str:
     """Convert filename to clean snake_case.
@@ -311,12 +313,17 @@ def get_row_count(file_path: Union[Path, str]) -> int:
         return 0
 
 
-def get_column_count(file_path: Union[Path, str], delimiter: str = ",") -> int:
+def get_column_count(
+    file_path: Union[Path, str],
+    delimiter: str = ",",
+    session: Optional[CsvnormSession] = None,
+) -> int:
     """Count number of columns in a CSV file using DuckDB.
 
     Args:
         file_path: Path to CSV file.
         delimiter: Field delimiter used in the CSV file.
+        session: Shared session to query on; a private connection when None.
 
     Returns:
         Number of columns in the CSV, or 0 if file doesn't exist or error.
@@ -325,15 +332,16 @@ def get_column_count(file_path: Union[Path, str], delimiter: str = ",") -> int:
         return 0
 
     try:
-        conn = duckdb.connect(":memory:")
+        conn = (session or CsvnormSession()).connection
         # Get column names from CSV using DuckDB DESCRIBE
         escaped_path = str(file_path).replace("'", "''")
         columns = conn.execute(
             "DESCRIBE SELECT * FROM read_csv("
             f"'{escaped_path}', delim='{delimiter}', header=true, sample_size=1)"
         ).fetchall()
-        conn.close()
+        if session is None:
+            conn.close()
 
         return len(columns)
-    except (duckdb.Error, OSError):
+    except (duckdb.Error, OSError, ValueError):
         return 0
@@ -1,15 +1,67 @@
 """CSV validation and normalization using DuckDB."""
 
 import logging
-import re
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Optional, TypedDict, Union
 
 import duckdb
 
+from csvnorm.dialect import DIALECT_CONFIDENCE_THRESHOLD, detect_dialect, read_sample
+from csvnorm.pipeline import FifoStage, fifo_supported
+from csvnorm.session import ConfigDict, CsvnormSession, Dialect, _drop_reject_tables
+
 logger = logging.getLogger("csvnorm")
 
-ConfigDict = dict[str, Union[str, int]]
+
+class RejectStats(TypedDict):
+    """Rejected-row summary aggregated from DuckDB's reject_errors table."""
+
+    reject_count: int
+    error_types: list[str]
+    error_counts: dict[str, int]
+
+
+class OutputStats(TypedDict):
+    """Shape of the normalized output as reported by DuckDB."""
+
+    row_count: int
+    column_count: int
+    columns: list[str]
+
+
+class ParquetOptions(TypedDict):
+    """Parquet writer settings for ``COPY ... (FORMAT parquet)``.
+
+    ``compression_level`` is only accepted by DuckDB for zstd. None fields
+    keep DuckDB's defaults.
+    """
+
+    codec: str
+    compression_level: Optional[int]
+    row_group_size: Optional[int]
+
+
+# Formats the normalized output can be written in
+OUTPUT_FORMATS: tuple[str, ...] = ("csv", "parquet", "arrow", "feather")
+
+# Written from DuckDB's Arrow record batches with pyarrow rather than COPY:
+# "arrow" is the Arrow IPC stream format, "feather" the IPC file format
+# (Feather v2)
+ARROW_FORMATS: tuple[str, ...] = ("arrow", "feather")
+
+# Rows per record batch fetched from DuckDB for Arrow output
+ARROW_BATCH_ROWS = 122880
+
+# Codecs accepted by COPY ... (FORMAT parquet, COMPRESSION ...)
+PARQUET_CODECS: tuple[str, ...] = (
+    "snappy", "zstd", "gzip", "brotli", "lz4", "lz4_raw", "uncompressed",
+)
+
+# DuckDB's own default Parquet codec
+DEFAULT_PARQUET_CODEC = "snappy"
 
 
 def _sql_escape(value: Union[str, Path]) -> str:
@@ -30,8 +82,18 @@ FALLBACK_CONFIGS: list[ConfigDict] = [
 # Common delimiters to check
 COMMON_DELIMITERS: list[str] = [",", ";", "|", "\t"]
 
+# Rows the dialect sniffer reads before a full scan (DuckDB's own default);
+# the whole file is only sniffed again if the locked-in dialect misbehaves.
+DEFAULT_SNIFF_SAMPLE_ROWS = 20480
+
+# Bytes from the head of a local file that fallback dialects are probed on
+FALLBACK_PROBE_SAMPLE_BYTES = 1024 * 1024
+
+# Bytes of a piped stage's output read up front to name its columns
+PIPE_HEAD_BYTES = 64 * 1024
+
 # SQL keywords that DuckDB prefixes with underscore when using normalize_names=true.
-# Only these are stripped by _fix_duckdb_keyword_prefix; user columns like _id are kept.
+# Only these are renamed back by _select_list; user columns like _id are kept.
 _DUCKDB_KEYWORD_SET: frozenset[str] = frozenset({
     "absolute", "action", "all", "alter", "and", "any", "as", "asc",
     "cascade", "case", "check", "column", "constraint", "create", "cross",
@@ -47,9 +109,17 @@ _DUCKDB_KEYWORD_SET: frozenset[str] = frozenset({
 })
 
 
-def _needs_zipfs(file_path: Union[Path, str]) -> bool:
-    """Return True if the input uses DuckDB zipfs paths."""
-    return isinstance(file_path, str) and file_path.startswith("zip://")
+def _select_list(normalize_names: bool) -> str:
+    """Return the SELECT list for normalized output.
+
+    With normalize_names, DuckDB-prefixed keywords (``_select``) are renamed
+    back (``select``) inside the query via a COLUMNS regex, so the header is
+    right as written and never needs patching afterwards.
+    """
+    if not normalize_names:
+        return "*"
+    keywords = "|".join(sorted(_DUCKDB_KEYWORD_SET))
+    return f"COLUMNS('^(?:_({keywords})|(.*))$') AS '\\1\\2'"
 
 
 def _compression_option(file_path: Union[Path, str]) -> str:
@@ -60,217 +130,909 @@ def _compression_option(file_path: Union[Path, str]) -> str:
     return ""
 
 
-def _ensure_zipfs_extension(
-    conn: duckdb.DuckDBPyConnection, file_path: Union[Path, str]
-) -> None:
-    """Install/load DuckDB zipfs extension when needed."""
-    if not _needs_zipfs(file_path):
-        return
+def _source_options(
+    file_path: Union[Path, str], encoding: Optional[str] = None
+) -> str:
+    """Return read_csv options for how the input is stored on disk.
 
-    try:
-        conn.execute("LOAD zipfs")
-    except duckdb.Error:
-        # Prefer community repo for zipfs if default repo doesn't have it.
-        try:
-            conn.execute("INSTALL zipfs FROM community")
-        except duckdb.Error:
-            conn.execute("INSTALL zipfs")
-        conn.execute("LOAD zipfs")
+    Combines the gzip compression option with ``encoding=`` for non-UTF-8
+    inputs that DuckDB decodes itself (see encoding.duckdb_encoding).
+    """
+    opts = [_compression_option(file_path)]
+    if encoding:
+        opts.append(f"encoding='{_sql_escape(encoding)}'")
+    return ", ".join(opt for opt in opts if opt)
 
 
 def _create_connection(
     file_path: Union[Path, str],
     is_remote: bool = False,
+    session: Optional[CsvnormSession] = None,
 ) -> duckdb.DuckDBPyConnection:
-    """Create DuckDB connection with zipfs and HTTP timeout setup."""
-    conn = duckdb.connect()
-    _ensure_zipfs_extension(conn, file_path)
-    if is_remote:
-        conn.execute("SET http_timeout=30000")
-    return conn
+    """Return a DuckDB connection prepared for reading file_path.
 
+    Uses the session's shared connection when one is given; otherwise opens
+    a private connection that the caller must close.
+    """
+    return (session or CsvnormSession()).prepare(file_path, is_remote)
 
-def validate_csv(
+
+def _sniff_dialect(
+    conn: duckdb.DuckDBPyConnection,
     file_path: Union[Path, str],
-    reject_file: Path,
+    read_opts: str,
+    sample_size: int,
+) -> Dialect:
+    """Discover the full dialect with one sniff_csv() call on sample_size rows.
+
+    ``sniff_csv`` runs with the same read options as the scan will, so
+    options already given (delim, skip, ...) are respected.
+    """
+    row = conn.execute(
+        "SELECT Delimiter, Quote, Escape, SkipRows, HasHeader, Columns FROM "
+        f"sniff_csv('{_sql_escape(file_path)}', {read_opts}, "
+        f"sample_size={sample_size})"
+    ).fetchone()
+    if row is None:
+        raise duckdb.InvalidInputException(f"Could not sniff dialect of {file_path}")
+    delim, quote, escape, skip, header, columns = row
+    return {
+        "delimiter": delim,
+        "quote": quote,
+        "escape": escape,
+        "skip": int(skip),
+        "header": bool(header),
+        "columns": [column["name"] for column in columns or []],
+    }
+
+
+def _same_dialect(a: Dialect, b: Dialect) -> bool:
+    """Return True if two dialects would read the file the same way."""
+    return (
+        a["delimiter"] == b["delimiter"]
+        and a["quote"] == b["quote"]
+        and a["escape"] == b["escape"]
+        and a["skip"] == b["skip"]
+        and a["header"] == b["header"]
+    )
+
+
+def _locked_opts(read_opts: str, dialect: Dialect, sample_size: int) -> str:
+    """Append a sniffed dialect to read_opts as explicit options.
+
+    Options already present in read_opts win. A quote the sample never
+    exercised is locked to ``"`` rather than disabled, so quoted fields
+    further down the file still parse.
+    """
+    quote = dialect["quote"]
+    locked = [read_opts]
+    if "delim=" not in read_opts:
+        locked.append(f"delim='{_sql_escape(dialect['delimiter'])}'")
+    if quote == "(empty)":
+        quote = '"'
+    locked.append(f"quote='{_sql_escape(quote)}'")
+    if dialect["escape"] != "(empty)":
+        locked.append(f"escape='{_sql_escape(dialect['escape'])}'")
+    if "skip=" not in read_opts:
+        locked.append(f"skip={dialect['skip']}")
+    locked.append(f"header={'true' if dialect['header'] else 'false'}")
+    locked.append(f"sample_size={sample_size}")
+    return ", ".join(locked)
+
+
+def _confident_dialect(
+    file_path: Path, encoding: Optional[str] = None
+) -> Optional[Dialect]:
+    """Return the sample-scored dialect of a local file if it is trusted.
+
+    Uses csvnorm.dialect on the head of the file; None when the guess is
+    below DIALECT_CONFIDENCE_THRESHOLD, so DuckDB sniffs instead.
+    """
+    guess = detect_dialect(file_path, encoding=encoding)
+    if guess is None or guess["confidence"] < DIALECT_CONFIDENCE_THRESHOLD:
+        return None
+    return {
+        "delimiter": guess["delimiter"],
+        "quote": guess["quote"],
+        "escape": guess["escape"],
+        "skip": guess["skip"],
+        "header": guess["header"],
+        "columns": [],
+    }
+
+
+def _hint_read_opts(config: Optional[ConfigDict], source_opts: str = "") -> str:
+    """Return read_csv options (without store_rejects) for a known dialect.
+
+    A recorded fallback config that needed ``ignore_errors`` or
+    ``strict_mode=false`` gets them again.
+    """
+    read_opts = "all_varchar=true"
+    if source_opts:
+        read_opts += f", {source_opts}"
+    if config and ("delim" in config or "strict_mode" in config):
+        read_opts += ", ignore_errors=true"
+    if config and config.get("strict_mode") is False:
+        read_opts += ", strict_mode=false"
+    return read_opts
+
+
+def _has_rejects(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Return True if the last scan stored any rejected rows."""
+    try:
+        row = conn.execute("SELECT COUNT(*) FROM reject_errors").fetchone()
+    except duckdb.Error:
+        return False
+    return bool(row and row[0])
+
+
+def _run_sampled_scan(
+    conn: duckdb.DuckDBPyConnection,
+    file_path: Union[Path, str],
+    run_scan: Callable[[str], None],
+    read_opts: str,
+    allow_rescan: bool = True,
+    dialect: Optional[Dialect] = None,
+) -> Optional[Dialect]:
+    """Run a scan with a dialect sniffed from a bounded sample.
+
+    The dialect is sniffed on DEFAULT_SNIFF_SAMPLE_ROWS rows (or taken from
+    ``dialect`` when already known) and passed explicitly to the full scan.
+    The sample is widened to the whole file only when that goes wrong: if
+    the sniff or scan fails with a non-I/O error, the scan is rerun with
+    ``sample_size=-1`` (errors from that propagate). If it succeeds but
+    rejects rows, the whole file is sniffed and the scan repeated when the
+    dialect differs. Repeating a scan that already ran is skipped unless
+    ``allow_rescan`` (output is not a stream).
+
+    Args:
+        conn: DuckDB connection.
+        file_path: Path to CSV file or URL string.
+        run_scan: Callable executing the scan for a given read_csv option string.
+        read_opts: read_csv options without dialect or sample_size.
+        allow_rescan: False when a completed scan cannot be repeated.
+        dialect: Dialect to lock in without sniffing, if already detected.
+
+    Returns:
+        The dialect the final scan was given, or None if it ran with
+        DuckDB's whole-file sniffing.
+    """
+    if dialect is None:
+        try:
+            dialect = _sniff_dialect(
+                conn, file_path, read_opts, DEFAULT_SNIFF_SAMPLE_ROWS
+            )
+        except duckdb.IOException:
+            raise
+        except duckdb.Error as e:
+            logger.debug(f"Sampled sniff failed ({e}); sniffing the whole file")
+            run_scan(f"{read_opts}, sample_size=-1")
+            return None
+
+    try:
+        run_scan(_locked_opts(read_opts, dialect, DEFAULT_SNIFF_SAMPLE_ROWS))
+    except duckdb.IOException:
+        raise
+    except duckdb.Error as e:
+        if not allow_rescan:
+            raise
+        logger.debug(f"Sampled dialect failed ({e}); sniffing the whole file")
+        _drop_reject_tables(conn)
+        run_scan(f"{read_opts}, sample_size=-1")
+        return None
+
+    if not allow_rescan or not _has_rejects(conn):
+        return dialect
+    return _rescan_if_widened(conn, file_path, run_scan, read_opts, dialect)
+
+
+def _rescan_if_widened(
+    conn: duckdb.DuckDBPyConnection,
+    file_path: Union[Path, str],
+    run_scan: Callable[[str], None],
+    read_opts: str,
+    dialect: Dialect,
+) -> Dialect:
+    """Re-sniff the whole file after a scan that rejected rows.
+
+    The scan is repeated only if the whole-file dialect differs from the
+    sampled one; returns the dialect of the scan that stands.
+    """
+    try:
+        widened = _sniff_dialect(conn, file_path, read_opts, -1)
+    except duckdb.Error as e:
+        logger.debug(f"Whole-file sniff failed ({e}); keeping sampled dialect")
+        return dialect
+    if _same_dialect(widened, dialect):
+        return dialect
+
+    logger.debug(f"Whole-file sniff found {widened}, sample found {dialect}; rescanning")
+    _drop_reject_tables(conn)
+    run_scan(_locked_opts(read_opts, widened, -1))
+    return widened
+
+
+def _scan_with_fallbacks(
+    conn: duckdb.DuckDBPyConnection,
+    file_path: Union[Path, str],
+    run_scan: Callable[[str], None],
     is_remote: bool = False,
     skip_rows: int = 0,
-) -> tuple[int, list[str], Optional[ConfigDict]]:
-    """Validate CSV file using DuckDB and export rejected rows.
+    allow_rescan: bool = True,
+    hint: Optional[tuple[Optional[ConfigDict], Dialect]] = None,
+    encoding: Optional[str] = None,
+) -> tuple[Optional[ConfigDict], Optional[Dialect]]:
+    """Run a full read_csv scan, cascading through fallback dialects.
+
+    Tries a known ``hint`` first (e.g. from the cache), then early-detected
+    config, then DuckDB sniffing, then FALLBACK_CONFIGS, then
+    strict_mode=false. Each attempt calls ``run_scan``
+    with the read_csv options to use; the scan itself (COUNT or COPY) is up
+    to the caller.
 
     Args:
-        file_path: Path to CSV file to validate or URL string.
-        reject_file: Path to write rejected rows.
+        conn: DuckDB connection (reject_errors accumulates here).
+        file_path: Path to CSV file or URL string.
+        run_scan: Callable executing the scan for a given read_csv option string.
         is_remote: True if file_path is a remote URL.
         skip_rows: Number of rows to skip at the beginning of the file (user-provided).
+        allow_rescan: False if a completed scan must not be repeated (output
+            is a stream), which disables re-sniffing after rejects and
+            moving on to the next dialect after a failed scan.
+        hint: (fallback_config, dialect) from an earlier run on the same
+            file; used without any detection, the cascade runs if it fails.
+        encoding: read_csv encoding for a non-UTF-8 file DuckDB decodes
+            itself; samples read in Python are decoded with it too.
 
     Returns:
-        Tuple of (reject_count, error_types, fallback_config) where:
-        - reject_count: number of lines in reject file
-        - error_types: list of up to 3 unique error reasons
-        - fallback_config: dict with 'delim' and 'skip' if fallback was used, None otherwise
+        Tuple of (fallback_config, dialect): the fallback config used (None
+        if standard sniffing succeeded) and the dialect locked into the
+        final scan (None if DuckDB sniffed the whole file itself).
     """
-    logger.debug(f"Validating CSV: {file_path}")
-
-    conn = _create_connection(file_path, is_remote)
     fallback_config: Optional[ConfigDict] = None
 
-    compression_opt = _compression_option(file_path)
+    source_opts = _source_options(file_path, encoding)
+
+    if hint is not None:
+        hint_config, hint_dialect = hint
+        read_opts = "store_rejects=true, " + _hint_read_opts(hint_config, source_opts)
+        try:
+            dialect = _run_sampled_scan(
+                conn, file_path, run_scan, read_opts, allow_rescan,
+                dialect=hint_dialect,
+            )
+            logger.debug(f"Known dialect succeeded: {hint_dialect}")
+            return hint_config, dialect
+        except duckdb.IOException:
+            raise
+        except duckdb.Error as e:
+            if not allow_rescan:
+                raise
+            logger.debug(f"Known dialect failed: {e}, detecting again")
+            _drop_reject_tables(conn)
 
     # Pre-check for header anomalies (local files only)
     # Skip early detection if user provided skip_rows
     suggested_config: Optional[ConfigDict] = None
     if skip_rows == 0 and not is_remote and isinstance(file_path, Path):
-        suggested_config = _detect_header_anomaly(file_path)
+        suggested_config = _detect_header_anomaly(file_path, encoding=encoding)
         if suggested_config:
             logger.info(f"Early detection suggests config: {suggested_config}")
 
+    # If early detection found anomaly, try that config first
+    if suggested_config:
+        logger.debug("Trying early-detected config before standard sniffing...")
+        try:
+            delim = suggested_config["delim"]
+            skip = suggested_config["skip"]
+            read_opts = (
+                f"delim='{delim}', skip={skip}, store_rejects=true, "
+                "ignore_errors=true, all_varchar=true"
+            )
+            if source_opts:
+                read_opts += f", {source_opts}"
+            dialect = _run_sampled_scan(
+                conn, file_path, run_scan, read_opts, allow_rescan
+            )
+            logger.info("Early-detected config succeeded")
+            return suggested_config, dialect
+        except duckdb.Error as e:
+            if not allow_rescan:
+                raise
+            logger.debug(f"Early-detected config failed: {e}, trying standard sniffing")
+
+    # Try standard automatic detection if early detection didn't work
     try:
+        # Read CSV with store_rejects to capture malformed rows
+        # Use all_varchar=true to avoid type inference failures
+        # Add user-provided skip_rows if specified
+        read_opts = "store_rejects=true, all_varchar=true"
+        if source_opts:
+            read_opts += f", {source_opts}"
+        if skip_rows > 0:
+            read_opts += f", skip={skip_rows}"
+            # Track that we used user-provided skip
+            fallback_config = {"delim": ",", "skip": skip_rows}
+
+        # A confidently scored local sample replaces DuckDB's sniff
+        dialect = None
+        if skip_rows == 0 and not is_remote and isinstance(file_path, Path):
+            dialect = _confident_dialect(file_path, encoding)
+            if dialect:
+                logger.debug(f"Using sample-scored dialect: {dialect}")
+
+        # Otherwise one sniff_csv() on a bounded sample; if it fails the
+        # fallbacks are probed without first reading the whole file
+        if dialect is None:
+            dialect = _sniff_dialect(
+                conn, file_path, read_opts, DEFAULT_SNIFF_SAMPLE_ROWS
+            )
 
-        # If early detection found anomaly, try that config first
-        if suggested_config:
-            logger.debug("Trying early-detected config before standard sniffing...")
+        dialect = _run_sampled_scan(
+            conn, file_path, run_scan, read_opts, allow_rescan, dialect=dialect
+        )
+        logger.debug("Standard CSV sniffing succeeded")
+        return fallback_config, dialect
+
+    except duckdb.Error as e:
+        if not allow_rescan:
+            raise
+        error_msg = str(e)
+        # Check if it's a dialect detection failure
+        if "sniffing" not in error_msg.lower() and "detect" not in error_msg.lower():
+            # Not a sniffing error, re-raise
+            raise
+
+    logger.debug(
+        "Standard sniffing failed, trying fallback configurations and strict_mode=false..."
+    )
+
+    # Create fallback configs based on user-provided skip_rows
+    # If skip_rows > 0, use it; otherwise use predefined FALLBACK_CONFIGS
+    if skip_rows > 0:
+        # User provided skip_rows, try different delimiters with user's skip
+        fallback_configs: list[ConfigDict] = [
+            {"delim": delim, "skip": skip_rows} for delim in COMMON_DELIMITERS
+        ]
+    else:
+        # Use predefined fallback configs
+        fallback_configs = FALLBACK_CONFIGS
+
+    # Pick the best fallback configuration, then scan the file once with it
+    config = _probe_fallback_configs(conn, file_path, fallback_configs, encoding)
+    if config is not None:
+        logger.info(f"Fallback succeeded with config: {config}")
+
+        # Use both store_rejects and ignore_errors to handle malformed rows
+        delim = config["delim"]
+        skip = config["skip"]
+        read_opts = (
+            f"delim='{delim}', skip={skip}, store_rejects=true, "
+            "ignore_errors=true, all_varchar=true"
+        )
+        if source_opts:
+            read_opts += f", {source_opts}"
+        dialect = _run_sampled_scan(
+            conn, file_path, run_scan, read_opts, allow_rescan
+        )
+        return config, dialect
+
+    # If delimiter fallbacks fail, try strict_mode=false
+    # (no fallback worked: any error here propagates to the caller)
+    strict_opts = "store_rejects=true, all_varchar=true"
+    if source_opts:
+        strict_opts += f", {source_opts}"
+    if skip_rows > 0:
+        strict_opts += f", skip={skip_rows}"
+    strict_opts += ", ignore_errors=true, strict_mode=false"
+
+    dialect = _run_sampled_scan(conn, file_path, run_scan, strict_opts, allow_rescan)
+    logger.info("Strict mode disabled; sniffing succeeded")
+    if skip_rows > 0:
+        return {"delim": ",", "skip": skip_rows, "strict_mode": False}, dialect
+    return {"strict_mode": False}, dialect
+
+
+def _stage_columns(
+    conn: duckdb.DuckDBPyConnection,
+    stage: FifoStage,
+    read_opts: str,
+    dialect: Dialect,
+    names_opt: str,
+) -> Optional[list[str]]:
+    """Return the column names DuckDB gives a stage's output, from its head.
+
+    DuckDB only reads a pipe in one pass with ``auto_detect=false``, which
+    needs explicit columns. They come from a DESCRIBE over the first
+    PIPE_HEAD_BYTES of the stage's output, written to ``stage.path`` and
+    removed again. None when the head holds no complete line.
+    """
+    head = stage.head(PIPE_HEAD_BYTES)
+    if len(head) == PIPE_HEAD_BYTES:
+        head = head[: head.rfind(b"\n") + 1]
+    if not head:
+        return None
+
+    stage.path.write_bytes(head)
+    try:
+        rows = conn.execute(
+            f"DESCRIBE SELECT * FROM read_csv('{_sql_escape(stage.path)}', "
+            f"{_locked_opts(read_opts, dialect, -1)}{names_opt})"
+        ).fetchall()
+    finally:
+        stage.path.unlink()
+    return [str(row[0]) for row in rows]
+
+
+def _scan_stage(
+    conn: duckdb.DuckDBPyConnection,
+    stage: FifoStage,
+    run_scan: Callable[[str], None],
+    skip_rows: int = 0,
+    allow_rescan: bool = True,
+    hint: Optional[tuple[Optional[ConfigDict], Dialect]] = None,
+    encoding: Optional[str] = None,
+    normalize_names: bool = False,
+) -> tuple[Optional[ConfigDict], Optional[Dialect]]:
+    """Scan the output of a pre-processing stage, through a pipe if possible.
+
+    A pipe is read once, so it is only used when the dialect is known before
+    DuckDB reads anything: from ``hint`` or from the sample scorer run on
+    the stage's input. Column names are taken from the stage's head (see
+    _stage_columns), then the stage streams into a single scan with
+    ``auto_detect=false``. If that scan rejects rows and ``allow_rescan``,
+    the stage is written to ``stage.path`` and the whole file re-sniffed;
+    the scan is repeated only when that finds a different dialect.
+
+    Anything else that would need a second read falls back to writing the
+    stage to ``stage.path`` and running the normal cascade on it: no trusted
+    dialect, no complete line in the head, or (when ``allow_rescan``) a
+    failed scan.
+
+    Args:
+        conn: DuckDB connection.
+        stage: Stage producing the file to scan at ``stage.path``.
+        run_scan: Callable executing the scan for a given read_csv option
+            string; it must read ``stage.path``.
+        skip_rows: As _scan_with_fallbacks (the pipe is not used when > 0).
+        allow_rescan: As _scan_with_fallbacks.
+        hint: As _scan_with_fallbacks.
+        encoding: As _scan_with_fallbacks.
+        normalize_names: True if run_scan reads with normalize_names=true,
+            so the explicit column names match.
+
+    Returns:
+        As _scan_with_fallbacks.
+    """
+    known = hint
+    if known is None and skip_rows == 0:
+        dialect = _confident_dialect(stage.source, stage.source_encoding)
+        if dialect is not None:
+            known = (None, dialect)
+
+    if known is not None and fifo_supported():
+        config, dialect = known
+        read_opts = _hint_read_opts(config)
+        names_opt = ", normalize_names=true" if normalize_names else ""
+        columns: Optional[list[str]] = None
+        try:
+            columns = _stage_columns(conn, stage, read_opts, dialect, names_opt)
+        except duckdb.Error as e:
+            logger.debug(f"Could not name piped columns ({e}); using a temp file")
+
+        if columns:
+            struct = ", ".join(f"'{_sql_escape(name)}': 'VARCHAR'" for name in columns)
+            scan_opts = f"store_rejects=true, {read_opts}"
+            piped_opts = (
+                f"{_locked_opts(scan_opts, dialect, DEFAULT_SNIFF_SAMPLE_ROWS)}, "
+                f"auto_detect=false, columns={{{struct}}}"
+            )
             try:
-                delim = suggested_config["delim"]
-                skip = suggested_config["skip"]
-                # Use COUNT(*) instead of COPY TO /dev/null to avoid locking issues
-                read_opts = (
-                    f"delim='{delim}', skip={skip}, store_rejects=true, "
-                    "ignore_errors=true, sample_size=-1, all_varchar=true"
+                with stage:
+                    run_scan(piped_opts)
+            except (duckdb.Error, OSError, ValueError) as e:
+                if not allow_rescan:
+                    raise
+                logger.debug(f"Piped scan failed ({e}); re-reading from a temp file")
+                _drop_reject_tables(conn)
+            else:
+                if not allow_rescan or not _has_rejects(conn):
+                    return config, dialect
+                logger.debug("Piped scan rejected rows; sniffing the whole output")
+                stage.materialize()
+                return config, _rescan_if_widened(
+                    conn, stage.path, run_scan, scan_opts, dialect
                 )
-                if compression_opt:
-                    read_opts += f", {compression_opt}"
-                conn.execute(f"""
-                    SELECT COUNT(*) FROM read_csv(
-                        '{_sql_escape(file_path)}',
-                        {read_opts}
-                    )
-                """).fetchall()
-                fallback_config = suggested_config
-                logger.info("Early-detected config succeeded")
-            except duckdb.Error as e:
-                logger.debug(f"Early-detected config failed: {e}, trying standard sniffing")
-                suggested_config = None  # Fall through to standard sniffing
-
-        # Try standard automatic detection if early detection didn't work
-        if not suggested_config:
-            try:
-                # Read CSV with store_rejects to capture malformed rows
-                # Use all_varchar=true to avoid type inference failures
-                # Add user-provided skip_rows if specified
-                read_opts = "store_rejects=true, sample_size=-1, all_varchar=true"
-                if compression_opt:
-                    read_opts += f", {compression_opt}"
-                if skip_rows > 0:
-                    read_opts += f", skip={skip_rows}"
-                    # Track that we used user-provided skip
-                    fallback_config = {"delim": ",", "skip": skip_rows}
-
-                # Use COUNT(*) instead of COPY TO /dev/null to avoid locking issues
-                conn.execute(f"""
-                    SELECT COUNT(*) FROM read_csv(
-                        '{_sql_escape(file_path)}',
-                        {read_opts}
-                    )
-                """).fetchall()
-                logger.debug("Standard CSV sniffing succeeded")
 
-            except duckdb.Error as e:
-                error_msg = str(e)
-                # Check if it's a dialect detection failure
-                if "sniffing" in error_msg.lower() or "detect" in error_msg.lower():
-                    logger.debug(
-                        "Standard sniffing failed, trying fallback configurations and strict_mode=false..."
-                    )
+    stage.materialize()
+    return _scan_with_fallbacks(
+        conn, stage.path, run_scan, skip_rows=skip_rows,
+        allow_rescan=allow_rescan, hint=hint, encoding=encoding,
+    )
 
-                    # Create fallback configs based on user-provided skip_rows
-                    # If skip_rows > 0, use it; otherwise use predefined FALLBACK_CONFIGS
-                    if skip_rows > 0:
-                        # User provided skip_rows, try different delimiters with user's skip
-                        fallback_configs: list[ConfigDict] = [
-                            {"delim": delim, "skip": skip_rows}
-                            for delim in COMMON_DELIMITERS
-                        ]
-                    else:
-                        # Use predefined fallback configs
-                        fallback_configs = FALLBACK_CONFIGS
-
-                    # Try each fallback configuration
-                    success = False
-                    for config in fallback_configs:
-                        logger.debug(f"Trying config: {config}")
-                        if _try_read_csv_with_config(conn, file_path, config):
-                            logger.info(f"Fallback succeeded with config: {config}")
-                            fallback_config = config
-                            success = True
-
-                            # Now do the actual validation with this config
-                            # Use both store_rejects and ignore_errors to handle malformed rows
-                            delim = config["delim"]
-                            skip = config["skip"]
-                            # Use COUNT(*) instead of COPY TO /dev/null to avoid locking issues
-                            read_opts = (
-                                f"delim='{delim}', skip={skip}, store_rejects=true, "
-                                "ignore_errors=true, sample_size=-1, all_varchar=true"
-                            )
-                            if compression_opt:
-                                read_opts += f", {compression_opt}"
-                            conn.execute(f"""
-                                SELECT COUNT(*) FROM read_csv(
-                                    '{_sql_escape(file_path)}',
-                                    {read_opts}
-                                )
-                            """).fetchall()
-                            break
-
-                    if not success:
-                        # If delimiter fallbacks fail, try strict_mode=false
-                        try:
-                            strict_opts = "store_rejects=true, sample_size=-1, all_varchar=true"
-                            if compression_opt:
-                                strict_opts += f", {compression_opt}"
-                            if skip_rows > 0:
-                                strict_opts += f", skip={skip_rows}"
-                            strict_opts += ", ignore_errors=true, strict_mode=false"
-
-                            conn.execute(f"""
-                                SELECT COUNT(*) FROM read_csv(
-                                    '{_sql_escape(file_path)}',
-                                    {strict_opts}
-                                )
-                            """).fetchall()
-                            logger.info("Strict mode disabled; sniffing succeeded")
-                            if skip_rows > 0:
-                                fallback_config = {
-                                    "delim": ",",
-                                    "skip": skip_rows,
-                                    "strict_mode": False,
-                                }
-                            else:
-                                fallback_config = {"strict_mode": False}
-                        except duckdb.Error:
-                            # No fallback worked, re-raise original error
-                            raise
-                else:
-                    # Not a sniffing error, re-raise
-                    raise
 
-        # Export rejected rows to file
+def _export_rejects(
+    conn: duckdb.DuckDBPyConnection, reject_file: Optional[Path]
+) -> RejectStats:
+    """Aggregate reject_errors in SQL and export rejected rows if any.
+
+    Counts and sample messages come from a ``GROUP BY error_type`` over the
+    in-memory table, so the exported file is never read back. When nothing
+    was rejected no file is written (and a stale one is removed).
+
+    Args:
+        conn: DuckDB connection holding the reject_errors table.
+        reject_file: Path to write rejected rows (None: only count them).
+
+    Returns:
+        RejectStats with the rejected row count, up to 3 sample error
+        messages (most frequent error types first) and per-type counts.
+    """
+    rows = conn.execute("""
+        SELECT CAST(error_type AS VARCHAR), COUNT(*) AS n, MIN(error_message)
+        FROM reject_errors
+        GROUP BY error_type
+        ORDER BY n DESC, 1
+    """).fetchall()
+
+    error_counts = {error_type: int(count) for error_type, count, _ in rows}
+    reject_count = sum(error_counts.values())
+    error_types = [message for _, _, message in rows if message][:3]
+    logger.debug(f"Rejected rows: {reject_count} {error_counts}")
+
+    if reject_file is not None and reject_count:
         conn.execute(f"COPY (FROM reject_errors) TO '{_sql_escape(reject_file)}'")
+    elif reject_file is not None and reject_file.exists():
+        reject_file.unlink()
+
+    return {
+        "reject_count": reject_count,
+        "error_types": error_types,
+        "error_counts": error_counts,
+    }
+
+
+def validate_csv(
+    file_path: Union[Path, str],
+    reject_file: Path,
+    is_remote: bool = False,
+    skip_rows: int = 0,
+    session: Optional[CsvnormSession] = None,
+    known_dialect: Optional[tuple[Optional[ConfigDict], Dialect]] = None,
+    encoding: Optional[str] = None,
+    stage: Optional[FifoStage] = None,
+) -> tuple[RejectStats, Optional[ConfigDict]]:
+    """Validate CSV file using DuckDB and export rejected rows.
+
+    Read-only: scans the file with COUNT(*) and writes no normalized output.
+
+    Args:
+        file_path: Path to CSV file to validate or URL string.
+        reject_file: Path to write rejected rows.
+        is_remote: True if file_path is a remote URL.
+        skip_rows: Number of rows to skip at the beginning of the file (user-provided).
+        session: Shared session to run on (and record the dialect in); a
+            private connection is used when None.
+        known_dialect: (fallback_config, dialect) recorded by an earlier run
+            on this file; tried first, with no detection or sniffing.
+        encoding: read_csv encoding (``latin-1``, ``utf-16``) when DuckDB
+            decodes a non-UTF-8 file itself; None for UTF-8 input.
+        stage: Pre-processing stage that produces file_path and has not
+            run yet; it is streamed through a named pipe when one scan is
+            enough (see _scan_stage), else written to file_path first.
+
+    Returns:
+        Tuple of (reject_stats, fallback_config) where:
+        - reject_stats: rejected row count, sample error reasons and per-type counts
+        - fallback_config: dict with 'delim' and 'skip' if fallback was used, None otherwise
+    """
+    logger.debug(f"Validating CSV: {file_path}")
+
+    conn = _create_connection(file_path, is_remote, session)
+
+    def _count_scan(read_opts: str) -> None:
+        # Use COUNT(*) instead of COPY TO /dev/null to avoid locking issues
+        conn.execute(f"""
+            SELECT COUNT(*) FROM read_csv(
+                '{_sql_escape(file_path)}',
+                {read_opts}
+            )
+        """).fetchall()
+
+    try:
+        if stage is not None:
+            fallback_config, read_dialect = _scan_stage(
+                conn, stage, _count_scan, skip_rows=skip_rows,
+                hint=known_dialect, encoding=encoding,
+            )
+        else:
+            fallback_config, read_dialect = _scan_with_fallbacks(
+                conn, file_path, _count_scan, is_remote=is_remote,
+                skip_rows=skip_rows, hint=known_dialect, encoding=encoding,
+            )
+
+        reject_stats = _export_rejects(conn, reject_file)
+
+    finally:
+        if session is None:
+            conn.close()
+
+    if session is not None:
+        session.dialect = fallback_config
+        session.read_dialect = read_dialect
+    return reject_stats, fallback_config
+
+
+def validate_and_normalize_csv(
+    file_path: Union[Path, str],
+    output_path: Path,
+    reject_file: Path,
+    delimiter: str = ",",
+    normalize_names: bool = True,
+    is_remote: bool = False,
+    skip_rows: int = 0,
+    session: Optional[CsvnormSession] = None,
+    per_thread_output: bool = False,
+    known_dialect: Optional[tuple[Optional[ConfigDict], Dialect]] = None,
+    encoding: Optional[str] = None,
+    stage: Optional[FifoStage] = None,
+    output_format: str = "csv",
+    parquet: Optional[ParquetOptions] = None,
+) -> tuple[RejectStats, Optional[ConfigDict], OutputStats]:
+    """Validate and normalize a CSV file in a single DuckDB scan.
+
+    Runs one ``COPY (SELECT ...) TO`` with ``store_rejects=true`` so the
+    normalized output and the reject table come from the same pass over the
+    input, instead of a validation COUNT followed by a second full read.
+    The output is never re-read, so ``output_path`` may be a stream such as
+    ``/dev/stdout``.
+
+    Args:
+        file_path: Path to CSV file or URL string.
+        output_path: Path for normalized output file.
+        reject_file: Path to write rejected rows.
+        delimiter: Output field delimiter.
+        normalize_names: If True, convert column names to snake_case.
+        is_remote: True if file_path is a remote URL.
+        skip_rows: Number of rows to skip at the beginning of the file (user-provided).
+        session: Shared session to run on (and record the dialect in); a
+            private connection is used when None.
+        per_thread_output: If True, output_path is a directory and each DuckDB
+            thread writes its own part file (row order across parts is not
+            kept). Use with preserve_insertion_order=false.
+        known_dialect: As validate_csv.
+        encoding: As validate_csv.
+        stage: As validate_csv.
+        output_format: One of OUTPUT_FORMATS; the delimiter only applies
+            to ``csv``. ``arrow`` and ``feather`` need pyarrow.
+        parquet: Parquet writer settings (None: DuckDB's defaults).
+
+    Returns:
+        Tuple of (reject_stats, fallback_config, output_stats). The first
+        two are as validate_csv; output_stats holds row_count
+        (rows reported by the COPY), column_count and columns (the written
+        header, empty when output_path is a stream).
+    """
+    logger.debug(f"Validating and normalizing CSV: {file_path} -> {output_path}")
+
+    conn = _create_connection(file_path, is_remote, session)
+
+    copy_opts = _build_copy_opts(
+        delimiter, per_thread_output=per_thread_output,
+        output_format=output_format, parquet=parquet,
+    )
+    names_opt = ", normalize_names=true" if normalize_names else ""
+    select_list = _select_list(normalize_names)
+    row_count = 0
+
+    def _copy_scan(read_opts: str) -> None:
+        nonlocal row_count
+        row_count = _write_output(
+            conn,
+            f"SELECT {select_list} FROM read_csv("
+            f"'{_sql_escape(file_path)}', {read_opts}{names_opt})",
+            output_path,
+            copy_opts,
+            output_format,
+        )
+
+    allow_rescan = output_path.is_file() or not output_path.exists()
+    try:
+        if stage is not None:
+            try:
+                fallback_config, read_dialect = _scan_stage(
+                    conn, stage, _copy_scan, skip_rows=skip_rows,
+                    allow_rescan=allow_rescan, hint=known_dialect,
+                    encoding=encoding, normalize_names=normalize_names,
+                )
+            except (OSError, ValueError):
+                # The stage failed mid-stream: do not leave truncated output
+                if output_path.is_file():
+                    output_path.unlink()
+                raise
+        else:
+            fallback_config, read_dialect = _scan_with_fallbacks(
+                conn, file_path, _copy_scan, is_remote=is_remote,
+                skip_rows=skip_rows, allow_rescan=allow_rescan,
+                hint=known_dialect, encoding=encoding,
+            )
+
+        reject_stats = _export_rejects(conn, reject_file)
+        columns = _describe_output_columns(
+            conn, output_path, delimiter, output_format
+        )
 
     finally:
-        conn.close()
+        if session is None:
+            conn.close()
+
+    if session is not None:
+        session.dialect = fallback_config
+        session.read_dialect = read_dialect
+
+    logger.debug(f"Normalized file written to: {output_path} ({row_count} rows)")
+
+    output_stats: OutputStats = {
+        "row_count": row_count,
+        "column_count": len(columns),
+        "columns": columns,
+    }
+    return reject_stats, fallback_config, output_stats
+
+
+def _describe_output_columns(
+    conn: duckdb.DuckDBPyConnection,
+    output_path: Path,
+    delimiter: str,
+    output_format: str = "csv",
+) -> list[str]:
+    """Return the column names of a normalized output file.
+
+    Only the header is bound (explicit dialect, sample_size=1), so this costs
+    a single line read rather than a scan; for Parquet and Arrow only the
+    schema is read. For a per-thread output directory the first part file
+    is described. Streams such as ``/dev/stdout`` cannot be re-read and
+    yield an empty list.
+    """
+    if output_path.is_dir():
+        parts = sorted(output_path.glob(f"*.{output_format}"))
+        if not parts:
+            return []
+        output_path = parts[0]
+    elif not output_path.is_file():
+        return []
+
+    if output_format in ARROW_FORMATS:
+        pa = _import_pyarrow()
+        open_reader = pa.ipc.open_file if output_format == "feather" else pa.ipc.open_stream
+        with pa.OSFile(str(output_path)) as source_file:
+            return list(open_reader(source_file).schema.names)
+
+    if output_format == "parquet":
+        source = f"read_parquet('{_sql_escape(output_path)}')"
+    else:
+        source = (
+            f"read_csv('{_sql_escape(output_path)}', "
+            f"delim='{_sql_escape(delimiter)}', quote='\"', header=true, "
+            "all_varchar=true, sample_size=1)"
+        )
+    try:
+        rows = conn.execute(
+            f"SELECT column_name FROM (DESCRIBE SELECT * FROM {source})"
+        ).fetchall()
+    except duckdb.Error as e:
+        logger.debug(f"Could not describe output columns: {e}")
+        return []
+    return [row[0] for row in rows]
+
+
+def _build_copy_opts(
+    delimiter: str,
+    per_thread_output: bool = False,
+    output_format: str = "csv",
+    parquet: Optional[ParquetOptions] = None,
+) -> str:
+    """Build DuckDB COPY options for the normalized output.
+
+    per_thread_output writes a directory of part files, replacing any existing
+    one (callers refuse an existing output path unless forced). ``parquet``
+    is only used when output_format is ``parquet`` (None: snappy, DuckDB's
+    default level and row group size). Arrow formats are not written by
+    COPY and get no options.
+    """
+    if output_format in ARROW_FORMATS:
+        return ""
+    if output_format == "parquet":
+        parquet = parquet or {
+            "codec": DEFAULT_PARQUET_CODEC,
+            "compression_level": None,
+            "row_group_size": None,
+        }
+        if parquet["codec"] not in PARQUET_CODECS:
+            raise ValueError(f"Unknown Parquet codec: {parquet['codec']}")
+        copy_opts = f"format parquet, compression {parquet['codec']}"
+        if parquet["compression_level"] is not None:
+            copy_opts += f", compression_level {int(parquet['compression_level'])}"
+        if parquet["row_group_size"] is not None:
+            copy_opts += f", row_group_size {int(parquet['row_group_size'])}"
+    elif output_format == "csv":
+        copy_opts = "header true, format csv"
+        if delimiter != ",":
+            copy_opts += f", delimiter '{delimiter}'"
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if per_thread_output:
+        copy_opts += ", per_thread_output true, overwrite true"
+    return copy_opts
+
+
+def _import_pyarrow() -> Any:
+    """Return pyarrow (with pyarrow.ipc loaded), which Arrow output needs.
+
+    Raises:
+        ImportError: If pyarrow is not installed, with how to install it.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Arrow output needs pyarrow: pip install 'csvnorm[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _arrow_reader(result: duckdb.DuckDBPyConnection, batch_size: int) -> Any:
+    """Return a pyarrow RecordBatchReader streaming a pending DuckDB result."""
+    if hasattr(result, "to_arrow_reader"):
+        return result.to_arrow_reader(batch_size)
+    # duckdb < 1.4
+    return result.fetch_record_batch(batch_size)
+
 
-    # Check if there are rejected rows (more than just header)
-    reject_count = _count_lines(reject_file)
-    logger.debug(f"Reject file lines: {reject_count}")
+def _write_arrow(
+    conn: duckdb.DuckDBPyConnection,
+    select_sql: str,
+    output_path: Path,
+    output_format: str,
+    batch_size: int = ARROW_BATCH_ROWS,
+) -> int:
+    """Stream a query's record batches into an Arrow IPC stream or file.
 
-    # Collect sample error types from reject file
-    error_types = []
-    if reject_count > 1:
-        error_types = _get_error_types(reject_file)
+    Batches are handed from DuckDB to the pyarrow writer as they are
+    produced, without conversion; returns the number of rows written.
+    """
+    pa = _import_pyarrow()
+    reader = _arrow_reader(conn.execute(select_sql), batch_size)
+    new_writer = pa.ipc.new_file if output_format == "feather" else pa.ipc.new_stream
+    rows = 0
+    with new_writer(str(output_path), reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def _write_output(
+    conn: duckdb.DuckDBPyConnection,
+    select_sql: str,
+    output_path: Path,
+    copy_opts: str,
+    output_format: str = "csv",
+) -> int:
+    """Write the normalized SELECT to output_path; return the rows written.
 
-    return reject_count, error_types, fallback_config
+    CSV and Parquet are written by ``COPY ... TO`` with copy_opts, Arrow
+    formats by _write_arrow.
+    """
+    if output_format in ARROW_FORMATS:
+        logger.debug(f"DuckDB query ({output_format} output): {select_sql}")
+        return _write_arrow(conn, select_sql, output_path, output_format)
+
+    query = f"COPY ({select_sql}) TO '{_sql_escape(output_path)}' ({copy_opts})"
+    logger.debug(f"DuckDB query: {query}")
+    result = conn.execute(query).fetchone()
+    return int(result[0]) if result else 0
 
 
 def normalize_csv(
@@ -282,9 +1044,17 @@ def normalize_csv(
     skip_rows: int = 0,
     fallback_config: Optional[ConfigDict] = None,
     reject_file: Optional[Path] = None,
+    session: Optional[CsvnormSession] = None,
+    dialect: Optional[Dialect] = None,
+    encoding: Optional[str] = None,
+    output_format: str = "csv",
+    parquet: Optional[ParquetOptions] = None,
 ) -> Optional[ConfigDict]:
     """Normalize CSV file using DuckDB.
 
+    With a known dialect the scan is given it explicitly and does no
+    sniffing; otherwise DuckDB sniffs the whole file.
+
     Args:
         input_path: Path to input CSV file or URL string.
         output_path: Path for normalized output file.
@@ -294,22 +1064,35 @@ def normalize_csv(
         skip_rows: Number of rows to skip at the beginning of the file (user-provided).
         fallback_config: Optional fallback configuration from validate_csv.
         reject_file: Optional path to write rejected rows (for fallback mode).
+        session: Shared session to run on; its recorded fallback config and
+            dialect are used when fallback_config is None. A private
+            connection is used when None.
+        dialect: Dialect discovered by validation (e.g. session.read_dialect).
+        encoding: read_csv encoding when DuckDB decodes the input itself.
+        output_format: One of OUTPUT_FORMATS; the delimiter only applies
+            to ``csv``. ``arrow`` and ``feather`` need pyarrow.
+        parquet: Parquet writer settings (None: DuckDB's defaults).
 
     Returns:
         Fallback config used if different from input, None otherwise.
     """
     logger.debug(f"Normalizing CSV: {input_path} -> {output_path}")
 
-    conn = _create_connection(input_path, is_remote)
+    if fallback_config is None and session is not None:
+        fallback_config = session.dialect
+        if dialect is None:
+            dialect = session.read_dialect
+
+    conn = _create_connection(input_path, is_remote, session)
     used_fallback_config: Optional[ConfigDict] = None
 
-    compression_opt = _compression_option(input_path)
+    source_opts = _source_options(input_path, encoding)
 
     try:
         # Build read options
-        read_opts = "sample_size=-1, all_varchar=true"
-        if compression_opt:
-            read_opts += f", {compression_opt}"
+        read_opts = "all_varchar=true"
+        if source_opts:
+            read_opts += f", {source_opts}"
         if normalize_names:
             read_opts += ", normalize_names=true"
 
@@ -343,21 +1126,31 @@ def normalize_csv(
         if fallback_config and fallback_config.get("strict_mode") is False:
             read_opts += ", strict_mode=false"
 
+        if dialect is not None:
+            read_opts = _locked_opts(read_opts, dialect, DEFAULT_SNIFF_SAMPLE_ROWS)
+        else:
+            read_opts += ", sample_size=-1"
+
         # Build copy options
-        copy_opts = "header true, format csv"
-        if delimiter != ",":
-            copy_opts += f", delimiter '{delimiter}'"
+        copy_opts = _build_copy_opts(
+            delimiter, output_format=output_format, parquet=parquet
+        )
+        select_list = _select_list(normalize_names)
+
+        def _write(read_opts: str) -> None:
+            select_sql = (
+                f"SELECT {select_list} FROM read_csv('{_sql_escape(input_path)}', {read_opts})"
+            )
+            if output_format in ARROW_FORMATS:
+                _write_arrow(conn, select_sql, output_path, output_format)
+                return
+            query = f"COPY ({select_sql}) TO '{_sql_escape(output_path)}' ({copy_opts})"
+            logger.debug(f"DuckDB query: {query}")
+            conn.execute(query)
 
         # Try to normalize with current config
         try:
-            query = f"""
-                COPY (
-                    SELECT * FROM read_csv('{_sql_escape(input_path)}', {read_opts})
-                ) TO '{_sql_escape(output_path)}' ({copy_opts})
-            """
-
-            logger.debug(f"DuckDB query: {query}")
-            conn.execute(query)
+            _write(read_opts)
 
         except duckdb.Error as e:
             error_msg = str(e)
@@ -377,7 +1170,9 @@ def normalize_csv(
                 success = False
                 for config in FALLBACK_CONFIGS:
                     logger.debug(f"Trying config: {config}")
-                    if _try_read_csv_with_config(conn, input_path, config, all_varchar=True):
+                    if _try_read_csv_with_config(
+                        conn, input_path, config, all_varchar=True, encoding=encoding
+                    ):
                         logger.info(f"Fallback succeeded with config: {config}")
 
                         # Rebuild read options with fallback config
@@ -386,7 +1181,7 @@ def normalize_csv(
                         skip = config["skip"]
                         read_opts = (
                             "sample_size=-1, all_varchar=true"
-                            f"{', ' + compression_opt if compression_opt else ''}, "
+                            f"{', ' + source_opts if source_opts else ''}, "
                             f"delim='{delim}', skip={skip}"
                         )
 
@@ -400,14 +1195,8 @@ def normalize_csv(
                         if normalize_names:
                             read_opts += ", normalize_names=true"
 
-                        query = f"""
-                            COPY (
-                                SELECT * FROM read_csv('{_sql_escape(input_path)}', {read_opts})
-                            ) TO '{_sql_escape(output_path)}' ({copy_opts})
-                        """
-
-                        logger.debug(f"DuckDB query with fallback: {query}")
-                        conn.execute(query)
+                        logger.debug("Writing output with fallback config")
+                        _write(read_opts)
 
                         # Export reject_errors if using store_rejects
                         if reject_file:
@@ -422,13 +1211,8 @@ def normalize_csv(
                     # Try strict_mode=false as last resort
                     try:
                         read_opts_strict = f"{read_opts}, strict_mode=false"
-                        query = f"""
-                            COPY (
-                                SELECT * FROM read_csv('{_sql_escape(input_path)}', {read_opts_strict})
-                            ) TO '{_sql_escape(output_path)}' ({copy_opts})
-                        """
-                        logger.debug(f"DuckDB query with strict_mode=false: {query}")
-                        conn.execute(query)
+                        logger.debug("Writing output with strict_mode=false")
+                        _write(read_opts_strict)
                         used_fallback_config = {"strict_mode": False}
                     except duckdb.Error:
                         raise
@@ -436,63 +1220,197 @@ def normalize_csv(
                 raise
 
     finally:
-        conn.close()
-
-    if normalize_names:
-        _fix_duckdb_keyword_prefix(output_path)
+        if session is None:
+            conn.close()
 
     logger.debug(f"Normalized file written to: {output_path}")
 
     return used_fallback_config
 
 
-def _fix_duckdb_keyword_prefix(file_path: Path) -> None:
-    """Remove underscore prefix from DuckDB-prefixed SQL keywords in header.
-
-    DuckDB's normalize_names option prefixes SQL keywords with an underscore to
-    avoid conflicts. This function removes those prefixes from the header row only.
-    Only known DuckDB keywords are stripped; user columns like ``_id`` are preserved.
+def normalize_to_arrow(
+    file_path: Union[Path, str],
+    reject_file: Optional[Path] = None,
+    normalize_names: bool = True,
+    is_remote: bool = False,
+    skip_rows: int = 0,
+    session: Optional[CsvnormSession] = None,
+    known_dialect: Optional[tuple[Optional[ConfigDict], Dialect]] = None,
+    encoding: Optional[str] = None,
+    as_reader: bool = False,
+    batch_size: int = ARROW_BATCH_ROWS,
+) -> tuple[Any, Optional[RejectStats]]:
+    """Normalize a CSV file into Arrow record batches instead of a file.
+
+    The scan is the one validate_and_normalize_csv runs (fallback dialects,
+    all-VARCHAR columns, normalized names, reject capture), but DuckDB's
+    Arrow batches are handed to the caller as they are, without being
+    serialized and read back. Needs pyarrow.
+
+    By default the scan runs to completion and a ``pyarrow.Table`` over its
+    batches is returned with the reject stats. With ``as_reader`` a
+    ``pyarrow.RecordBatchReader`` is returned instead and the scan runs as
+    it is consumed. It reads from the session's connection, which must not
+    run anything else until the reader is exhausted; rejects then land in
+    the session's reject_errors table. Since such a scan cannot be
+    repeated, a failed attempt is raised rather than followed by the next
+    fallback dialect (as for a streamed output).
 
     Args:
-        file_path: Path to CSV file to fix.
+        file_path: Path to CSV file or URL string.
+        reject_file: Path to write rejected rows (None: only count them).
+            Unused with ``as_reader``.
+        normalize_names: If True, convert column names to snake_case.
+        is_remote: True if file_path is a remote URL.
+        skip_rows: Number of rows to skip at the beginning of the file (user-provided).
+        session: Shared session to run on (and record the dialect in);
+            required with ``as_reader``.
+        known_dialect: As validate_csv.
+        encoding: As validate_csv.
+        as_reader: Return a RecordBatchReader rather than a Table.
+        batch_size: Rows per record batch.
+
+    Returns:
+        Tuple of (table_or_reader, reject_stats); reject_stats is None with
+        ``as_reader``.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If ``as_reader`` is set without a session.
     """
-    with open(file_path, "r") as f:
-        first_line = f.readline()
-        rest = f.read()
+    _import_pyarrow()
+    if as_reader and session is None:
+        raise ValueError("as_reader needs a session to read the batches from")
+    logger.debug(f"Normalizing CSV to Arrow: {file_path}")
+
+    conn = _create_connection(file_path, is_remote, session)
+    names_opt = ", normalize_names=true" if normalize_names else ""
+    select_list = _select_list(normalize_names)
+    arrow_result: Any = None
+
+    def _arrow_scan(read_opts: str) -> None:
+        nonlocal arrow_result
+        query = (
+            f"SELECT {select_list} FROM read_csv("
+            f"'{_sql_escape(file_path)}', {read_opts}{names_opt})"
+        )
+        logger.debug(f"DuckDB query (Arrow): {query}")
+        reader = _arrow_reader(conn.execute(query), batch_size)
+        arrow_result = reader if as_reader else reader.read_all()
+
+    reject_stats: Optional[RejectStats] = None
+    try:
+        fallback_config, read_dialect = _scan_with_fallbacks(
+            conn, file_path, _arrow_scan, is_remote=is_remote,
+            skip_rows=skip_rows, allow_rescan=not as_reader,
+            hint=known_dialect, encoding=encoding,
+        )
+        if not as_reader:
+            reject_stats = _export_rejects(conn, reject_file)
 
-    if not first_line:
-        return
+    finally:
+        if session is None:
+            conn.close()
 
-    header = first_line
+    if session is not None:
+        session.dialect = fallback_config
+        session.read_dialect = read_dialect
+    return arrow_result, reject_stats
 
-    def _strip_keyword_prefix(m: re.Match[str]) -> str:
-        prefix: str = m.group(1)  # '' or ','
-        name: str = m.group(2)    # word after '_'
-        if name in _DUCKDB_KEYWORD_SET:
-            return prefix + name
-        return str(m.group(0))
 
-    header = re.sub(r"(^|,)_([A-Za-z0-9]+)\b", _strip_keyword_prefix, header)
+def _score_config(
+    conn: duckdb.DuckDBPyConnection,
+    sample_path: Path,
+    config: ConfigDict,
+    sample_lines: int,
+) -> Optional[float]:
+    """Score a fallback dialect on the sample by column-count consistency.
 
-    with open(file_path, "w") as f:
-        f.write(header)
-        f.write(rest)
+    The line after the skipped rows is read as the header and rows whose
+    field count disagrees with it are dropped by ignore_errors, so the share
+    of sample lines that survive as data measures how well the dialect fits
+    (skipping more than needed costs rows). Runs on its own cursor so probes
+    can execute concurrently.
 
+    Returns:
+        Fraction of sample lines parsed as data rows, or None if the dialect
+        yields fewer than 2 columns or no rows.
+    """
+    delim = config["delim"]
+    skip = int(config["skip"])
+    source = (
+        f"read_csv('{_sql_escape(sample_path)}', delim='{delim}', skip={skip}, "
+        "header=true, all_varchar=true, ignore_errors=true, sample_size=-1)"
+    )
+    cursor = conn.cursor()
+    try:
+        columns = cursor.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()
+        row = cursor.execute(f"SELECT COUNT(*) FROM {source}").fetchone()
+    except duckdb.Error as e:
+        logger.debug(f"Probe {config} failed: {e}")
+        return None
+    finally:
+        cursor.close()
 
-def _count_lines(file_path: Path) -> int:
-    """Count lines in a file.
+    rows = row[0] if row else 0
+    if len(columns) < 2 or rows == 0:
+        return None
+    return rows / max(sample_lines - 1, 1)
 
-    Args:
-        file_path: Path to file.
 
-    Returns:
-        Number of lines in file, or 0 if file doesn't exist.
+def _probe_fallback_configs(
+    conn: duckdb.DuckDBPyConnection,
+    file_path: Union[Path, str],
+    configs: list[ConfigDict],
+    encoding: Optional[str] = None,
+) -> Optional[ConfigDict]:
+    """Return the fallback config that best fits the file, or None.
+
+    Local files: the head of the file is read once (decoded from
+    ``encoding`` if given) into a small UTF-8 sample file and every
+    candidate is scored on it concurrently (one DuckDB cursor per
+    thread); the highest score wins, ties going to the earlier config. The
+    input itself is not read by any probe. Other inputs (URLs, zip://) are
+    tried in order with _try_read_csv_with_config.
     """
-    if not file_path.exists():
-        return 0
+    if not isinstance(file_path, Path):
+        for config in configs:
+            logger.debug(f"Trying config: {config}")
+            if _try_read_csv_with_config(conn, file_path, config, encoding=encoding):
+                return config
+        return None
+
+    try:
+        sample = read_sample(file_path, FALLBACK_PROBE_SAMPLE_BYTES, encoding)
+    except (OSError, LookupError) as e:
+        logger.debug(f"Could not read probe sample: {e}")
+        return None
+    sample_lines = sample.count(b"\n") + (0 if sample.endswith(b"\n") else 1)
 
-    with open(file_path, "r") as f:
-        return sum(1 for _ in f)
+    fd, sample_name = tempfile.mkstemp(prefix="csvnorm_probe_", suffix=".csv")
+    sample_path = Path(sample_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(sample)
+        with ThreadPoolExecutor(max_workers=len(configs) or 1) as pool:
+            scores = list(
+                pool.map(
+                    lambda config: _score_config(
+                        conn, sample_path, config, sample_lines
+                    ),
+                    configs,
+                )
+            )
+    finally:
+        sample_path.unlink(missing_ok=True)
+
+    logger.debug(f"Fallback probe scores: {list(zip(configs, scores))}")
+    best: Optional[ConfigDict] = None
+    best_score = 0.0
+    for config, score in zip(configs, scores):
+        if score is not None and score > best_score:
+            best, best_score = config, score
+    return best
 
 
 def _try_read_csv_with_config(
@@ -500,27 +1418,31 @@ def _try_read_csv_with_config(
     file_path: Union[Path, str],
     config: ConfigDict,
     all_varchar: bool = True,
+    encoding: Optional[str] = None,
 ) -> bool:
     """Try to read CSV with specific configuration.
 
     Args:
-        conn: DuckDB connection.
+        conn: DuckDB connection, already prepared for file_path (zipfs loaded).
         file_path: Path to CSV file or URL string.
         config: Configuration dict with 'delim' and 'skip' keys.
         all_varchar: If True, read all columns as varchar.
+        encoding: read_csv encoding when DuckDB decodes the input itself.
 
     Returns:
         True if configuration works and has multiple columns, False otherwise.
     """
     try:
-        _ensure_zipfs_extension(conn, file_path)
         delim = config["delim"]
         skip = config["skip"]
 
-        read_opts = f"delim='{delim}', skip={skip}, sample_size=-1, ignore_errors=true"
-        compression_opt = _compression_option(file_path)
-        if compression_opt:
-            read_opts += f", {compression_opt}"
+        read_opts = (
+            f"delim='{delim}', skip={skip}, "
+            f"sample_size={DEFAULT_SNIFF_SAMPLE_ROWS}, ignore_errors=true"
+        )
+        source_opts = _source_options(file_path, encoding)
+        if source_opts:
+            read_opts += f", {source_opts}"
         if all_varchar:
             read_opts += ", all_varchar=true"
 
@@ -543,7 +1465,7 @@ def _try_read_csv_with_config(
 
 
 def _detect_header_anomaly(
-    file_path: Path, num_lines: int = 5
+    file_path: Path, num_lines: int = 5, encoding: Optional[str] = None
 ) -> Optional[ConfigDict]:
     """Detect if first line has anomalous separator pattern.
 
@@ -554,13 +1476,16 @@ def _detect_header_anomaly(
     Args:
         file_path: Path to CSV file.
         num_lines: Number of lines to analyze (default: 5).
+        encoding: File encoding if not UTF-8.
 
     Returns:
         Suggested config dict with 'delim' and 'skip' if anomaly detected,
         None otherwise.
     """
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+        with open(
+            file_path, "r", encoding=encoding or "utf-8", errors="ignore"
+        ) as f:
             lines = [f.readline().rstrip("\n") for _ in range(num_lines)]
 
         # Filter out empty lines
@@ -637,36 +1562,3 @@ def _detect_header_anomaly(
     except OSError as e:
         logger.debug(f"Header anomaly detection failed: {e}")
         return None
-
-
-def _get_error_types(reject_file: Path) -> list[str]:
-    """Extract sample error types from reject file.
-
-    Args:
-        reject_file: Path to reject_errors.csv file.
-
-    Returns:
-        List of up to 3 unique error reasons.
-    """
-    if not reject_file.exists():
-        return []
-
-    error_types: set[str] = set()
-    try:
-        with open(reject_file, "r") as f:
-            # Skip header
-            next(f, None)
-            for line in f:
-                # Error message is in the last column
-                parts = line.rstrip("\n").split(",")
-                if parts:
-                    error_reason = parts[-1].strip()
-                    if error_reason and error_reason != "error":
-                        error_types.add(error_reason)
-                        if len(error_types) >= 3:
-                            break
-    except (OSError, UnicodeDecodeError) as e:
-        logger.warning(f"Failed to extract error types: {e}")
-        return []
-
-    return list(error_types)[:3]
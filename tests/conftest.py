@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the detection cache out of the user's home directory."""
+    monkeypatch.setenv("CSVNORM_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
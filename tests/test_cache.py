@@ -0,0 +1,113 @@
+"""Tests for the persistent detection cache."""
+
+import os
+from unittest.mock import patch
+
+from csvnorm.cache import CacheEntry, DetectionCache, default_cache_dir
+from csvnorm.cli import main
+
+ENTRY: CacheEntry = {
+    "encoding": "utf-8",
+    "mojibake": False,
+    "fallback_config": {"delim": ";", "skip": 1},
+    "dialect": {
+        "delimiter": ";",
+        "quote": '"',
+        "escape": "(empty)",
+        "skip": 1,
+        "header": True,
+        "columns": ["a", "b"],
+    },
+    "columns": ["a", "b"],
+}
+
+
+def test_round_trip(tmp_path):
+    data = tmp_path / "data.csv"
+    data.write_text("a;b\n1;2\n")
+
+    with DetectionCache(tmp_path / "cache") as cache:
+        assert cache.get(data) is None
+        cache.put(data, ENTRY)
+        assert cache.get(data) == ENTRY
+
+    # Persisted across instances
+    with DetectionCache(tmp_path / "cache") as cache:
+        assert cache.get(data) == ENTRY
+
+
+def test_changed_file_misses(tmp_path):
+    data = tmp_path / "data.csv"
+    data.write_text("a;b\n1;2\n")
+
+    with DetectionCache(tmp_path / "cache") as cache:
+        cache.put(data, ENTRY)
+        data.write_text("a;b\n1;2\n3;4\n")
+        assert cache.get(data) is None
+
+        # Same size and mtime, different head bytes
+        cache.put(data, ENTRY)
+        st = data.stat()
+        data.write_text("x;y\n1;2\n3;4\n")
+        os.utime(data, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert cache.get(data) is None
+
+
+def test_least_recently_used_evicted(tmp_path):
+    files = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.csv"
+        path.write_text(f"a,b\n{i},2\n")
+        files.append(path)
+
+    with DetectionCache(tmp_path / "cache", max_entries=2) as cache:
+        with patch("csvnorm.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put(files[0], ENTRY)
+            cache.put(files[1], ENTRY)
+            assert cache.get(files[0]) is not None  # f0 now newer than f1
+            cache.put(files[2], ENTRY)
+
+        assert cache.get(files[0]) is not None
+        assert cache.get(files[1]) is None
+        assert cache.get(files[2]) is not None
+
+
+def test_unusable_cache_dir_is_a_miss(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    data = tmp_path / "data.csv"
+    data.write_text("a,b\n1,2\n")
+
+    cache = DetectionCache(blocker / "cache")
+    cache.put(data, ENTRY)
+    assert cache.get(data) is None
+
+
+def test_default_cache_dir_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("CSVNORM_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+    monkeypatch.delenv("CSVNORM_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "csvnorm"
+
+
+def test_second_run_skips_detection(tmp_path):
+    data = tmp_path / "data.csv"
+    data.write_bytes("città;prezzo\nRoma;1,5\n".encode("latin-1"))
+    cache_dir = tmp_path / "cache"
+    output = tmp_path / "out.csv"
+    args = [str(data), "-o", str(output), "-f", "--cache-dir", str(cache_dir)]
+
+    assert main(args) == 0
+    first = output.read_text()
+
+    with patch("csvnorm.core.detect_encoding") as mock_detect:
+        with patch("csvnorm.validation._sniff_dialect") as mock_sniff:
+            assert main(args) == 0
+    mock_detect.assert_not_called()
+    mock_sniff.assert_not_called()
+    assert output.read_text() == first
+
+    with patch("csvnorm.core.detect_encoding", return_value="latin-1") as mock_detect:
+        assert main(args + ["--no-cache"]) == 0
+    mock_detect.assert_called_once()
@@ -4,6 +4,7 @@ import shutil
 import subprocess
 import sys
 
+import duckdb
 import pytest
 
 from importlib.metadata import version
@@ -157,6 +158,180 @@ class TestMainFunction:
         assert exit_code == 0
         assert output_file.exists()
 
+    def test_jobs_flag(self, tmp_path):
+        """Test --jobs runs parallel mojibake repair."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("Nome,Citta\n" + "Gianni,CittÃ \n" * 50)
+
+        output_file = tmp_path / "output.csv"
+
+        exit_code = main(
+            [str(test_csv), "-o", str(output_file), "--fix-mojibake", "0", "-j", "2"]
+        )
+
+        assert exit_code == 0
+        assert "CittÃ" not in output_file.read_text()
+        assert main([str(test_csv), "--jobs", "-1"]) == 1
+
+    def test_encoding_override_flag(self, tmp_path):
+        """Test --encoding skips detection and converts with given codec."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_bytes("Nome,Città\nGianni,Perù\n".encode("latin-1"))
+
+        output_file = tmp_path / "output.csv"
+
+        exit_code = main(
+            [str(test_csv), "-o", str(output_file), "--encoding", "latin-1", "-f"]
+        )
+
+        assert exit_code == 0
+        assert "Perù" in output_file.read_text(encoding="utf-8")
+
+    def test_encoding_override_unknown(self, tmp_path):
+        """Test --encoding with an unknown codec fails."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n1,2\n")
+
+        exit_code = main([str(test_csv), "--encoding", "fake-encoding-xyz"])
+
+        assert exit_code == 1
+
+    def test_encoding_sample_bytes_flag(self, tmp_path):
+        """Test --encoding-sample-bytes accepts a positive byte budget."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n1,2\n")
+
+        output_file = tmp_path / "output.csv"
+
+        assert main([str(test_csv), "--encoding-sample-bytes", "0"]) == 1
+        exit_code = main(
+            [str(test_csv), "-o", str(output_file), "--encoding-sample-bytes", "4096"]
+        )
+        assert exit_code == 0
+
+    def test_duckdb_resource_flags(self, tmp_path):
+        """Test --threads/--memory-limit/--temp-directory reach the session."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n1,2\n")
+
+        output_file = tmp_path / "output.csv"
+
+        exit_code = main(
+            [
+                str(test_csv), "-o", str(output_file),
+                "--threads", "2",
+                "--memory-limit", "256MB",
+                "--temp-directory", str(tmp_path / "spill"),
+                "--no-preserve-insertion-order",
+            ]
+        )
+        assert exit_code == 0
+        assert output_file.read_text() == "a,b\n1,2\n"
+
+        assert main([str(test_csv), "--memory-limit", "lots"]) == 1
+        assert main([str(test_csv), "--threads", "0"]) == 1
+
+    def test_parquet_format_flags(self, tmp_path):
+        """Test --format parquet and its codec/level/row-group options."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("Col A,B\n1,2\n3,4\n")
+        output_file = tmp_path / "output.parquet"
+
+        exit_code = main(
+            [
+                str(test_csv), "-o", str(output_file), "--format", "parquet",
+                "--parquet-compression", "zstd",
+                "--parquet-compression-level", "5",
+                "--parquet-row-group-size", "1000",
+            ]
+        )
+        assert exit_code == 0
+        rows = duckdb.sql(f"SELECT * FROM read_parquet('{output_file}')")
+        assert rows.columns == ["col_a", "b"]
+        assert rows.fetchall() == [("1", "2"), ("3", "4")]
+
+        assert main([str(test_csv), "--format", "parquet"]) == 1
+        other = str(tmp_path / "other.parquet")
+        assert main([str(test_csv), "-o", other, "--format", "parquet", "-d", ";"]) == 1
+        assert main(
+            [str(test_csv), "-o", other, "--format", "parquet",
+             "--parquet-compression-level", "5"]
+        ) == 1
+        assert main(
+            [str(test_csv), "-o", other, "--format", "parquet",
+             "--parquet-row-group-size", "0"]
+        ) == 1
+
+    def test_arrow_format_flags(self, tmp_path):
+        """Test --format feather and the options Arrow output cannot take."""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.feather  # noqa: F401
+
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("Col A,B\n1,2\n3,4\n")
+        output_file = tmp_path / "output.feather"
+
+        assert main([str(test_csv), "-o", str(output_file), "--format", "feather"]) == 0
+        table = pa.feather.read_table(str(output_file))
+        assert table.to_pydict() == {"col_a": ["1", "3"], "b": ["2", "4"]}
+
+        other = str(tmp_path / "other.arrow")
+        assert main([str(test_csv), "--format", "arrow"]) == 1
+        assert main([str(test_csv), "-o", other, "--format", "arrow", "-d", ";"]) == 1
+        assert main(
+            [str(test_csv), "-o", other, "--format", "arrow", "--per-thread-output"]
+        ) == 1
+
+    def test_arrow_format_without_pyarrow(self, tmp_path, monkeypatch):
+        """Test --format arrow fails with an install hint when pyarrow is missing."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("a,b\n1,2\n")
+        output_file = tmp_path / "output.arrow"
+
+        errors = []
+        monkeypatch.setattr("csvnorm.core.show_error_panel", errors.append)
+
+        assert main([str(test_csv), "-o", str(output_file), "--format", "arrow"]) == 1
+        assert "csvnorm[arrow]" in errors[0]
+        assert not output_file.exists()
+
+    def test_early_exit_opens_no_session(self, tmp_path, monkeypatch):
+        """Test an existing output file fails before a DuckDB session is opened."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n1,2\n")
+        output_file = tmp_path / "output.csv"
+        output_file.write_text("keep\n")
+
+        opened = []
+        monkeypatch.setattr(
+            "csvnorm.core.CsvnormSession", lambda **kwargs: opened.append(kwargs)
+        )
+
+        assert main([str(test_csv), "-o", str(output_file)]) == 1
+        assert opened == []
+        assert output_file.read_text() == "keep\n"
+
+    def test_unordered_flags(self, tmp_path):
+        """Test --unordered and --per-thread-output."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n1,2\n3,4\n")
+
+        output_file = tmp_path / "output.csv"
+        assert main([str(test_csv), "-o", str(output_file), "--unordered"]) == 0
+        assert sorted(output_file.read_text().splitlines()) == ["1,2", "3,4", "a,b"]
+
+        parts_dir = tmp_path / "parts"
+        exit_code = main([str(test_csv), "-o", str(parts_dir), "--per-thread-output"])
+        assert exit_code == 0
+        assert parts_dir.is_dir()
+        assert list(parts_dir.glob("*.csv"))
+
+        assert main([str(test_csv), "--per-thread-output"]) == 1
+        assert main(
+            [str(test_csv), "--unordered", "--preserve-insertion-order"]
+        ) == 1
+
     def test_verbose_flag(self, tmp_path, capsys):
         """Test --verbose flag shows banner and debug output."""
         test_csv = tmp_path / "test.csv"
@@ -390,6 +565,50 @@ class TestCLISubprocess:
         combined = (result.stdout + result.stderr).lower()
         assert "broken pipe" not in combined
 
+    def test_stream_output(self, tmp_path):
+        """Test --stream writes normalized CSV straight to a pipe."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("Select,Other Col\n1,2\n3,4\n")
+
+        result = subprocess.run(
+            [sys.executable, "-m", "csvnorm", str(test_csv), "--stream"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout == "select,other_col\n1,2\n3,4\n"
+
+    def test_stream_pipe_to_head(self, tmp_path):
+        """Test --stream exits cleanly when the reader closes the pipe."""
+        if shutil.which("head") is None:
+            pytest.skip("head not available on this platform")
+
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n" + "1,2\n" * 200000)
+
+        result = subprocess.run(
+            f'{sys.executable} -m csvnorm "{test_csv}" --stream | head -1',
+            shell=True,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout == "a,b\n"
+        assert "broken pipe" not in result.stderr.lower()
+
+    def test_stream_incompatible_flags(self, tmp_path):
+        """Test --stream is rejected with -o, --check and --strict."""
+        test_csv = tmp_path / "test.csv"
+        test_csv.write_text("A,B\n1,2\n")
+
+        assert main([str(test_csv), "--stream", "-o", str(tmp_path / "o.csv")]) == 1
+        assert main([str(test_csv), "--stream", "--check"]) == 1
+        assert main([str(test_csv), "--stream", "--strict"]) == 1
+
 
 class TestCheckMode:
     """Test --check flag functionality."""
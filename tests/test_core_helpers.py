@@ -11,8 +11,11 @@ import pytest
 from csvnorm.core import (
     _cleanup_temp_artifacts,
     _compute_and_show_output,
+    _emit_stdout_output,
     _handle_post_validation,
     _prepare_working_file,
+    _spool_stdin,
+    _stream_file_to_stdout,
     _validate_csv_with_http_handling,
     process_csv,
 )
@@ -47,7 +50,7 @@ class TestPrepareWorkingFile:
             task=task,
             temp_files=[],
         )
-        assert result == ("https://example.com/data.csv", "remote", False)
+        assert result == ("https://example.com/data.csv", "remote", False, None)
 
     def test_compressed_input_returns_immediately(self):
         """Compressed input skips encoding detection."""
@@ -66,7 +69,7 @@ class TestPrepareWorkingFile:
             task=task,
             temp_files=[],
         )
-        assert result == (compressed_path, "gzip", False)
+        assert result == (compressed_path, "gzip", False, None)
 
     @patch("csvnorm.core._handle_local_encoding")
     def test_value_error_encoding_returns_none(self, mock_enc):
@@ -142,7 +145,7 @@ class TestPrepareWorkingFile:
     @patch("csvnorm.core._handle_local_encoding")
     def test_mojibake_oserror_returns_none(self, mock_enc, mock_moji):
         """OSError during mojibake repair returns None."""
-        mock_enc.return_value = (Path("/tmp/working.csv"), "utf-8")
+        mock_enc.return_value = (Path("/tmp/working.csv"), "utf-8", None)
         mock_moji.side_effect = OSError("disk full")
         progress, task = self._make_progress()
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -166,7 +169,7 @@ class TestPrepareWorkingFile:
     @patch("csvnorm.core._handle_local_encoding")
     def test_check_only_skips_mojibake(self, mock_enc):
         """check_only=True skips mojibake repair."""
-        mock_enc.return_value = (Path("/tmp/working.csv"), "utf-8")
+        mock_enc.return_value = (Path("/tmp/working.csv"), "utf-8", None)
         progress, task = self._make_progress()
         with tempfile.TemporaryDirectory() as tmpdir:
             test_file = Path(tmpdir) / "data.csv"
@@ -185,10 +188,38 @@ class TestPrepareWorkingFile:
                 temp_files=[],
             )
         assert result is not None
-        working, enc, moji = result
+        working, enc, moji, read_encoding = result
+        assert read_encoding is None
         assert enc == "utf-8"
         assert moji is False
 
+    def test_native_encoding_converted_when_repairing_mojibake(self):
+        """Mojibake repair needs UTF-8 text, so latin-1 is still converted."""
+        progress, task = self._make_progress()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "data.csv"
+            test_file.write_bytes("a,b\ncittà,1\n".encode("latin-1"))
+            common = dict(
+                input_path=test_file,
+                is_remote=False,
+                compressed_type=None,
+                compressed_input_path=test_file,
+                temp_utf8_file=Path(tmpdir) / "utf8.csv",
+                temp_dir=Path(tmpdir),
+                check_only=False,
+                progress=progress,
+                task=task,
+                temp_files=[],
+                encoding_override="latin-1",
+            )
+            native = _prepare_working_file(fix_mojibake_sample=None, **common)
+            repaired = _prepare_working_file(fix_mojibake_sample=1000, **common)
+        assert native is not None and repaired is not None
+        assert native[0] == test_file
+        assert native[3] == "latin-1"
+        assert repaired[0] != test_file
+        assert repaired[3] is None
+
 
 # ---------------------------------------------------------------------------
 # _handle_post_validation
@@ -206,7 +237,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=False,
-            reject_count=1,
+            reject_count=0,
             error_types=[],
             fallback_config={"strict_mode": False},
             check_only=False,
@@ -225,7 +256,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=False,
-            reject_count=1,
+            reject_count=0,
             error_types=[],
             fallback_config=None,
             check_only=True,
@@ -242,7 +273,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=True,
-            reject_count=3,
+            reject_count=2,
             error_types=["CAST", "MISSING_COLUMNS"],
             fallback_config=None,
             check_only=True,
@@ -260,7 +291,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=True,
-            reject_count=3,
+            reject_count=2,
             error_types=["CAST"],
             fallback_config=None,
             check_only=False,
@@ -278,7 +309,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=True,
-            reject_count=3,
+            reject_count=2,
             error_types=["CAST"],
             fallback_config=None,
             check_only=False,
@@ -295,7 +326,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=True,
-            reject_count=3,
+            reject_count=2,
             error_types=["CAST"],
             fallback_config=None,
             check_only=False,
@@ -312,7 +343,7 @@ class TestHandlePostValidation:
         progress = self._make_progress()
         result = _handle_post_validation(
             has_validation_errors=False,
-            reject_count=1,
+            reject_count=0,
             error_types=[],
             fallback_config=None,
             check_only=False,
@@ -479,14 +510,6 @@ class TestValidateCsvWithHttpHandling:
 class TestCleanupTempArtifacts:
     """Tests for _cleanup_temp_artifacts helper."""
 
-    def test_stdout_removes_empty_reject(self):
-        """Stdout mode removes reject file with only header (<=1 line)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reject = Path(tmpdir) / "reject_errors.csv"
-            reject.write_text("header\n")
-            _cleanup_temp_artifacts(use_stdout=True, reject_file=reject, temp_files=[])
-            assert not reject.exists()
-
     def test_stdout_keeps_reject_with_errors(self):
         """Stdout mode keeps reject file with actual errors."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -495,13 +518,19 @@ class TestCleanupTempArtifacts:
             _cleanup_temp_artifacts(use_stdout=True, reject_file=reject, temp_files=[])
             assert reject.exists()
 
-    def test_file_mode_removes_empty_reject(self):
-        """File mode removes reject file with only header."""
+    def test_stdout_keeps_reject_inside_temp_dir(self):
+        """Stdout mode prunes a temp dir but keeps the reject file in it."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            reject = Path(tmpdir) / "reject_errors.csv"
-            reject.write_text("header\n")
-            _cleanup_temp_artifacts(use_stdout=False, reject_file=reject, temp_files=[])
-            assert not reject.exists()
+            temp_dir = Path(tmpdir) / "work"
+            temp_dir.mkdir()
+            (temp_dir / "output.csv").write_text("a\n1\n")
+            reject = temp_dir / "reject_errors.csv"
+            reject.write_text("header\nerror1\n")
+            _cleanup_temp_artifacts(
+                use_stdout=True, reject_file=reject, temp_files=[temp_dir]
+            )
+            assert reject.exists()
+            assert not (temp_dir / "output.csv").exists()
 
     def test_cleans_temp_files(self):
         """Removes temp files from list."""
@@ -515,20 +544,61 @@ class TestCleanupTempArtifacts:
             assert not temp_file.exists()
 
 
+# ---------------------------------------------------------------------------
+# _emit_stdout_output
+# ---------------------------------------------------------------------------
+
+
+class TestEmitStdoutOutput:
+    """Tests for streaming stdout emission."""
+
+    def test_streams_file_to_binary_stdout(self, capsysbinary):
+        """Output bytes are copied unchanged to stdout."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "output.csv"
+            output.write_bytes("a,b\ncittà,2\n".encode("utf-8"))
+            _stream_file_to_stdout(output)
+        assert capsysbinary.readouterr().out == "a,b\ncittà,2\n".encode("utf-8")
+
+    def test_text_only_stdout(self):
+        """A replaced text-only sys.stdout still receives the output."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "output.csv"
+            output.write_text("a,b\n1,2\n")
+            fake_stdout = io.StringIO()
+            with patch("csvnorm.core.sys.stdout", fake_stdout):
+                _stream_file_to_stdout(output)
+        assert fake_stdout.getvalue() == "a,b\n1,2\n"
+
+    @patch("csvnorm.core._silence_stdout_after_broken_pipe")
+    @patch("csvnorm.core._stream_file_to_stdout", side_effect=BrokenPipeError)
+    def test_broken_pipe_returns_0(self, mock_stream, mock_silence):
+        """A closed pipe ends output quietly with exit code 0."""
+        result = _emit_stdout_output(
+            Path("/tmp/output.csv"),
+            has_validation_errors=True,
+            reject_count=2,
+            reject_file=Path("/tmp/reject_errors.csv"),
+        )
+        assert result == 0
+        mock_silence.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # _compute_and_show_output
 # ---------------------------------------------------------------------------
 
 
+STATS = {"row_count": 10, "column_count": 3, "columns": ["a", "b", "c"]}
+
+
 class TestComputeAndShowOutput:
     """Tests for _compute_and_show_output helper."""
 
-    @patch("csvnorm.core.get_column_count", return_value=3)
-    @patch("csvnorm.core.get_row_count", return_value=10)
     @patch("csvnorm.core.show_validation_error_panel")
     @patch("csvnorm.core.show_success_table")
     def test_file_mode_with_errors_returns_1(
-        self, mock_table, mock_panel, mock_rows, mock_cols
+        self, mock_table, mock_panel
     ):
         """File mode with validation errors returns 1."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -550,18 +620,17 @@ class TestComputeAndShowOutput:
                 keep_names=False,
                 use_stdout=False,
                 has_validation_errors=True,
-                reject_count=3,
+                reject_count=2,
                 error_types=["CAST"],
                 reject_file=reject,
+                output_stats=STATS,
             )
         assert result == 1
         mock_table.assert_called_once()
         mock_panel.assert_called_once()
 
-    @patch("csvnorm.core.get_column_count", return_value=3)
-    @patch("csvnorm.core.get_row_count", return_value=10)
     @patch("csvnorm.core.show_success_table")
-    def test_file_mode_no_errors_returns_0(self, mock_table, mock_rows, mock_cols):
+    def test_file_mode_no_errors_returns_0(self, mock_table):
         """File mode without errors returns 0."""
         with tempfile.TemporaryDirectory() as tmpdir:
             output = Path(tmpdir) / "out.csv"
@@ -582,16 +651,15 @@ class TestComputeAndShowOutput:
                 keep_names=False,
                 use_stdout=False,
                 has_validation_errors=False,
-                reject_count=1,
+                reject_count=0,
                 error_types=[],
                 reject_file=reject,
+                output_stats=STATS,
             )
         assert result == 0
 
-    @patch("csvnorm.core.get_column_count", return_value=3)
-    @patch("csvnorm.core.get_row_count", return_value=10)
     @patch("csvnorm.core.show_success_table")
-    def test_input_size_fallback_when_no_local_path(self, mock_table, mock_rows, mock_cols):
+    def test_input_size_fallback_when_no_local_path(self, mock_table):
         """Uses working_file size when local_input_path is None."""
         with tempfile.TemporaryDirectory() as tmpdir:
             output = Path(tmpdir) / "out.csv"
@@ -612,9 +680,10 @@ class TestComputeAndShowOutput:
                 keep_names=False,
                 use_stdout=False,
                 has_validation_errors=False,
-                reject_count=1,
+                reject_count=0,
                 error_types=[],
                 reject_file=reject,
+                output_stats=STATS,
             )
         assert result == 0
 
@@ -634,7 +703,7 @@ class TestStdinInput:
         with patch("csvnorm.core.sys") as mock_sys, \
              tempfile.TemporaryDirectory() as tmpdir:
             mock_sys.stdin.isatty.return_value = False
-            mock_sys.stdin.buffer.read.return_value = csv_data
+            mock_sys.stdin.buffer = io.BytesIO(csv_data)
             mock_sys.stdout = io.StringIO()
 
             output_file = Path(tmpdir) / "out.csv"
@@ -666,7 +735,7 @@ class TestStdinInput:
         with patch("csvnorm.core.sys") as mock_sys, \
              tempfile.TemporaryDirectory() as tmpdir:
             mock_sys.stdin.isatty.return_value = False
-            mock_sys.stdin.buffer.read.return_value = csv_data
+            mock_sys.stdin.buffer = io.BytesIO(csv_data)
             mock_sys.stdout = io.StringIO()
 
             output_file = Path(tmpdir) / "output.csv"
@@ -684,7 +753,7 @@ class TestStdinInput:
 
         with patch("csvnorm.core.sys") as mock_sys:
             mock_sys.stdin.isatty.return_value = False
-            mock_sys.stdin.buffer.read.return_value = csv_data
+            mock_sys.stdin.buffer = io.BytesIO(csv_data)
             mock_sys.stdout = io.StringIO()
 
             result = process_csv(
@@ -701,7 +770,7 @@ class TestStdinInput:
         with patch("csvnorm.core.sys") as mock_sys, \
              tempfile.TemporaryDirectory() as tmpdir:
             mock_sys.stdin.isatty.return_value = False
-            mock_sys.stdin.buffer.read.return_value = csv_data
+            mock_sys.stdin.buffer = io.BytesIO(csv_data)
             mock_sys.stdout = io.StringIO()
 
             output_file = Path(tmpdir) / "out.csv"
@@ -712,3 +781,27 @@ class TestStdinInput:
             )
             assert result == 0
             assert output_file.exists()
+
+    def test_stdin_spooled_in_bounded_chunks(self):
+        """Stdin is copied to the temp file without a single unbounded read."""
+        csv_data = b"a,b\n" + b"1,2\n" * 1000
+        stdin_buffer = io.BytesIO(csv_data)
+        read_sizes = []
+        original_read = stdin_buffer.read
+
+        def _tracking_read(size=-1):
+            read_sizes.append(size)
+            return original_read(size)
+
+        stdin_buffer.read = _tracking_read
+
+        with patch("csvnorm.core.sys") as mock_sys, \
+             patch("csvnorm.core.STDIN_SPOOL_CHUNK", 512), \
+             tempfile.TemporaryDirectory() as tmpdir:
+            mock_sys.stdin.buffer = stdin_buffer
+            target = Path(tmpdir) / "stdin_input.csv"
+            _spool_stdin(target)
+            assert target.read_bytes() == csv_data
+
+        assert read_sizes
+        assert all(0 < size <= 512 for size in read_sizes)
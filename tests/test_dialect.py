@@ -0,0 +1,89 @@
+"""Tests for sample-based dialect detection."""
+
+import gzip
+from pathlib import Path
+
+from csvnorm.dialect import (
+    DIALECT_CONFIDENCE_THRESHOLD,
+    detect_dialect,
+    rank_dialects,
+    read_sample,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "test"
+
+
+def _rows(n: int, delim: str = ",") -> str:
+    return "".join(f"{i}{delim}name {i}{delim}{i * 2}\n" for i in range(n))
+
+
+def test_semicolon_with_decimal_commas():
+    sample = "id;price;qty\n" + "".join(f"{i};{i},5;{i}\n" for i in range(30))
+    best = rank_dialects(sample.encode())[0]
+    assert best["delimiter"] == ";"
+    assert best["skip"] == 0
+    assert best["header"] is True
+    assert best["columns"] == 3
+
+
+def test_title_row_is_skipped():
+    sample = "Report generated 2024\nid,name,value\n" + _rows(30)
+    best = rank_dialects(sample.encode())[0]
+    assert best["delimiter"] == ","
+    assert best["skip"] == 1
+    assert best["confidence"] >= DIALECT_CONFIDENCE_THRESHOLD
+
+
+def test_quoted_delimiters_and_newlines_ignored():
+    rows = "".join(f'{i},"a, b\nc",{i}\n' for i in range(20))
+    best = rank_dialects(("id,text,n\n" + rows).encode())[0]
+    assert best["delimiter"] == ","
+    assert best["columns"] == 3
+    assert best["consistency"] == 1.0
+    assert best["quote"] == '"'
+
+
+def test_single_quote_detected():
+    rows = "".join(f"{i}|'x|{i}'|{i}\n" for i in range(20))
+    best = rank_dialects(("a|b|c\n" + rows).encode())[0]
+    assert best["delimiter"] == "|"
+    assert best["quote"] == "'"
+    assert best["columns"] == 3
+
+
+def test_numeric_first_row_means_no_header():
+    best = rank_dialects("1,2,3\n4,5,6\n7,8,9\n".encode())[0]
+    assert best["header"] is False
+
+
+def test_small_sample_has_low_confidence():
+    best = rank_dialects(b"a,b\n1,2\n")[0]
+    assert best["confidence"] < DIALECT_CONFIDENCE_THRESHOLD
+
+
+def test_single_column_has_no_dialect():
+    assert rank_dialects(b"a\n1\n2\n") == []
+
+
+def test_read_sample_cuts_at_newline(tmp_path):
+    path = tmp_path / "data.csv.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(_rows(100))
+    sample = read_sample(path, 50)
+    assert sample.endswith(b"\n")
+    assert len(sample) <= 50
+
+
+def test_detect_dialect_on_fixtures():
+    guess = detect_dialect(FIXTURES_DIR / "POSAS_2025_it_Comuni.csv")
+    assert guess is not None
+    assert guess["delimiter"] == ";"
+    assert guess["skip"] == 1
+    assert detect_dialect(FIXTURES_DIR / "empty_file.csv") is None
+    assert detect_dialect(FIXTURES_DIR / "missing.csv") is None
+
+
+def test_ambiguous_delimiters_lower_confidence():
+    sample = "a,b;c\n" + "".join(f"{i},x;{i}\n" for i in range(30))
+    best = rank_dialects(sample.encode())[0]
+    assert best["confidence"] < DIALECT_CONFIDENCE_THRESHOLD
@@ -2,12 +2,15 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from csvnorm.encoding import (
+    _verify_utf8,
     convert_to_utf8,
     detect_encoding,
+    duckdb_encoding,
     needs_conversion,
     normalize_encoding_name,
 )
@@ -103,6 +106,77 @@ class TestDetectEncoding:
             detect_encoding(TEST_DIR / "binary_file.bin")
 
 
+class TestDetectEncodingSampled:
+    """Tests for bounded-sample detect_encoding."""
+
+    def test_bom_short_circuits(self):
+        """A UTF-16 BOM is honored without sampling."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "utf16.csv"
+            test_file.write_bytes("a,b\nà,è\n".encode("utf-16"))
+            assert detect_encoding(test_file, sample_bytes=1024) == "utf-16"
+
+    def test_utf8_sample(self):
+        """Valid UTF-8 sample returns utf-8 without charset_normalizer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "utf8.csv"
+            test_file.write_text("a,b\n" + "città,perché\n" * 2000, encoding="utf-8")
+            with patch("csvnorm.encoding.from_bytes") as mock_from_bytes:
+                assert detect_encoding(test_file, sample_bytes=300) == "utf-8"
+            mock_from_bytes.assert_not_called()
+
+    def test_non_utf8_in_tail(self):
+        """Latin-1 bytes only at the end of the file are caught by the tail window."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "latin1.csv"
+            content = "nome;citta\n" + "Mario;Roma\n" * 5000 + "Niccolò;Forlì\n"
+            test_file.write_bytes(content.encode("latin-1"))
+            encoding = detect_encoding(test_file, sample_bytes=600)
+            assert needs_conversion(encoding) is True
+
+    def test_head_without_newline_split_in_code_point(self):
+        """A head window cut inside a multi-byte character is still UTF-8."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "wide.csv"
+            # One long header line, so the 100-byte head window has no newline
+            # and ends in the middle of a 2-byte "à"
+            test_file.write_text("a" * 99 + "à" * 200 + "\nè\n", encoding="utf-8")
+            with patch("csvnorm.encoding.from_bytes") as mock_from_bytes:
+                assert detect_encoding(test_file, sample_bytes=300) == "utf-8"
+            mock_from_bytes.assert_not_called()
+
+    def test_invalid_sample_size(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            detect_encoding(TEST_DIR / "utf8_basic.csv", sample_bytes=0)
+
+
+class TestDuckdbEncoding:
+    """Tests for duckdb_encoding function."""
+
+    def test_latin1_aliases(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes("città\n".encode("latin-1"))
+        for name in ("latin-1", "latin1", "iso-8859-1", "ISO_8859_1"):
+            assert duckdb_encoding(path, name) == "latin-1"
+
+    def test_utf16_little_endian_bom(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"\xff\xfe" + "a,b\n".encode("utf-16-le"))
+        assert duckdb_encoding(path, "utf-16") == "utf-16"
+
+    def test_utf16_big_endian_is_converted(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"\xfe\xff" + "a,b\n".encode("utf-16-be"))
+        assert duckdb_encoding(path, "utf-16") is None
+
+    def test_other_codecs_are_converted(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"a,b\n")
+        assert duckdb_encoding(path, "cp1252") is None
+        assert duckdb_encoding(path, "mac_roman") is None
+        assert duckdb_encoding(path, "fake-encoding-xyz") is None
+
+
 class TestConvertToUTF8:
     """Tests for convert_to_utf8 function."""
 
@@ -132,3 +206,70 @@ class TestConvertToUTF8:
 
             with pytest.raises(LookupError, match="Unknown encoding"):
                 convert_to_utf8(input_file, output_file, "fake-encoding-xyz")
+
+    def test_multibyte_sequences_across_blocks(self):
+        """Test that tiny blocks do not break multi-byte sequences."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            text = "città,perché\r\nÀ€,日本語\r\n" * 50
+            input_file = Path(tmpdir) / "input.csv"
+            input_file.write_bytes(text.encode("utf-16"))
+            output_file = Path(tmpdir) / "output.csv"
+
+            convert_to_utf8(input_file, output_file, "utf-16", chunk_size=3)
+
+            expected = text.replace("\r\n", "\n")
+            assert output_file.read_bytes() == expected.encode("utf-8")
+
+    def test_invalid_chunk_size(self):
+        """Test that a non-positive chunk size raises ValueError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "input.csv"
+            input_file.write_text("test")
+            output_file = Path(tmpdir) / "output.csv"
+
+            with pytest.raises(ValueError, match="chunk_size"):
+                convert_to_utf8(input_file, output_file, "latin-1", chunk_size=0)
+
+
+class TestVerifyUtf8:
+    """Tests for _verify_utf8 fast path."""
+
+    def test_ascii_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "ascii.csv"
+            test_file.write_text("a,b\n1,2\n")
+            assert _verify_utf8(test_file) == "ascii"
+
+    def test_multibyte_across_chunks(self):
+        """Sequences split across chunk boundaries still verify."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "utf8.csv"
+            test_file.write_text("città,日本語\n" * 100, encoding="utf-8")
+            assert _verify_utf8(test_file, chunk_size=5) == "utf-8"
+
+    def test_invalid_utf8(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "latin1.csv"
+            test_file.write_bytes("a,città\n".encode("latin-1"))
+            assert _verify_utf8(test_file) is None
+
+    def test_truncated_sequence_at_eof(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "truncated.csv"
+            test_file.write_bytes("a,città".encode("utf-8")[:-1])
+            assert _verify_utf8(test_file) is None
+
+    def test_nul_bytes_rejected(self):
+        """UTF-16 without BOM must not pass as UTF-8."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "utf16le.csv"
+            test_file.write_bytes("a,b\n1,2\n".encode("utf-16-le"))
+            assert _verify_utf8(test_file) is None
+
+    def test_detect_encoding_skips_charset_normalizer(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "utf8.csv"
+            test_file.write_text("nome,città\nMario,Forlì\n", encoding="utf-8")
+            with patch("csvnorm.encoding.from_path") as mock_from_path:
+                assert detect_encoding(test_file) == "utf-8"
+            mock_from_path.assert_not_called()
@@ -1,5 +1,6 @@
 """Integration tests for csvnorm."""
 
+import csv
 import gzip
 import tempfile
 import urllib.error
@@ -9,7 +10,7 @@ from unittest.mock import patch
 
 import pytest
 
-from csvnorm.core import process_csv
+from csvnorm.core import process_csv, read_arrow
 from csvnorm import core as core_module
 
 TEST_DIR = Path(__file__).parent.parent / "test"
@@ -62,6 +63,21 @@ class TestProcessCSV:
         assert result == 0
         assert output_file.exists()
 
+    def test_native_encoding_skips_utf8_copy(self, output_dir, tmp_path):
+        """A latin-1 input is decoded by DuckDB, not converted in Python."""
+        input_file = tmp_path / "latin1.csv"
+        input_file.write_bytes("nome;città\nJosé;Forlì\n".encode("latin-1"))
+        output_file = output_dir / "out.csv"
+        with patch.object(core_module, "convert_to_utf8") as mock_convert:
+            result = process_csv(
+                input_file=str(input_file),
+                output_file=output_file,
+                encoding="latin-1",
+            )
+        assert result == 0
+        mock_convert.assert_not_called()
+        assert output_file.read_text(encoding="utf-8") == "nome,citta\nJosé,Forlì\n"
+
     @pytest.mark.skipif(
         not (TEST_DIR / "utf8_basic.csv").exists(),
         reason="Test fixtures not available",
@@ -80,17 +96,16 @@ class TestProcessCSV:
         assert result == 0
         assert output_file.exists()
 
-    @patch("csvnorm.core.normalize_csv")
-    @patch("csvnorm.core.validate_csv")
-    def test_zip_single_csv(self, mock_validate, mock_normalize, output_dir, tmp_path):
+    @patch("csvnorm.core.validate_and_normalize_csv")
+    def test_zip_single_csv(self, mock_validate, output_dir, tmp_path):
         """Test processing a zip with a single CSV entry."""
-        mock_validate.return_value = (1, [], None)
-
-        def _write_output(*, output_path, **_kwargs):
+        def _write_output(_path, output_path, _reject_file, **_kwargs):
             Path(output_path).write_text("a,b\n1,2\n")
-            return None
+            rejects = {"reject_count": 0, "error_types": [], "error_counts": {}}
+            stats = {"row_count": 1, "column_count": 2, "columns": ["a", "b"]}
+            return rejects, None, stats
 
-        mock_normalize.side_effect = _write_output
+        mock_validate.side_effect = _write_output
 
         zip_path = tmp_path / "data.zip"
         with zipfile.ZipFile(zip_path, "w") as archive:
@@ -108,23 +123,21 @@ class TestProcessCSV:
         assert isinstance(called_path, Path)
         assert called_path.name == "data.csv"
 
-    @patch("csvnorm.core.normalize_csv")
-    @patch("csvnorm.core.validate_csv")
+    @patch("csvnorm.core.validate_and_normalize_csv")
     def test_zip_single_csv_fallback_extract(
         self,
         mock_validate,
-        mock_normalize,
         output_dir,
         tmp_path,
     ):
         """Test zip extraction for nested CSV entries."""
-        mock_validate.return_value = (1, [], None)
-
-        def _write_output(*, output_path, **_kwargs):
+        def _write_output(_path, output_path, _reject_file, **_kwargs):
             Path(output_path).write_text("a,b\n1,2\n")
-            return None
+            rejects = {"reject_count": 0, "error_types": [], "error_counts": {}}
+            stats = {"row_count": 1, "column_count": 2, "columns": ["a", "b"]}
+            return rejects, None, stats
 
-        mock_normalize.side_effect = _write_output
+        mock_validate.side_effect = _write_output
 
         zip_path = tmp_path / "data.zip"
         with zipfile.ZipFile(zip_path, "w") as archive:
@@ -142,9 +155,8 @@ class TestProcessCSV:
         assert isinstance(called_path, Path)
         assert called_path.name == "data.csv"
 
-    @patch("csvnorm.core.normalize_csv")
-    @patch("csvnorm.core.validate_csv")
-    def test_zip_multiple_csvs(self, mock_validate, mock_normalize, output_dir, tmp_path):
+    @patch("csvnorm.core.validate_and_normalize_csv")
+    def test_zip_multiple_csvs(self, mock_validate, output_dir, tmp_path):
         """Test zip error when multiple CSV entries exist."""
         zip_path = tmp_path / "multi.zip"
         with zipfile.ZipFile(zip_path, "w") as archive:
@@ -158,11 +170,9 @@ class TestProcessCSV:
         )
         assert result == 1
         mock_validate.assert_not_called()
-        mock_normalize.assert_not_called()
 
-    @patch("csvnorm.core.normalize_csv")
-    @patch("csvnorm.core.validate_csv")
-    def test_zip_no_csv(self, mock_validate, mock_normalize, output_dir, tmp_path):
+    @patch("csvnorm.core.validate_and_normalize_csv")
+    def test_zip_no_csv(self, mock_validate, output_dir, tmp_path):
         """Test zip error when no CSV entries exist."""
         zip_path = tmp_path / "empty.zip"
         with zipfile.ZipFile(zip_path, "w") as archive:
@@ -175,7 +185,6 @@ class TestProcessCSV:
         )
         assert result == 1
         mock_validate.assert_not_called()
-        mock_normalize.assert_not_called()
 
     @pytest.mark.skipif(
         not (TEST_DIR / "pipe_mixed_headers.csv").exists(),
@@ -285,6 +294,52 @@ class TestProcessCSV:
         assert output_file.exists()
 
 
+class TestReadArrow:
+    """Integration tests for the in-memory Arrow API."""
+
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    @pytest.mark.skipif(
+        not (TEST_DIR / "latin1_semicolon.csv").exists(),
+        reason="Test fixtures not available",
+    )
+    def test_matches_process_csv(self, tmp_path):
+        """Test encoding, dialect and names are handled as in process_csv."""
+        input_file = TEST_DIR / "latin1_semicolon.csv"
+        output_file = tmp_path / "out.csv"
+        assert process_csv(str(input_file), output_file, no_cache=True) == 0
+
+        table, reject_stats = read_arrow(input_file)
+
+        with open(output_file, newline="", encoding="utf-8") as f:
+            header, *rows = list(csv.reader(f))
+        assert table.column_names == header
+        assert [list(row.values()) for row in table.to_pylist()] == rows
+        assert reject_stats["reject_count"] == 0
+
+    def test_gzip_with_rejects(self, tmp_path):
+        """Test gzip input is read by DuckDB and rejects are written."""
+        input_file = tmp_path / "data.csv.gz"
+        with gzip.open(input_file, "wt") as f:
+            f.write("Col A,Col B\n1,2\n3\n4,5\n")
+        reject_file = tmp_path / "reject_errors.csv"
+
+        table, reject_stats = read_arrow(
+            input_file, keep_names=True, reject_file=reject_file
+        )
+
+        assert table.to_pydict() == {"Col A": ["1", "4"], "Col B": ["2", "5"]}
+        assert reject_stats["reject_count"] == 1
+        assert reject_file.exists()
+
+    def test_nonexistent_file(self, tmp_path):
+        """Test a missing input raises instead of returning an empty table."""
+        with pytest.raises(FileNotFoundError):
+            read_arrow(tmp_path / "missing.csv")
+
+
 class TestRemoteURLErrors:
     """Tests for remote URL error scenarios (mocked)."""
 
@@ -316,23 +371,22 @@ class TestRemoteURLErrors:
 
     @patch.object(core_module, "show_warning_panel")
     @patch("csvnorm.core.download_url_to_file")
-    @patch("csvnorm.core.normalize_csv")
-    @patch("csvnorm.core.validate_csv")
+    @patch("csvnorm.core.validate_and_normalize_csv")
     def test_download_remote_flag_warns(
-        self, mock_validate, mock_normalize, mock_download, mock_warning, output_dir
+        self, mock_validate, mock_download, mock_warning, output_dir
     ):
         """Warn when deprecated --download-remote flag is used."""
-        mock_validate.return_value = (1, [], None)
-
         def _write_download(_url, path):
             path.write_text("name,city\nAlice,Milan\n")
 
-        def _write_output(*, output_path, **_kwargs):
+        def _write_output(_path, output_path, _reject_file, **_kwargs):
             Path(output_path).write_text("name,city\nAlice,Milan\n")
-            return None
+            rejects = {"reject_count": 0, "error_types": [], "error_counts": {}}
+            stats = {"row_count": 1, "column_count": 2, "columns": ["a", "b"]}
+            return rejects, None, stats
 
         mock_download.side_effect = _write_download
-        mock_normalize.side_effect = _write_output
+        mock_validate.side_effect = _write_output
 
         output_file = output_dir / "output.csv"
         result = process_csv(
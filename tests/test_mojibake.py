@@ -5,7 +5,13 @@ from pathlib import Path
 import pytest
 
 from csvnorm.cli import main
-from csvnorm.mojibake import detect_mojibake, repair_text, repair_file
+from csvnorm.mojibake import (
+    detect_mojibake,
+    repair_file,
+    repair_text,
+    resolve_jobs,
+    sample_mojibake_regions,
+)
 
 FIXTURES_DIR = Path(__file__).parent.parent / "test"
 
@@ -99,3 +105,126 @@ def test_fix_mojibake_force_mode(tmp_path):
     fixed_text = output_path.read_text(encoding="utf-8")
     assert "â€œ" not in fixed_text
     assert "â€�" not in fixed_text
+
+
+def test_repair_file_streaming_matches_whole_text(tmp_path):
+    """Tiny line-aligned segments give the same result as one fix_text call."""
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    content = (
+        "Nome,Citta,Note\n"
+        "Gianni,CittÃ ,<b>ok</b>\n"
+        "Maria,PerÃ¹,&amp; co\n"
+        "Luca,Roma,â€œQuotedâ€\x9d\n"
+    ) * 20
+    input_path.write_text(content, encoding="utf-8")
+
+    repaired, path_used = repair_file(
+        input_path, output_path, sample_size=0, chunk_size=10
+    )
+
+    _, expected = repair_text(content)
+    assert repaired is True
+    assert path_used == output_path
+    assert output_path.read_text(encoding="utf-8") == expected
+
+
+def test_repair_file_clean_removes_output(tmp_path):
+    """Forced repair of clean text reports no change and leaves no output."""
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    input_path.write_text("Nome,Citta\nGianni,Città\n", encoding="utf-8")
+
+    repaired, path_used = repair_file(input_path, output_path, sample_size=0)
+
+    assert repaired is False
+    assert path_used == input_path
+    assert not output_path.exists()
+
+
+def test_sample_mojibake_regions_finds_tail(tmp_path):
+    """Mojibake confined to the end of the file is caught by a later window."""
+    input_path = tmp_path / "input.csv"
+    clean = "Nome,Citta\n" + "Gianni,Roma\n" * 2000
+    input_path.write_text(clean + "Maria,CittÃ  di PerÃ¹\n" * 5, encoding="utf-8")
+
+    regions = sample_mojibake_regions(input_path, sample_size=200, regions=4)
+
+    assert len(regions) == 4
+    assert regions[0][2] is False
+    assert regions[-1][2] is True
+    # Non-initial windows start on a line boundary
+    raw = input_path.read_bytes()
+    assert all(raw[offset - 1 : offset] == b"\n" for offset, _, _ in regions[1:])
+
+
+def test_sample_mojibake_regions_empty(tmp_path):
+    input_path = tmp_path / "empty.csv"
+    input_path.write_text("")
+    assert sample_mojibake_regions(input_path, sample_size=100) == []
+
+
+def test_repair_file_detects_tail_mojibake(tmp_path):
+    """repair_file repairs files whose first sample is clean."""
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    clean = "Nome,Citta\n" + "Gianni,Roma\n" * 2000
+    input_path.write_text(clean + "Maria,CittÃ  di PerÃ¹\n", encoding="utf-8")
+
+    repaired, path_used = repair_file(input_path, output_path, sample_size=500)
+
+    assert repaired is True
+    assert "Città di Perù" in output_path.read_text(encoding="utf-8")
+
+
+PARALLEL_CORPUS = {
+    "mojibake_lf": "Nome,Citta\n" + "Gianni,CittÃ  di PerÃ¹\nLuca,Roma\n" * 300,
+    "mojibake_crlf": "Nome,Citta\r\n" + "Gianni,CittÃ \r\nLuca,â€œRomaâ€\x9d\r\n" * 300,
+    "lone_cr": "a,b\r" + "CittÃ ,1\r" * 200,
+    "html_late": "a,b\n" + "CittÃ ,1\n" * 200 + "<b>x</b>,&amp;\n" + "y,&eacute;\n" * 200,
+    "multibyte": "k,v\n" + "日本語,CittÃ \n" * 300,
+    "no_trailing_newline": "a,b\n" + "CittÃ ,1\n" * 100 + "last,PerÃ¹",
+    "clean": "a,b\n" + "Città,1\n" * 300,
+}
+
+
+@pytest.mark.parametrize("name", sorted(PARALLEL_CORPUS))
+def test_repair_file_parallel_matches_serial(tmp_path, name):
+    """Process-pool repair is byte-identical to the serial path."""
+    input_path = tmp_path / f"{name}.csv"
+    input_path.write_bytes(PARALLEL_CORPUS[name].encode("utf-8"))
+    serial_path = tmp_path / "serial.csv"
+    parallel_path = tmp_path / "parallel.csv"
+
+    serial = repair_file(input_path, serial_path, sample_size=0, chunk_size=64)
+    parallel = repair_file(
+        input_path, parallel_path, sample_size=0, chunk_size=64, jobs=3
+    )
+
+    assert serial[0] == parallel[0]
+    if serial[0]:
+        assert parallel_path.read_bytes() == serial_path.read_bytes()
+    else:
+        assert not parallel_path.exists()
+
+
+@pytest.mark.skipif(
+    not (FIXTURES_DIR / "alberi_messina_mojibake.csv").exists(),
+    reason="Mojibake fixture not available",
+)
+def test_repair_file_parallel_fixture(tmp_path):
+    input_path = FIXTURES_DIR / "alberi_messina_mojibake.csv"
+    serial_path = tmp_path / "serial.csv"
+    parallel_path = tmp_path / "parallel.csv"
+
+    repair_file(input_path, serial_path, sample_size=0)
+    repair_file(input_path, parallel_path, sample_size=0, chunk_size=4096, jobs=4)
+
+    assert parallel_path.read_bytes() == serial_path.read_bytes()
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) >= 1
+    with pytest.raises(ValueError, match="jobs must be non-negative"):
+        resolve_jobs(-1)
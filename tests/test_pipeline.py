@@ -0,0 +1,98 @@
+"""Tests for streaming pre-processing stages through a named pipe."""
+
+import threading
+
+import duckdb
+import pytest
+
+from csvnorm.pipeline import FifoStage, fifo_supported
+
+pytestmark = pytest.mark.skipif(not fifo_supported(), reason="no named pipes")
+
+# Explicit dialect and columns: DuckDB only reads a pipe once with these
+PIPE_OPTS = (
+    "all_varchar=true, store_rejects=true, delim=',', quote='\"', header=true, "
+    "auto_detect=false, columns={'a': 'VARCHAR', 'b': 'VARCHAR'}"
+)
+
+
+def _fetch(path, opts=PIPE_OPTS, timeout=10.0):
+    """Read path with DuckDB in a thread, failing instead of hanging."""
+    outcome = {}
+
+    def query():
+        try:
+            outcome["rows"] = duckdb.sql(
+                f"SELECT * FROM read_csv('{path}', {opts})"
+            ).fetchall()
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=query, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "DuckDB blocked reading the pipe"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["rows"]
+
+
+def _copy_stage(tmp_path, text="a,b\n1,2\n3,4\n"):
+    source = tmp_path / "source.csv"
+    source.write_text(text)
+
+    def produce(path):
+        path.write_text(source.read_text())
+        return "done"
+
+    return FifoStage("copy", produce, tmp_path / "stage.csv", source=source)
+
+
+def test_duckdb_reads_stage_through_pipe(tmp_path):
+    stage = _copy_stage(tmp_path)
+    with stage as path:
+        assert path.is_fifo()
+        rows = _fetch(path)
+
+    assert rows == [("1", "2"), ("3", "4")]
+    assert stage.result == "done"
+    assert not stage.path.exists()
+
+
+def test_unread_pipe_releases_producer(tmp_path):
+    stage = _copy_stage(tmp_path, "a,b\n" + "1,2\n" * 100000)
+    with stage:
+        pass
+
+    assert not stage.path.exists()
+
+
+def test_head_stops_producer(tmp_path):
+    stage = _copy_stage(tmp_path, "a,b\n" + "1,2\n" * 100000)
+
+    assert stage.head(8) == b"a,b\n1,2\n"
+    assert not stage.path.exists()
+
+
+@pytest.mark.parametrize("write_first", [True, False])
+def test_producer_error_is_raised(tmp_path, write_first):
+    def produce(path):
+        if write_first:
+            with open(path, "w") as f:
+                f.write("a,b\n")
+        raise UnicodeDecodeError("cp1252", b"\x81", 0, 1, "undefined")
+
+    stage = FifoStage("transcode", produce, tmp_path / "stage.csv", source=tmp_path)
+    with pytest.raises(UnicodeDecodeError):
+        with stage as path:
+            _fetch(path)
+
+    assert not stage.path.exists()
+
+
+def test_materialize_writes_regular_file(tmp_path):
+    stage = _copy_stage(tmp_path)
+
+    assert stage.materialize() == stage.path
+    assert stage.path.read_text() == "a,b\n1,2\n3,4\n"
+    assert stage.result == "done"
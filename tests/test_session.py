@@ -0,0 +1,121 @@
+"""Tests for the shared DuckDB session."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, call, patch
+
+import duckdb
+import pytest
+
+from csvnorm.session import CsvnormSession, _ensure_zipfs_extension
+from csvnorm.validation import normalize_csv, validate_csv
+
+
+class TestZipfsExtension:
+    """Tests for zipfs extension handling."""
+
+    def test_ensure_zipfs_skips_non_zip(self):
+        conn = Mock()
+        _ensure_zipfs_extension(conn, Path("data.csv"))
+        conn.execute.assert_not_called()
+
+    def test_ensure_zipfs_installs_when_missing(self):
+        conn = Mock()
+        conn.execute.side_effect = [duckdb.Error("missing"), None, None]
+
+        _ensure_zipfs_extension(conn, "zip://archive.zip/data.csv")
+
+        assert conn.execute.call_args_list == [
+            call("LOAD zipfs"),
+            call("INSTALL zipfs FROM community"),
+            call("LOAD zipfs"),
+        ]
+
+
+class TestCsvnormSession:
+    """Tests for CsvnormSession connection reuse and settings."""
+
+    def test_settings_applied_to_connection(self):
+        """threads, memory_limit and temp_directory reach DuckDB."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with CsvnormSession(
+                threads=2, memory_limit="512MB", temp_directory=tmpdir
+            ) as session:
+                threads, temp_dir = session.connection.execute(
+                    "SELECT current_setting('threads'), "
+                    "current_setting('temp_directory')"
+                ).fetchone()
+
+        assert threads == 2
+        assert temp_dir == tmpdir
+
+    def test_settings_read_from_environment(self, monkeypatch):
+        """Unset settings fall back to CSVNORM_* environment variables."""
+        monkeypatch.setenv("CSVNORM_THREADS", "3")
+        monkeypatch.setenv("CSVNORM_MEMORY_LIMIT", "1GB")
+        monkeypatch.setenv("CSVNORM_PRESERVE_INSERTION_ORDER", "false")
+
+        session = CsvnormSession(memory_limit="2GB")
+
+        assert session.threads == 3
+        assert session.memory_limit == "2GB"
+        assert session.preserve_insertion_order is False
+        preserve = session.connection.execute(
+            "SELECT current_setting('preserve_insertion_order')"
+        ).fetchone()[0]
+        session.close()
+        assert preserve is False
+
+    @pytest.mark.parametrize(
+        "name,value",
+        [("CSVNORM_THREADS", "many"), ("CSVNORM_PRESERVE_INSERTION_ORDER", "maybe")],
+    )
+    def test_invalid_environment_raises(self, monkeypatch, name, value):
+        """Malformed environment values raise ValueError."""
+        monkeypatch.setenv(name, value)
+        with pytest.raises(ValueError, match=name):
+            CsvnormSession()
+
+    @patch("csvnorm.session.duckdb.connect")
+    def test_connection_and_setup_reused(self, mock_connect):
+        """One connection; remote setup runs once across stages."""
+        conn = Mock()
+        mock_connect.return_value = conn
+        session = CsvnormSession()
+
+        assert session.prepare("https://example.com/a.csv", is_remote=True) is conn
+        assert session.prepare("https://example.com/a.csv", is_remote=True) is conn
+
+        mock_connect.assert_called_once()
+        executed = [c.args[0] for c in conn.execute.call_args_list]
+        assert executed.count("SET http_timeout=30000") == 1
+
+    def test_close_then_reopen(self):
+        """close() releases the connection; the next access opens a new one."""
+        session = CsvnormSession()
+        first = session.connection
+        session.close()
+        second = session.connection
+        assert second is not first
+        session.close()
+
+    def test_stages_share_dialect_and_reset_rejects(self):
+        """Validation records the dialect; rejects do not leak between scans."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad = Path(tmpdir) / "bad.csv"
+            bad.write_text("a,b\n1,2\n3\n")
+            good = Path(tmpdir) / "good.csv"
+            good.write_text("title\na;b\n1;2\n")
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+            output = Path(tmpdir) / "out.csv"
+
+            with CsvnormSession() as session:
+                bad_stats, _ = validate_csv(bad, reject_file, session=session)
+                good_stats, fallback = validate_csv(good, reject_file, session=session)
+                assert session.dialect == fallback == {"delim": ";", "skip": 1}
+
+                normalize_csv(good, output, session=session)
+
+            assert bad_stats["reject_count"] == 1
+            assert good_stats["reject_count"] == 0
+            assert output.read_text() == "a,b\n1,2\n"
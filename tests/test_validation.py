@@ -1,137 +1,90 @@
 """Tests for validation module internal functions."""
 
+import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import duckdb
 import pytest
 
+from csvnorm.pipeline import FifoStage, fifo_supported
+from csvnorm.session import CsvnormSession, Dialect, _drop_reject_tables
 from csvnorm.validation import (
-    _count_lines,
+    _build_copy_opts,
     _detect_header_anomaly,
-    _ensure_zipfs_extension,
-    _fix_duckdb_keyword_prefix,
-    _get_error_types,
+    _export_rejects,
+    _probe_fallback_configs,
+    _scan_with_fallbacks,
+    _sniff_dialect,
+    _select_list,
     _try_read_csv_with_config,
+    _import_pyarrow,
     normalize_csv,
+    normalize_to_arrow,
+    validate_and_normalize_csv,
     validate_csv,
 )
 
 
-class TestCountLines:
-    """Tests for _count_lines internal function."""
+class TestExportRejects:
+    """Tests for SQL aggregation of the reject_errors table."""
 
-    def test_nonexistent_file(self):
-        """Test that nonexistent file returns 0."""
-        result = _count_lines(Path("/nonexistent/file.csv"))
-        assert result == 0
+    def _scan(self, tmpdir: str, content: str) -> duckdb.DuckDBPyConnection:
+        input_file = Path(tmpdir) / "input.csv"
+        input_file.write_text(content)
+        conn = duckdb.connect()
+        conn.execute(
+            f"SELECT COUNT(*) FROM read_csv('{input_file}', store_rejects=true, "
+            "sample_size=-1, all_varchar=true)"
+        ).fetchall()
+        return conn
 
-    def test_empty_file(self):
-        """Test that empty file returns 0."""
+    def test_counts_grouped_by_error_type(self):
+        """Counts per error type, most frequent first, and file exported."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            empty_file = Path(tmpdir) / "empty.csv"
-            empty_file.touch()
-            result = _count_lines(empty_file)
-            assert result == 0
-
-    def test_file_with_lines(self):
-        """Test counting lines in a normal file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.csv"
-            test_file.write_text("line1\nline2\nline3\n")
-            result = _count_lines(test_file)
-            assert result == 3
-
-
-class TestGetErrorTypes:
-    """Tests for _get_error_types internal function."""
-
-    def test_nonexistent_file(self):
-        """Test that nonexistent file returns empty list."""
-        result = _get_error_types(Path("/nonexistent/reject_errors.csv"))
-        assert result == []
+            conn = self._scan(tmpdir, "a,b\n1,2\n3\n4,5,6\n7,8\n9\n")
+            reject_file = Path(tmpdir) / "reject_errors.csv"
 
-    def test_empty_file(self):
-        """Test that empty file returns empty list."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            empty_file = Path(tmpdir) / "reject_errors.csv"
-            empty_file.touch()
-            result = _get_error_types(empty_file)
-            assert result == []
+            stats = _export_rejects(conn, reject_file)
+            conn.close()
 
-    def test_only_header(self):
-        """Test that file with only header returns empty list."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            header_file = Path(tmpdir) / "reject_errors.csv"
-            header_file.write_text("scan_id,file,line,column_idx,column_name,error\n")
-            result = _get_error_types(header_file)
-            assert result == []
+            assert stats["reject_count"] == 3
+            assert stats["error_counts"] == {
+                "MISSING COLUMNS": 2,
+                "TOO MANY COLUMNS": 1,
+            }
+            assert len(stats["error_types"]) == 2
+            assert "Found: 1" in stats["error_types"][0]
+            assert len(reject_file.read_text().splitlines()) == 4
 
-    def test_valid_errors(self):
-        """Test extracting error types from valid reject file."""
+    def test_no_rejects_writes_no_file(self):
+        """Nothing rejected: no file written and a stale one is removed."""
         with tempfile.TemporaryDirectory() as tmpdir:
+            conn = self._scan(tmpdir, "a,b\n1,2\n")
             reject_file = Path(tmpdir) / "reject_errors.csv"
-            # DuckDB reject_errors format: scan_id,file,line,column_idx,column_name,error
-            reject_file.write_text(
-                "scan_id,file,line,column_idx,column_name,error\n"
-                "1,test.csv,2,3,age,CAST\n"
-                "2,test.csv,3,1,name,UNQUOTED_VALUE\n"
-                "3,test.csv,4,3,age,CAST\n"
-            )
-            result = _get_error_types(reject_file)
-            # Should return unique error types
-            assert len(result) <= 3
-            assert "CAST" in result or "UNQUOTED_VALUE" in result
+            reject_file.write_text("stale\n")
 
-    def test_malformed_csv(self):
-        """Test handling malformed reject file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            malformed_file = Path(tmpdir) / "reject_errors.csv"
-            # Write some malformed content
-            malformed_file.write_text("scan_id,file,line\ngarbage,data")
-            # Should not crash, returns empty list or partial results
-            result = _get_error_types(malformed_file)
-            assert isinstance(result, list)
-
-    def test_max_three_errors(self):
-        """Test that maximum 3 unique error types are returned."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reject_file = Path(tmpdir) / "reject_errors.csv"
-            # Create file with 5 different error types
-            reject_file.write_text(
-                "scan_id,file,line,column_idx,column_name,error\n"
-                "1,test.csv,2,1,col1,ERROR_TYPE_1\n"
-                "2,test.csv,3,1,col1,ERROR_TYPE_2\n"
-                "3,test.csv,4,1,col1,ERROR_TYPE_3\n"
-                "4,test.csv,5,1,col1,ERROR_TYPE_4\n"
-                "5,test.csv,6,1,col1,ERROR_TYPE_5\n"
-            )
-            result = _get_error_types(reject_file)
-            # Should return at most 3 unique errors
-            assert len(result) <= 3
+            stats = _export_rejects(conn, reject_file)
+            conn.close()
 
-    def test_unicode_decode_error(self):
-        """Test handling of undecodable reject file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reject_file = Path(tmpdir) / "reject_errors.csv"
-            reject_file.write_bytes(b"\xff\xfe\xfa")
-            result = _get_error_types(reject_file)
-            assert result == []
+            assert stats == {"reject_count": 0, "error_types": [], "error_counts": {}}
+            assert not reject_file.exists()
 
 
-class TestFixDuckdbKeywordPrefix:
-    """Tests for _fix_duckdb_keyword_prefix internal function."""
+class TestKeywordPrefixRename:
+    """Tests for in-query renaming of DuckDB keyword-prefixed columns."""
 
     def test_removes_keyword_prefix_from_header(self):
         """Test removing underscore prefix from DuckDB SQL keywords only."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.csv"
-            test_file.write_text("_value,_location,_data,bar\n1,2,3,4\n")
+            input_file = Path(tmpdir) / "test.csv"
+            input_file.write_text("Value,Location,Data,Bar\n1,2,3,4\n")
+            output_file = Path(tmpdir) / "out.csv"
 
-            _fix_duckdb_keyword_prefix(test_file)
+            normalize_csv(input_file, output_file)
 
-            with open(test_file, "r") as f:
+            with open(output_file, "r") as f:
                 header = f.readline().strip()
                 data = f.readline().strip()
 
@@ -141,27 +94,25 @@ class TestFixDuckdbKeywordPrefix:
     def test_preserves_non_keyword_underscore_columns(self):
         """Test that non-keyword columns like _id are preserved."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.csv"
-            test_file.write_text("_id,_value,_source,_order\n1,2,3,4\n")
+            input_file = Path(tmpdir) / "test.csv"
+            input_file.write_text("_id,value,_source,order\n1,2,3,4\n")
+            output_file = Path(tmpdir) / "out.csv"
 
-            _fix_duckdb_keyword_prefix(test_file)
+            normalize_csv(input_file, output_file, delimiter=";")
 
-            with open(test_file, "r") as f:
+            with open(output_file, "r") as f:
                 header = f.readline().strip()
                 data = f.readline().strip()
 
             # _id and _source are NOT DuckDB keywords -> preserved
-            # _value and _order ARE DuckDB keywords -> stripped
-            assert header == "_id,value,_source,order"
-            assert data == "1,2,3,4"
+            # value and order ARE DuckDB keywords -> prefix removed again
+            assert header == "_id;value;_source;order"
+            assert data == "1;2;3;4"
 
-    def test_empty_file_no_change(self):
-        """Test that empty file is handled gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "empty.csv"
-            test_file.touch()
-            _fix_duckdb_keyword_prefix(test_file)
-            assert test_file.read_text() == ""
+    def test_keep_names_uses_plain_select(self):
+        """Without name normalization no rename projection is generated."""
+        assert _select_list(False) == "*"
+        assert "COLUMNS" in _select_list(True)
 
 
 class TestDetectHeaderAnomaly:
@@ -238,27 +189,6 @@ class TestTryReadCsvWithConfig:
             assert result is False
 
 
-class TestZipfsExtension:
-    """Tests for zipfs extension handling."""
-
-    def test_ensure_zipfs_skips_non_zip(self):
-        conn = Mock()
-        _ensure_zipfs_extension(conn, Path("data.csv"))
-        conn.execute.assert_not_called()
-
-    def test_ensure_zipfs_installs_when_missing(self):
-        conn = Mock()
-        conn.execute.side_effect = [duckdb.Error("missing"), None, None]
-
-        _ensure_zipfs_extension(conn, "zip://archive.zip/data.csv")
-
-        assert conn.execute.call_args_list == [
-            call("LOAD zipfs"),
-            call("INSTALL zipfs FROM community"),
-            call("LOAD zipfs"),
-        ]
-
-
 class TestValidateCsv:
     """Tests for validate_csv main function."""
 
@@ -268,46 +198,96 @@ class TestValidateCsv:
             test_file = Path(tmpdir) / "skip.csv"
             test_file.write_text("title row\ncol1,col2\n1,2\n")
             reject_file = Path(tmpdir) / "reject_errors.csv"
-            reject_count, error_types, fallback = validate_csv(
+            reject_stats, fallback = validate_csv(
                 test_file, reject_file, skip_rows=1
             )
-            assert isinstance(reject_count, int)
-            assert isinstance(error_types, list)
+            assert reject_stats["reject_count"] == 0
             assert fallback == {"delim": ",", "skip": 1}
 
+    @patch("csvnorm.validation._sniff_dialect")
+    def test_confident_sample_skips_duckdb_sniff(self, mock_sniff, tmp_path):
+        """A confidently scored sample is passed to read_csv without sniffing."""
+        test_file = tmp_path / "data.csv"
+        rows = "".join(f"{i};item {i};{i},5\n" for i in range(30))
+        test_file.write_text("id;name;price\n" + rows)
+
+        reject_stats, fallback = validate_csv(test_file, tmp_path / "rejects.csv")
+
+        mock_sniff.assert_not_called()
+        assert reject_stats["reject_count"] == 0
+        assert fallback is None
+
     @patch("csvnorm.validation._detect_header_anomaly")
-    @patch("csvnorm.validation._try_read_csv_with_config")
+    @patch("csvnorm.validation._probe_fallback_configs")
     @patch("csvnorm.validation.duckdb.connect")
     def test_fallback_configs_used_on_sniffing_error(
-        self, mock_connect, mock_try_read, mock_detect
+        self, mock_connect, mock_probe, mock_detect
     ):
-        """Fallback iteration is used when sniffing fails."""
+        """The probed fallback config is used when sniffing fails."""
         mock_detect.return_value = None
-        mock_try_read.side_effect = (
-            lambda _conn, _path, cfg, **_kw: cfg["delim"] == "|" and cfg["skip"] == 1
-        )
+        mock_probe.return_value = {"delim": "|", "skip": 1}
+
+        def _execute(query):
+            if "delim='|'" not in query and "csv(" in query:
+                raise duckdb.Error("sniffing failed")
+            result = Mock()
+            result.fetchone.return_value = (
+                ("|", '"', '"', 1, True, []) if "sniff_csv" in query else (0,)
+            )
+            result.fetchall.return_value = []
+            return result
 
         mock_conn = Mock()
         mock_connect.return_value = mock_conn
-        mock_conn.execute.side_effect = [
-            duckdb.Error("sniffing failed"),
-            Mock(fetchall=lambda: []),
-            None,
-        ]
+        mock_conn.execute.side_effect = _execute
 
         with tempfile.TemporaryDirectory() as tmpdir:
             test_file = Path(tmpdir) / "pipe.csv"
             test_file.write_text("a|b\n1|2\n")
             reject_file = Path(tmpdir) / "reject_errors.csv"
-            reject_count, error_types, fallback = validate_csv(
-                test_file, reject_file
-            )
+            reject_stats, fallback = validate_csv(test_file, reject_file)
 
-        assert reject_count == 0
-        assert error_types == []
+        assert reject_stats["reject_count"] == 0
+        assert reject_stats["error_types"] == []
         assert fallback == {"delim": "|", "skip": 1}
 
 
+class TestProbeFallbackConfigs:
+    """Tests for concurrent fallback dialect probing."""
+
+    def test_picks_most_consistent_config(self, tmp_path):
+        """The config that parses the most sample rows wins."""
+        test_file = tmp_path / "titled.csv"
+        rows = "".join(f"{i}|x{i}|y{i}\n" for i in range(50))
+        test_file.write_text("Report title\na|b|c\n" + rows)
+        configs = [
+            {"delim": ",", "skip": 0},
+            {"delim": "|", "skip": 0},
+            {"delim": "|", "skip": 1},
+        ]
+
+        conn = duckdb.connect()
+        try:
+            best = _probe_fallback_configs(conn, test_file, configs)
+        finally:
+            conn.close()
+
+        assert best == {"delim": "|", "skip": 1}
+
+    def test_returns_none_when_nothing_fits(self, tmp_path):
+        """Single-column results are not accepted."""
+        test_file = tmp_path / "single.csv"
+        test_file.write_text("a\n1\n2\n")
+
+        conn = duckdb.connect()
+        try:
+            best = _probe_fallback_configs(conn, test_file, [{"delim": ";", "skip": 0}])
+        finally:
+            conn.close()
+
+        assert best is None
+
+
 class TestNormalizeCsv:
     """Tests for normalize_csv main function."""
 
@@ -339,3 +319,491 @@ class TestNormalizeCsv:
             )
 
         assert result == {"delim": ";", "skip": 1}
+
+    def test_known_dialect_is_passed_explicitly(self, tmp_path):
+        """A dialect from validation is used as-is instead of re-sniffing."""
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("1;2\n3;4\n")
+        output_file = tmp_path / "out.csv"
+        dialect: Dialect = {
+            "delimiter": ";",
+            "quote": "(empty)",
+            "escape": "(empty)",
+            "skip": 0,
+            "header": False,
+            "columns": [],
+        }
+
+        normalize_csv(input_file, output_file, dialect=dialect)
+
+        assert output_file.read_text() == "column0,column1\n1,2\n3,4\n"
+
+    def test_parquet_output(self, tmp_path):
+        """normalize_csv writes Parquet with the same COPY."""
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("Col A;Col B\n1;2\n")
+        output_file = tmp_path / "out.parquet"
+
+        normalize_csv(input_file, output_file, output_format="parquet")
+
+        relation = duckdb.sql(f"SELECT * FROM read_parquet('{output_file}')")
+        assert relation.columns == ["col_a", "col_b"]
+        assert relation.fetchall() == [("1", "2")]
+
+
+class TestBuildCopyOpts:
+    """Tests for COPY option strings."""
+
+    def test_csv_delimiter(self):
+        assert _build_copy_opts(";") == "header true, format csv, delimiter ';'"
+
+    def test_parquet_settings(self):
+        opts = _build_copy_opts(
+            ";", output_format="parquet",
+            parquet={"codec": "zstd", "compression_level": 9, "row_group_size": 1000},
+        )
+        assert opts == (
+            "format parquet, compression zstd, compression_level 9, "
+            "row_group_size 1000"
+        )
+
+    def test_parquet_defaults(self):
+        assert _build_copy_opts(",", output_format="parquet") == (
+            "format parquet, compression snappy"
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"output_format": "xlsx"},
+            {
+                "output_format": "parquet",
+                "parquet": {
+                    "codec": "zip", "compression_level": None, "row_group_size": None,
+                },
+            },
+        ],
+    )
+    def test_unknown_format_or_codec(self, kwargs):
+        with pytest.raises(ValueError, match="Unknown"):
+            _build_copy_opts(",", **kwargs)
+
+
+class TestNormalizeToArrow:
+    """Tests for normalize_to_arrow."""
+
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_table_with_rejects(self, tmp_path):
+        """The fallback dialect, names and rejects apply to the Table."""
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("Col A;Col B\n1;2\n3;4;5\n6;7\n")
+        reject_file = tmp_path / "reject_errors.csv"
+
+        table, reject_stats = normalize_to_arrow(input_file, reject_file=reject_file)
+
+        assert table.to_pydict() == {"col_a": ["1", "6"], "col_b": ["2", "7"]}
+        assert reject_stats is not None
+        assert reject_stats["reject_count"] == 1
+        assert reject_file.exists()
+
+    def test_without_reject_file(self, tmp_path):
+        """Rejects are counted but not written when no reject file is given."""
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("a,b\n1,2\n3\n")
+
+        _, reject_stats = normalize_to_arrow(input_file, normalize_names=False)
+
+        assert reject_stats is not None
+        assert reject_stats["reject_count"] == 1
+        assert list(tmp_path.iterdir()) == [input_file]
+
+    def test_reader_streams_from_session(self, tmp_path):
+        """A RecordBatchReader scans as it is consumed; rejects land in the session."""
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("a,b\n" + "".join(f"{i},x\n" for i in range(10)) + "y\n")
+
+        with CsvnormSession() as session:
+            reader, reject_stats = normalize_to_arrow(
+                input_file, session=session, as_reader=True, batch_size=4
+            )
+            batches = list(reader)
+            rejects = session.connection.execute(
+                "SELECT COUNT(*) FROM reject_errors"
+            ).fetchone()
+
+        assert reject_stats is None
+        assert sum(batch.num_rows for batch in batches) == 10
+        assert rejects == (1,)
+
+    def test_reader_needs_session(self, tmp_path):
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("a,b\n1,2\n")
+
+        with pytest.raises(ValueError, match="session"):
+            normalize_to_arrow(input_file, as_reader=True)
+
+    def test_missing_pyarrow(self, monkeypatch):
+        """Without pyarrow the error says how to install it."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(ImportError, match=r"csvnorm\[arrow\]"):
+            _import_pyarrow()
+
+
+class TestSniffDialect:
+    """Tests for one-shot dialect discovery with sniff_csv()."""
+
+    def test_returns_full_dialect(self, tmp_path):
+        test_file = tmp_path / "data.csv"
+        test_file.write_text('id|name\n1|"a|b"\n2|c\n')
+
+        conn = duckdb.connect()
+        try:
+            dialect = _sniff_dialect(conn, test_file, "all_varchar=true", 100)
+        finally:
+            conn.close()
+
+        assert dialect == {
+            "delimiter": "|",
+            "quote": '"',
+            "escape": "(empty)",
+            "skip": 0,
+            "header": True,
+            "columns": ["id", "name"],
+        }
+
+    @patch("csvnorm.validation._detect_header_anomaly", return_value=None)
+    @patch("csvnorm.validation._confident_dialect", return_value=None)
+    def test_failed_sniff_goes_to_fallbacks(self, _mock_conf, _mock_detect, tmp_path):
+        """A failed sample sniff probes fallbacks without a whole-file scan."""
+        test_file = tmp_path / "data.csv"
+        test_file.write_text("Title\na;b\n1;2\n3;4\n")
+        sniff = _sniff_dialect
+        calls = []
+
+        def _fake_sniff(conn, path, read_opts, sample_size):
+            calls.append((read_opts, sample_size))
+            if "delim=" not in read_opts:
+                raise duckdb.InvalidInputException("Error when sniffing file")
+            return sniff(conn, path, read_opts, sample_size)
+
+        with patch("csvnorm.validation._sniff_dialect", side_effect=_fake_sniff):
+            reject_stats, fallback = validate_csv(test_file, tmp_path / "rejects.csv")
+
+        assert fallback == {"delim": ";", "skip": 1}
+        assert reject_stats["reject_count"] == 0
+        assert all(sample_size != -1 for _, sample_size in calls)
+
+
+class TestScanWithFallbacks:
+    """Tests for the read_csv fallback cascade."""
+
+    def test_no_fallback_after_failed_scan_without_rescan(self, tmp_path):
+        """A scan that may have written output is not repeated with another dialect."""
+        input_file = tmp_path / "input.csv"
+        input_file.write_text("a,b\n1,2\n3,4\n")
+        conn = duckdb.connect()
+        run_scan = Mock(
+            side_effect=duckdb.InvalidInputException("Error when sniffing file")
+        )
+
+        with pytest.raises(duckdb.InvalidInputException):
+            _scan_with_fallbacks(conn, input_file, run_scan, allow_rescan=False)
+
+        assert run_scan.call_count == 1
+        conn.close()
+
+
+class TestValidateAndNormalizeCsv:
+    """Tests for validate_and_normalize_csv fused single-pass function."""
+
+    def test_writes_output_and_rejects_in_one_pass(self):
+        """Normalized output and reject file come from the same scan."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "malformed.csv"
+            input_file.write_text("Col A,Col B\n1,2\n3\n4,5,6\n7,8\n")
+            output_file = Path(tmpdir) / "out.csv"
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+
+            reject_stats, fallback, stats = validate_and_normalize_csv(
+                input_file, output_file, reject_file
+            )
+
+            assert output_file.read_text() == "col_a,col_b\n1,2\n7,8\n"
+            assert reject_stats["reject_count"] == 2
+            assert len(reject_stats["error_types"]) == 2
+            assert fallback is None
+            assert stats == {
+                "row_count": 2,
+                "column_count": 2,
+                "columns": ["col_a", "col_b"],
+            }
+
+    @pytest.mark.skipif(not fifo_supported(), reason="no named pipes")
+    def test_stage_streams_through_pipe(self, tmp_path):
+        """With a confident dialect the stage is read from a pipe, not a file."""
+        source = tmp_path / "source.csv"
+        source.write_text("First Name;b\n" + "".join(f"{i};x\n" for i in range(20)))
+        output_file = tmp_path / "out.csv"
+        written = []
+
+        def produce(path):
+            written.append(path.is_fifo())
+            path.write_text(source.read_text())
+
+        stage = FifoStage("copy", produce, tmp_path / "stage.csv", source=source)
+        _, _, stats = validate_and_normalize_csv(
+            stage.path, output_file, tmp_path / "rejects.csv", stage=stage
+        )
+
+        # Once for the head (column names), once for the scan
+        assert written == [True, True]
+        assert stats["row_count"] == 20
+        assert stats["columns"] == ["first_name", "b"]
+        assert not stage.path.exists()
+
+    @pytest.mark.skipif(not fifo_supported(), reason="no named pipes")
+    def test_stage_rejects_rescanned_only_if_dialect_differs(self, tmp_path):
+        """Rejected rows trigger a whole-file sniff of the stage written to disk."""
+        source = tmp_path / "source.csv"
+        source.write_text("a;b\n" + "".join(f"{i};x\n" for i in range(20)) + "1\n")
+        output_file = tmp_path / "out.csv"
+
+        stage = FifoStage(
+            "copy",
+            lambda path: path.write_text(source.read_text()),
+            tmp_path / "stage.csv",
+            source=source,
+        )
+        with patch(
+            "csvnorm.validation._drop_reject_tables", wraps=_drop_reject_tables
+        ) as drop:
+            reject_stats, _, stats = validate_and_normalize_csv(
+                stage.path, output_file, tmp_path / "rejects.csv", stage=stage
+            )
+
+        assert stage.path.is_file()
+        assert drop.call_count == 0
+        assert reject_stats["reject_count"] == 1
+        assert stats["row_count"] == 20
+
+    @pytest.mark.skipif(not fifo_supported(), reason="no named pipes")
+    def test_stage_error_removes_partial_output(self, tmp_path):
+        """A producer failing mid-stream leaves no truncated output behind."""
+        source = tmp_path / "source.csv"
+        source.write_text("a;b\n" + "".join(f"{i};x\n" for i in range(20)))
+        output_file = tmp_path / "out.csv"
+        calls = []
+
+        def produce(path):
+            calls.append(path)
+            with open(path, "w") as f:
+                f.write(source.read_text())
+                if len(calls) > 1:
+                    raise UnicodeDecodeError("cp1252", b"\x81", 0, 1, "undefined")
+
+        stage = FifoStage("transcode", produce, tmp_path / "stage.csv", source=source)
+        with pytest.raises(UnicodeDecodeError):
+            validate_and_normalize_csv(
+                stage.path, output_file, tmp_path / "rejects.csv", stage=stage
+            )
+
+        assert not output_file.exists()
+
+    def test_row_count_counts_records_not_lines(self):
+        """Quoted newlines do not inflate the reported row count."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "multiline.csv"
+            input_file.write_text('id;note\n1;"line one\nline two"\n2;plain\n')
+            output_file = Path(tmpdir) / "out.tsv"
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+
+            _, _, stats = validate_and_normalize_csv(
+                input_file, output_file, reject_file, delimiter="\t"
+            )
+
+            assert stats["row_count"] == 2
+            assert stats["columns"] == ["id", "note"]
+
+    def test_per_thread_output_writes_part_files(self):
+        """per_thread_output writes a directory of part files with headers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "data.csv"
+            body = "".join(f"{i},x\n" for i in range(500))
+            input_file.write_text("Col A,Col B\n" + body)
+            output_dir = Path(tmpdir) / "parts"
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+
+            with CsvnormSession(threads=2, preserve_insertion_order=False) as session:
+                _, _, stats = validate_and_normalize_csv(
+                    input_file, output_dir, reject_file,
+                    session=session, per_thread_output=True,
+                )
+
+            parts = sorted(output_dir.glob("*.csv"))
+            assert parts
+            rows = []
+            for part in parts:
+                lines = part.read_text().splitlines()
+                assert lines[0] == "col_a,col_b"
+                rows.extend(lines[1:])
+            assert sorted(rows) == sorted(f"{i},x" for i in range(500))
+            assert stats["row_count"] == 500
+            assert stats["columns"] == ["col_a", "col_b"]
+
+    def test_parquet_output_from_same_scan(self, tmp_path):
+        """Parquet is written by the fused COPY, with rejects and stats."""
+        input_file = tmp_path / "malformed.csv"
+        input_file.write_text("Col A,select\n1,2\n3\n7,8\n")
+        output_file = tmp_path / "out.parquet"
+        reject_file = tmp_path / "reject_errors.csv"
+
+        reject_stats, _, stats = validate_and_normalize_csv(
+            input_file, output_file, reject_file, output_format="parquet",
+            parquet={"codec": "zstd", "compression_level": 3, "row_group_size": 1},
+        )
+
+        conn = duckdb.connect()
+        rows = conn.execute(f"SELECT * FROM read_parquet('{output_file}')").fetchall()
+        codec = conn.execute(
+            f"SELECT DISTINCT compression FROM parquet_metadata('{output_file}')"
+        ).fetchall()
+        conn.close()
+        assert rows == [("1", "2"), ("7", "8")]
+        assert codec == [("ZSTD",)]
+        assert reject_stats["reject_count"] == 1
+        assert stats == {
+            "row_count": 2,
+            "column_count": 2,
+            "columns": ["col_a", "select"],
+        }
+
+    def test_parquet_per_thread_output(self, tmp_path):
+        """Per-thread Parquet parts are described from the first part file."""
+        input_file = tmp_path / "data.csv"
+        input_file.write_text("Col A,Col B\n" + "".join(f"{i},x\n" for i in range(500)))
+        output_dir = tmp_path / "parts"
+
+        with CsvnormSession(threads=2, preserve_insertion_order=False) as session:
+            _, _, stats = validate_and_normalize_csv(
+                input_file, output_dir, tmp_path / "reject_errors.csv",
+                session=session, per_thread_output=True, output_format="parquet",
+            )
+
+        assert sorted(output_dir.glob("*.parquet"))
+        count = duckdb.sql(f"SELECT COUNT(*) FROM '{output_dir}/*.parquet'").fetchone()
+        assert count == (500,)
+        assert stats["columns"] == ["col_a", "col_b"]
+
+    @pytest.mark.parametrize("output_format", ["arrow", "feather"])
+    def test_arrow_output_from_same_scan(self, tmp_path, output_format):
+        """Arrow IPC output is written from the scan's batches, with rejects."""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc  # noqa: F401
+
+        input_file = tmp_path / "malformed.csv"
+        input_file.write_text("Col A,select\n1,2\n3\n7,8\n")
+        output_file = tmp_path / f"out.{output_format}"
+        reject_file = tmp_path / "reject_errors.csv"
+
+        reject_stats, _, stats = validate_and_normalize_csv(
+            input_file, output_file, reject_file, output_format=output_format,
+        )
+
+        open_reader = pa.ipc.open_file if output_format == "feather" else pa.ipc.open_stream
+        with pa.OSFile(str(output_file)) as source:
+            table = open_reader(source).read_all()
+        assert table.to_pydict() == {"col_a": ["1", "7"], "select": ["2", "8"]}
+        assert reject_stats["reject_count"] == 1
+        assert reject_file.exists()
+        assert stats == {
+            "row_count": 2,
+            "column_count": 2,
+            "columns": ["col_a", "select"],
+        }
+
+    @patch("csvnorm.validation.DEFAULT_SNIFF_SAMPLE_ROWS", 5)
+    def test_quotes_after_sniff_sample_still_parse(self):
+        """Quoted fields beyond the sniff sample are parsed, not rejected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "late_quotes.csv"
+            input_file.write_text("x,y\n" + "1,2\n" * 20 + '"a,b",c\n"q",d\n')
+            output_file = Path(tmpdir) / "out.csv"
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+
+            reject_stats, _, stats = validate_and_normalize_csv(
+                input_file, output_file, reject_file
+            )
+
+            assert reject_stats["reject_count"] == 0
+            assert stats["row_count"] == 22
+            assert output_file.read_text().endswith('"a,b",c\nq,d\n')
+
+    def test_rejects_trigger_whole_file_sniff(self):
+        """A sampled dialect that rejects rows is re-checked on the whole file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "data.csv"
+            input_file.write_text("a,b\n1,2\n3,4\n")
+            output_file = Path(tmpdir) / "out.csv"
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+
+            wrong = {
+                "delimiter": "a",
+                "quote": "(empty)",
+                "escape": "(empty)",
+                "skip": 0,
+                "header": False,
+                "columns": ["column0"],
+            }
+            right = {**wrong, "delimiter": ",", "header": True, "columns": ["a", "b"]}
+            with patch(
+                "csvnorm.validation._sniff_dialect", side_effect=[wrong, right]
+            ) as mock_sniff:
+                reject_stats, _, _ = validate_and_normalize_csv(
+                    input_file, output_file, reject_file
+                )
+
+            assert mock_sniff.call_args_list[1].args[3] == -1
+            assert reject_stats["reject_count"] == 0
+            assert output_file.read_text() == "a,b\n1,2\n3,4\n"
+
+    @patch("csvnorm.validation._detect_header_anomaly")
+    @patch("csvnorm.validation.duckdb.connect")
+    def test_single_read_csv_scan(self, mock_connect, mock_detect):
+        """Only one read_csv query is issued when sniffing succeeds."""
+        mock_detect.return_value = None
+        def _execute(query):
+            result = Mock()
+            result.fetchone.return_value = (
+                (",", "(empty)", "(empty)", 0, True, [{"name": "a", "type": "VARCHAR"}])
+                if "sniff_csv" in query
+                else (0,)
+            )
+            result.fetchall.return_value = []
+            return result
+
+        mock_conn = Mock()
+        mock_conn.execute.side_effect = _execute
+        mock_connect.return_value = mock_conn
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "data.csv"
+            input_file.write_text("a,b\n1,2\n")
+            output_file = Path(tmpdir) / "out.csv"
+            reject_file = Path(tmpdir) / "reject_errors.csv"
+            validate_and_normalize_csv(
+                input_file, output_file, reject_file, normalize_names=False
+            )
+
+        queries = [c.args[0] for c in mock_conn.execute.call_args_list]
+        read_queries = [q for q in queries if "read_csv" in q]
+        assert len(read_queries) == 1
+        assert "COPY" in read_queries[0]
+        assert "store_rejects=true" in read_queries[0]
+        # Dialect from the bounded sniff is passed explicitly
+        assert "sample_size=-1" not in read_queries[0]
+        assert "delim=','" in read_queries[0]
+        assert "header=true" in read_queries[0]